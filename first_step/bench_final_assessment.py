@@ -0,0 +1,165 @@
+# bench_final_assessment.py
+# Micro-benchmarks for the fast paths in final_assessment.py
+#
+# Run from this folder:
+#     python3 bench_final_assessment.py
+import os
+import random
+import string
+import time
+import timeit
+
+from final_assessment import *
+
+
+def _best_of(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def _report(name, baseline, candidate):
+    print(f"{name:<45} {baseline * 1000:>10.2f} ms {candidate * 1000:>10.2f} ms {baseline / candidate:>7.1f}x")
+
+
+def _pickled_shards_report(data, workers, shard_size):
+    # the previous map_reduce_report: every shard's records were pickled to the workers
+    from concurrent.futures import ProcessPoolExecutor
+    shards = [data[start:start + shard_size] for start in range(0, len(data), shard_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return merge_reports(pool.map(sales_report_generator, shards))
+
+
+def bench_sales_report_parallel(n=2_000_000):
+    rng = random.Random(0)
+    data = [{"product": f"Product_{rng.randrange(1000)}", "price": rng.randrange(1, 500), "quantity": rng.randrange(10)}
+            for _ in range(n)]
+    expected = sales_report_generator(data)
+    serial = _best_of(lambda: sales_report_generator(data), repeat=1)
+
+    print(f"sales_report_parallel scaling ({n:,} rows, {os.cpu_count()} CPUs, serial {serial * 1000:.0f} ms)")
+    print(f"  {'workers':>7} {'shared':>10} {'speedup':>8} {'pickled':>10} {'speedup':>8}")
+    for workers in (2, 4, 8, 16, 32):
+        shard_size = -(-n // (workers * 4))
+        assert sales_report_parallel(data, workers=workers) == expected
+        shared = _best_of(lambda: sales_report_parallel(data, workers=workers), repeat=1)
+        pickled = _best_of(lambda: _pickled_shards_report(data, workers, shard_size), repeat=1)
+        print(f"  {workers:>7} {shared * 1000:>7.0f} ms {serial / shared:>7.1f}x {pickled * 1000:>7.0f} ms {serial / pickled:>7.1f}x")
+
+
+def _five_scan_check(password):
+    # the rule checks password_validator_with_retry used to do inline
+    return (len(password) >= 8
+            and any(char.isupper() for char in password)
+            and any(char.islower() for char in password)
+            and any(char.isdigit() for char in password)
+            and any(char in '!@#$%^&*' for char in password))
+
+
+def bench_password_policy(n=200_000):
+    rng = random.Random(0)
+    alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
+    passwords = ["".join(rng.choices(alphabet, k=rng.randint(4, 16))) for _ in range(n)]
+
+    assert [_five_scan_check(p) for p in passwords] == [m == 0 for m in PASSWORD_POLICY.validate_many(passwords)]
+
+    baseline = _best_of(lambda: [_five_scan_check(p) for p in passwords])
+    candidate = _best_of(lambda: PASSWORD_POLICY.validate_many(passwords))
+    _report(f"password policy ({n:,} passwords)", baseline, candidate)
+
+
+def _io_bound_batch(batch):
+    # stands in for a network/database round trip per batch
+    time.sleep(0.002)
+    return len(batch)
+
+
+def _cpu_bound_batch(batch):
+    return sum(hash(item) % 7 for item in batch for _ in range(20))
+
+
+def bench_dispatch_batches(n=20_000):
+    transactions = [f"TXN{i}" for i in range(n)]
+
+    print(f"dispatch_batches throughput ({n:,} transactions, items/s)")
+    print(f"  {'kind':<8} {'batch_size':>10} " + " ".join(f"{f'{w} workers':>12}" for w in (1, 2, 4, 8)))
+
+    for kind, process in (("thread", _io_bound_batch), ("process", _cpu_bound_batch)):
+        for batch_size in (50, 500, 5000):
+            batches = transaction_batcher(transactions, batch_size)
+            rates = []
+            for workers in (1, 2, 4, 8):
+                elapsed = _best_of(lambda: list(dispatch_batches(process, batches, workers=workers, kind=kind)), repeat=1)
+                rates.append(n / elapsed)
+            print(f"  {kind:<8} {batch_size:>10} " + " ".join(f"{rate:>12,.0f}" for rate in rates))
+
+
+def bench_top_k(n=1_000_000, k=10):
+    rng = random.Random(0)
+    network = {f"N{i}": [None] * rng.randint(0, 20) for i in range(n)}
+    scores = [(f"P{i}", rng.randint(0, 10**6)) for i in range(n)]
+
+    baseline = _best_of(lambda: sorted(network.items(), key=lambda item: len(item[1]), reverse=True)[:k], repeat=1)
+    candidate = _best_of(lambda: top_connected(network, k), repeat=1)
+    _report(f"top_connected dict (n={n:,}, k={k})", baseline, candidate)
+
+    if np is not None:
+        graph = CSRGraph.from_dict(network)
+        candidate = _best_of(lambda: top_connected(graph, k), repeat=1)
+        _report(f"top_connected CSRGraph (n={n:,}, k={k})", baseline, candidate)
+
+    baseline = _best_of(lambda: sorted(dict(scores).items(), key=lambda item: item[1], reverse=True)[:k], repeat=1)
+    candidate = _best_of(lambda: top_ranked(scores, k), repeat=1)
+    _report(f"top_ranked (n={n:,}, k={k})", baseline, candidate)
+
+
+def _step_by_step_pipeline(raw_data, transformations):
+    # the list-per-step implementation data_pipeline_processor used to have
+    if any(transformation not in ["double", "add_ten", "filter_even", "square"] for transformation in transformations):
+        raise ValueError
+
+    new_list = raw_data.copy()
+    for trans in transformations:
+        if trans == "double":
+            new_list = [i * 2 for i in new_list]
+        elif trans == "add_ten":
+            new_list = [i + 10 for i in new_list]
+        elif trans == "filter_even":
+            new_list = [i for i in new_list if i % 2 == 0]
+        else:
+            new_list = [i ** 2 for i in new_list]
+    return new_list
+
+
+def bench_data_pipeline(n=1_000_000):
+    data = list(range(n))
+    steps = ["double", "add_ten", "square", "filter_even"]
+
+    assert compile_pipeline(steps)(data) == _step_by_step_pipeline(data, steps)
+
+    baseline = _best_of(lambda: _step_by_step_pipeline(data, steps))
+    candidate = _best_of(lambda: data_pipeline_processor(data, steps))
+    _report(f"data pipeline fused list ({n:,} numbers)", baseline, candidate)
+
+    if np is not None:
+        array = np.array(data)
+        pipeline = compile_pipeline(steps)
+        candidate = _best_of(lambda: pipeline.apply_array(array))
+        _report(f"data pipeline NumPy array ({n:,} numbers)", baseline, candidate)
+
+
+BENCHMARKS = [
+    bench_sales_report_parallel,
+    bench_password_policy,
+    bench_dispatch_batches,
+    bench_top_k,
+    bench_data_pipeline,
+]
+
+
+def main():
+    print(f"{'benchmark':<45} {'baseline':>13} {'fast path':>13} {'speedup':>8}")
+    for bench in BENCHMARKS:
+        bench()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,21 @@
 # final_assessment.py
 # Complete the following functions according to their docstrings
+import asyncio
+import functools
+import heapq
+import inspect
+import multiprocessing
+import os
 import statistics
+from collections import Counter, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from itertools import chain, islice
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed by the columnar/array-backed paths
+    np = None
 
 
 def sales_report_generator(sales_data):
@@ -21,7 +36,7 @@ def sales_report_generator(sales_data):
     new_dict = {}
 
     for item in sales_data:
-        if item["price"]<0:
+        if item["price"]<0 or item["quantity"]<0:
             raise ValueError
         item_revenue = item["price"]*item["quantity"]
         if item["product"] not in new_dict:
@@ -34,13 +49,414 @@ def sales_report_generator(sales_data):
     return new_dict
 
 
+def _require_numpy():
+    if np is None:
+        raise ImportError("numpy is required for the columnar/array-backed functions")
+
+
+def sales_report_columnar(products, prices, quantities):
+    """
+    Columnar version of sales_report_generator.
+
+    Takes parallel arrays instead of a list of dicts, factorizes the product
+    keys once and computes revenue and units with grouped NumPy reductions.
+
+    Integer columns give exactly the sales_report_generator dict. Float
+    totals are added in a different order, so they can differ from it in
+    the last bits.
+
+    Args:
+        products: Sequence/array of product keys
+        prices: Sequence/array of unit prices (same length as products)
+        quantities: Sequence/array of quantities (same length as products)
+
+    Returns:
+        dict: Same shape as sales_report_generator, products in order of first appearance
+
+    Raises:
+        ValueError: If the columns differ in length or any price or quantity is negative
+    """
+    _require_numpy()
+
+    prices = np.asarray(prices)
+    quantities = np.asarray(quantities)
+    if isinstance(products, np.ndarray):
+        products = products.tolist()
+
+    if not (len(products) == len(prices) == len(quantities)):
+        raise ValueError("columns must have the same length")
+
+    if len(products) == 0:
+        return {}
+
+    if (prices < 0).any() or (quantities < 0).any():
+        raise ValueError
+
+    # integer totals that could overflow int64 are summed as Python ints instead
+    if prices.dtype.kind in "iu" and quantities.dtype.kind in "iu":
+        largest = max(int(prices.max()), 1) * max(int(quantities.max()), 1) * len(products)
+        if largest > np.iinfo(np.int64).max:
+            prices = prices.astype(object)
+            quantities = quantities.astype(object)
+        elif prices.dtype.kind != quantities.dtype.kind:
+            # uint64 * int64 would be promoted to float64
+            prices = prices.astype(np.int64)
+            quantities = quantities.astype(np.int64)
+
+    # factorize on the original key objects, so "1" and 1 stay apart and tuples
+    # work as keys; groups are numbered by first appearance like the row path
+    groups = {}
+    codes = np.fromiter((groups.setdefault(key, len(groups)) for key in products), dtype=np.intp, count=len(products))
+
+    # grouped sums: sort rows by group, then reduce each contiguous run
+    order = np.argsort(codes, kind="stable")
+    starts = np.searchsorted(codes[order], np.arange(len(groups)))
+    revenue = np.add.reduceat((prices * quantities)[order], starts).tolist()
+    units = np.add.reduceat(quantities[order], starts).tolist()
+
+    return {key: {"total_revenue": revenue[g], "units_sold": units[g]}
+            for g, key in enumerate(groups)}
+
+
+def merge_reports(reports):
+    """
+    Merge partial group-by-sum reports into one.
+
+    Every report is a dict of key -> dict of numeric totals (the shape returned
+    by the report generators). Totals for the same key are added together, and
+    keys keep the order in which they first appear across the reports, so
+    merging the partials of consecutive shards gives the serial result.
+
+    Args:
+        reports: Iterable of partial reports, in shard order
+
+    Returns:
+        dict: The merged report
+    """
+    merged = {}
+
+    for report in reports:
+        for key, totals in report.items():
+            if key not in merged:
+                merged[key] = dict(totals)
+            else:
+                for field, amount in totals.items():
+                    merged[key][field] += amount
+
+    return merged
+
+
+# the records and partial_report of the running map_reduce_report, set in each forked worker
+_SHARED_SHARDS = None
+
+
+def _share_shards(data, partial_report):
+    global _SHARED_SHARDS
+    _SHARED_SHARDS = (data, partial_report)
+
+
+def _report_shard(bounds):
+    data, partial_report = _SHARED_SHARDS
+    start, stop = bounds
+    return partial_report(data[start:stop])
+
+
+def map_reduce_report(data, partial_report, workers=None, shard_size=None):
+    """
+    Run a group-by-sum report over shards of data in a process pool.
+
+    Where the platform can fork, the workers inherit data from the parent
+    and only receive (start, stop) bounds, so no record is pickled on the
+    way in and only the small partial reports come back. Elsewhere the
+    shards themselves are sent to the workers, which costs about as much as
+    the fold and gives little speedup.
+
+    Args:
+        data: List of records
+        partial_report: Picklable (module level) function that builds a report for one shard
+        workers: Number of worker processes (defaults to the CPU count)
+        shard_size: Records per shard (defaults to an even split, a few shards per worker)
+
+    Returns:
+        dict: Same result as partial_report(data)
+
+    Raises:
+        ValueError: If workers or shard_size < 1
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1 or (shard_size is not None and shard_size < 1):
+        raise ValueError
+
+    if shard_size is None:
+        # a few shards per worker keeps the pool busy if some shards are slower
+        shard_size = max(1, -(-len(data) // (workers * 4)))
+
+    bounds = [(start, min(start + shard_size, len(data))) for start in range(0, len(data), shard_size)]
+
+    if workers == 1 or len(bounds) <= 1:
+        return merge_reports(partial_report(data[start:stop]) for start, stop in bounds)
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds)), mp_context=multiprocessing.get_context("fork"),
+                                 initializer=_share_shards, initargs=(data, partial_report)) as pool:
+            return merge_reports(pool.map(_report_shard, bounds))
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as pool:
+        return merge_reports(pool.map(partial_report, (data[start:stop] for start, stop in bounds)))
+
+
+def sales_report_parallel(sales_data, workers=None, shard_size=None):
+    """
+    Parallel version of sales_report_generator.
+
+    Shards sales_data, builds partial reports in worker processes and merges
+    them. For integer prices and quantities the result is identical to the
+    serial path.
+
+    Args:
+        sales_data: List of dicts with keys: product, price, quantity
+        workers: Number of worker processes (defaults to the CPU count)
+        shard_size: Records per shard
+
+    Returns:
+        dict: Same as sales_report_generator
+
+    Raises:
+        KeyError: If required keys are missing
+        ValueError: If price or quantity is negative
+    """
+    return map_reduce_report(sales_data, sales_report_generator, workers, shard_size)
+
+
+class SalesReport:
+    """
+    Incremental, mergeable sales report.
+
+    Keeps per-product revenue and units up to date in O(1) per event instead of
+    re-running sales_report_generator over the whole history.
+
+    Methods:
+        - add(record): Add one sale dict (keys: product, price, quantity)
+        - add_many(batch): Add an iterable of sale dicts
+        - merge(other): Fold another SalesReport into this one
+        - retract(record): Undo a previously added sale
+        - report(): Current totals in the sales_report_generator format
+    """
+
+    def __init__(self, records=()):
+        self._totals = {}
+        # product -> Counter of the (price, quantity) sales added, so retract can check them
+        self._sales = {}
+        self.add_many(records)
+
+    @staticmethod
+    def _unpack(record):
+        product, price, quantity = record["product"], record["price"], record["quantity"]
+        if price < 0 or quantity < 0:
+            raise ValueError
+        return product, price, quantity
+
+    def add(self, record):
+        product, price, quantity = self._unpack(record)
+        revenue = price * quantity
+
+        if product not in self._totals:
+            self._totals[product] = {"total_revenue": revenue, "units_sold": quantity}
+            self._sales[product] = Counter()
+        else:
+            totals = self._totals[product]
+            totals["total_revenue"] += revenue
+            totals["units_sold"] += quantity
+        self._sales[product][price, quantity] += 1
+
+        return self
+
+    def add_many(self, batch):
+        for record in batch:
+            self.add(record)
+        return self
+
+    def merge(self, other):
+        for product, totals in other._totals.items():
+            if product not in self._totals:
+                self._totals[product] = dict(totals)
+                self._sales[product] = Counter(other._sales[product])
+            else:
+                self._totals[product]["total_revenue"] += totals["total_revenue"]
+                self._totals[product]["units_sold"] += totals["units_sold"]
+                self._sales[product].update(other._sales[product])
+        return self
+
+    def retract(self, record):
+        """
+        Remove a sale that was added earlier.
+
+        Raises:
+            KeyError: If the product has no sales in the report
+            ValueError: If price or quantity is negative, or no sale of the product
+                        with this price and quantity was added
+        """
+        product, price, quantity = self._unpack(record)
+
+        if product not in self._totals:
+            raise KeyError(product)
+
+        sales = self._sales[product]
+        if not sales[price, quantity]:
+            raise ValueError(f"no {product!r} sale with price {price!r} and quantity {quantity!r} was added")
+
+        sales[price, quantity] -= 1
+        if not sales[price, quantity]:
+            del sales[price, quantity]
+
+        if not sales:
+            # drop the product once all of its sales are gone, like a fresh report
+            del self._totals[product]
+            del self._sales[product]
+        else:
+            totals = self._totals[product]
+            totals["total_revenue"] -= price * quantity
+            totals["units_sold"] -= quantity
+
+        return self
+
+    def report(self):
+        return {product: dict(totals) for product, totals in self._totals.items()}
+
+    def __len__(self):
+        return len(self._totals)
+
+    def __contains__(self, product):
+        return product in self._totals
+
+    def __getitem__(self, product):
+        return dict(self._totals[product])
+
+
+
+class ReadingStats:
+    """
+    One-pass accumulator for sensor readings checked against a threshold.
+
+    Tracks count, sum (exact for ints and other exact types such as Decimal,
+    compensated for floats), min, max and
+    the number of readings that breach the threshold, so any iterable (lists,
+    generators, sensor streams) is consumed exactly once.
+
+    Args:
+        threshold: Threshold the readings are checked against
+        breach: "below" if readings < threshold breach it, "above" if readings > threshold do
+
+    Raises:
+        ValueError: If breach is not "below" or "above"
+    """
+
+    def __init__(self, threshold, breach="below"):
+        if breach not in ("below", "above"):
+            raise ValueError
+
+        self.threshold = threshold
+        self.breach = breach
+        self.count = 0
+        self.breaches = 0
+        self.minimum = None
+        self.maximum = None
+        self._int_total = 0
+        self._float_total = 0.0
+        self._compensation = 0.0
+        self._other_total = None    # exact sum of Decimal, Fraction, ... readings
+
+    def add(self, reading):
+        self.count += 1
+
+        if self.minimum is None or reading < self.minimum:
+            self.minimum = reading
+        if self.maximum is None or reading > self.maximum:
+            self.maximum = reading
+
+        if reading < self.threshold if self.breach == "below" else reading > self.threshold:
+            self.breaches += 1
+
+        if isinstance(reading, int):
+            self._int_total += reading
+        elif not isinstance(reading, float):
+            self._other_total = reading if self._other_total is None else self._other_total + reading
+        else:
+            # Neumaier compensated summation
+            total = self._float_total + reading
+            if abs(self._float_total) >= abs(reading):
+                self._compensation += (self._float_total - total) + reading
+            else:
+                self._compensation += (reading - total) + self._float_total
+            self._float_total = total
+
+        return self
+
+    def update(self, readings):
+        for reading in readings:
+            self.add(reading)
+        return self
+
+    @property
+    def total(self):
+        total = self._int_total
+        if self._other_total is not None:
+            total = self._other_total + total
+        if self._float_total or self._compensation:
+            total = total + (self._float_total + self._compensation)
+        return total
+
+    @property
+    def average(self):
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    @property
+    def all_within(self):
+        return self.breaches == 0
+
+
+def temperature_stats(temperatures, threshold):
+    """
+    Summarize temperature readings against a threshold in a single pass.
+
+    Args:
+        temperatures: Any iterable of temperature readings (list, generator, stream)
+        threshold: Minimum acceptable temperature
+
+    Returns:
+        ReadingStats: Readings below threshold are counted as breaches
+    """
+    return ReadingStats(threshold, breach="below").update(temperatures)
+
+
+def format_temperature_report(stats):
+    """
+    Format a temperature ReadingStats the way temperature_analyzer prints it.
+
+    Returns:
+        str: Report lines joined by newlines
+    """
+    if not stats.count:
+        return "No temperature data"
+
+    if stats.all_within:
+        headline = "All temperatures above threshold"
+    else:
+        headline = f"Warning: {stats.breaches} readings below {stats.threshold}"
+
+    return f"{headline}\nAverage: {stats.average:.2f}"
+
 
 def temperature_analyzer(temperatures, threshold):
     """
     Analyze temperature readings against a threshold.
 
     Args:
-        temperatures: List of temperature readings
+        temperatures: List (or any iterable) of temperature readings
         threshold: Minimum acceptable temperature
 
     Prints:
@@ -48,177 +464,1032 @@ def temperature_analyzer(temperatures, threshold):
         - "All temperatures above threshold" if all >= threshold
         - "Warning: X readings below Y" otherwise
         - "Average: X" (always, formatted to 2 decimals)
+
+    Returns:
+        ReadingStats: The single-pass summary behind the printed report
     """
+    stats = temperature_stats(temperatures, threshold)
+    print(format_temperature_report(stats))
+    return stats
+
+
+WindowStats = namedtuple("WindowStats", ["start", "end", "count", "breaches", "average"])
+
+
+class WindowMonitor:
+    """
+    Real-time threshold monitor over sliding or tumbling windows of readings.
+
+    Uses the same breach semantics as ReadingStats. Each reading is stored in a
+    fixed-size ring buffer and the window's running sum and breach count are
+    updated in O(1) amortized time.
+
+    Args:
+        size: Number of readings per window
+        threshold: Threshold the readings are checked against
+        breach: "below" or "above" (see ReadingStats)
+        tumbling: False for a sliding window (one result per reading once the
+                  window is full), True for back-to-back non-overlapping windows
+
+    Raises:
+        ValueError: If size < 1 or breach is not "below" or "above"
+    """
+
+    def __init__(self, size, threshold, breach="below", tumbling=False):
+        if size < 1 or breach not in ("below", "above"):
+            raise ValueError
+
+        self.size = size
+        self.threshold = threshold
+        self.breach = breach
+        self.tumbling = tumbling
+        self._ring = [0] * size
+        self._head = 0
+        self._filled = 0
+        self._total = 0
+        self._breaches = 0
+        self._seen = 0
+
+    def _breached(self, reading):
+        return reading < self.threshold if self.breach == "below" else reading > self.threshold
+
+    def _emit(self):
+        return WindowStats(self._seen - self._filled, self._seen, self._filled,
+                           self._breaches, self._total / self._filled)
+
+    def _reset(self):
+        self._head = self._filled = self._total = self._breaches = 0
+
+    def push(self, reading):
+        """
+        Add one reading.
+
+        Returns:
+            WindowStats | None: The window that this reading completes, if any
+        """
+        if self._filled == self.size:
+            evicted = self._ring[self._head]
+            self._total -= evicted
+            self._breaches -= self._breached(evicted)
+        else:
+            self._filled += 1
+
+        self._ring[self._head] = reading
+        self._total += reading
+        self._breaches += self._breached(reading)
+        self._head = (self._head + 1) % self.size
+        self._seen += 1
+
+        if self._head == 0:
+            # once per lap, recompute the sum so float drift from the evictions can't build up
+            self._total = sum(self._ring)
+
+        if self._filled < self.size:
+            return None
+
+        window = self._emit()
+        if self.tumbling:
+            self._reset()
+        return window
+
+    def flush(self):
+        """
+        Close the stream.
+
+        Returns:
+            WindowStats | None: The trailing partial window for tumbling monitors
+        """
+        if not self.tumbling or not self._filled:
+            return None
+
+        window = self._emit()
+        self._reset()
+        return window
+
+    def monitor(self, readings):
+        """Yield WindowStats for every completed window of an iterable of readings."""
+        for reading in readings:
+            window = self.push(reading)
+            if window is not None:
+                yield window
+
+        window = self.flush()
+        if window is not None:
+            yield window
+
+    async def amonitor(self, readings):
+        """Async-iterator version of monitor for an async iterable of readings."""
+        async for reading in readings:
+            window = self.push(reading)
+            if window is not None:
+                yield window
+
+        window = self.flush()
+        if window is not None:
+            yield window
+
+
+def sliding_window_monitor(readings, size, threshold, breach="below"):
+    """Yield per-window breach counts and averages over a sliding window."""
+    return WindowMonitor(size, threshold, breach).monitor(readings)
+
+
+def tumbling_window_monitor(readings, size, threshold, breach="below"):
+    """Yield per-window breach counts and averages over non-overlapping windows."""
+    return WindowMonitor(size, threshold, breach, tumbling=True).monitor(readings)
+
     
-    if not temperatures:
-        print("No temperature data")
+
+
+
+
+class PasswordPolicy:
+    """
+    Compiled password policy that checks every rule in one pass.
+
+    Every character is classified through a 256-entry str.translate table, so
+    a password is scanned once (in C) instead of once per rule. Characters
+    outside Latin-1 fall back to the str.isupper/islower/isdigit checks.
+
+    Args:
+        min_length: Minimum number of characters
+        specials: Characters that count as special
+
+    Failure bits (combine with |, 0 means valid):
+        - TOO_SHORT, NO_UPPER, NO_LOWER, NO_DIGIT, NO_SPECIAL
+    """
+
+    TOO_SHORT = 1
+    NO_UPPER = 2
+    NO_LOWER = 4
+    NO_DIGIT = 8
+    NO_SPECIAL = 16
+
+    RULES = {TOO_SHORT: "too_short", NO_UPPER: "no_upper", NO_LOWER: "no_lower",
+             NO_DIGIT: "no_digit", NO_SPECIAL: "no_special"}
+
+    def __init__(self, min_length=8, specials="!@#$%^&*"):
+        self.min_length = min_length
+        self.specials = specials
+
+        # one class letter per Latin-1 character, None deletes characters no rule cares about
+        self._table = {code: self._classify(chr(code)) for code in range(256)}
+
+        self._masks = {"U": self.NO_UPPER, "L": self.NO_LOWER, "D": self.NO_DIGIT, "S": self.NO_SPECIAL}
+
+    def _classify(self, char):
+        if char in self.specials:
+            return "S"
+        if char.isupper():
+            return "U"
+        if char.islower():
+            return "L"
+        if char.isdigit():
+            return "D"
+        return None
+
+    def check(self, password):
+        """
+        Return the failure bitmask for one password (0 if it is valid).
+        """
+        missing = self.NO_UPPER | self.NO_LOWER | self.NO_DIGIT | self.NO_SPECIAL
+        if len(password) < self.min_length:
+            missing |= self.TOO_SHORT
+
+        for char in set(password.translate(self._table)):
+            if char not in self._masks:
+                # only characters outside the table survive translate unchanged
+                char = self._classify(char)
+                if char is None:
+                    continue
+            missing &= ~self._masks[char]
+
+        return missing
+
+    def is_valid(self, password):
+        return self.check(password) == 0
+
+    def validate_many(self, passwords):
+        """
+        Check many passwords without any prompting.
+
+        Args:
+            passwords: Iterable of passwords
+
+        Returns:
+            list: One failure bitmask per password, in input order
+        """
+        return [self.check(password) for password in passwords]
+
+    @classmethod
+    def describe(cls, mask):
+        """Names of the rules set in a failure bitmask."""
+        return [name for bit, name in cls.RULES.items() if mask & bit]
+
+
+PASSWORD_POLICY = PasswordPolicy()
+
+
+def password_validator_with_retry(max_attempts):
+    """
+    Validate password with limited retry attempts.
+
+    Args:
+        max_attempts: Maximum number of attempts allowed
+
+    Behavior:
+        - Prompt "Enter password:" for each attempt
+        - Valid password requires: 8+ chars, upper, lower, digit, special (!@#$%^&*)
+        - Print "Invalid password. Try again." for invalid
+        - Print "Password accepted!" when valid
+        - Print "Maximum attempts reached. Account locked." if exhausted
+    """
+    
+    for _ in range(max_attempts):
+        password = input("Enter password:")
+
+        if PASSWORD_POLICY.check(password):
+            print("Invalid password. Try again.")
+            continue
+
+        print("Password accepted!")
+        break
+
+    else:
+        print("Maximum attempts reached. Account locked.")
+
+
+async def _emit(write_output, message):
+    result = write_output(message)
+    if inspect.isawaitable(result):
+        await result
+
+
+async def password_validator_async(max_attempts, read_input, write_output, timeout=None):
+    """
+    Async version of password_validator_with_retry for event-loop hosted sessions.
+
+    Args:
+        max_attempts: Maximum number of attempts allowed
+        read_input: Async callable taking the prompt and returning the entered password
+        write_output: Callable (plain or async) taking each message to show
+        timeout: Seconds allowed per attempt, None to wait forever
+
+    Behavior:
+        - Same prompts and messages as password_validator_with_retry
+        - An attempt that times out prints "Attempt timed out. Try again." and
+          counts towards max_attempts
+
+    Returns:
+        bool: True if a valid password was entered
+    """
+    for _ in range(max_attempts):
+        try:
+            password = await asyncio.wait_for(read_input("Enter password:"), timeout)
+        except asyncio.TimeoutError:
+            await _emit(write_output, "Attempt timed out. Try again.")
+            continue
+
+        if PASSWORD_POLICY.check(password):
+            await _emit(write_output, "Invalid password. Try again.")
+            continue
+
+        await _emit(write_output, "Password accepted!")
+        return True
+
+    await _emit(write_output, "Maximum attempts reached. Account locked.")
+    return False
+
+
+
+
+
+def student_grade_processor(students):
+    """
+    Categorize students by passing/failing status with averages.
+
+    Args:
+        students: List of dicts with keys: name, grades (list)
+
+    Returns:
+        dict: Keys "passing" and "failing", values are lists of dicts with name and average
+
+    Raises:
+        KeyError: If required keys missing
+        ValueError: If grades list is empty
+    """
+
+    classification = {'passing':[], 'failing':[]}
+
+    for student in students:
+        if not student["grades"]:
+            raise ValueError
+        student_average = statistics.mean(student["grades"])
+        if student_average>=60:
+            classification["passing"].append({"name":student["name"], 'average':student_average})
+        else:
+            classification["failing"].append({"name":student["name"], 'average':student_average})
         
     
-    elif all(temps>=threshold for temps in temperatures):
-        print("All temperatures above threshold")
-        average = statistics.mean(temperatures)
-        print(f"Average: {average:.2f}")
+    return classification
+
+
+def segment_means(groups):
+    """
+    Average every list of numbers in groups with one segmented reduction.
+
+    The lists are packed CSR-style into one flat float64 array plus offsets,
+    so the per-group sums come from a single np.add.reduceat call. That sum
+    is only exact for whole numbers below 2**53, so any other group is
+    averaged with statistics.mean and matches the row-by-row result exactly.
+
+    Args:
+        groups: List of non-empty lists of numbers
+
+    Returns:
+        numpy.ndarray: One average per group
+
+    Raises:
+        ValueError: If any group is empty
+    """
+    _require_numpy()
+
+    counts = np.fromiter((len(group) for group in groups), dtype=np.int64, count=len(groups))
+    if not len(counts):
+        return np.empty(0)
+    if not counts.all():
+        raise ValueError
+
+    offsets = np.zeros(len(counts), dtype=np.int64)
+    np.cumsum(counts[:-1], out=offsets[1:])
+
+    flat = np.fromiter(chain.from_iterable(groups), dtype=np.float64, count=int(counts.sum()))
+    means = np.add.reduceat(flat, offsets) / counts
+
+    # float64 rounds fractional sums (52.1 + 54.4 + ...) before dividing,
+    # which can move an average across a cut-off; redo those groups exactly
+    with np.errstate(invalid="ignore"):
+        inexact = np.add.reduceat(np.mod(flat, 1) != 0, offsets)
+        inexact |= ~(np.add.reduceat(np.abs(flat), offsets) <= 2**53)
+    for index in np.flatnonzero(inexact).tolist():
+        means[index] = statistics.mean(groups[index])
+    return means
+
+
+def student_grade_processor_batched(students):
+    """
+    Array-backed version of student_grade_processor.
+
+    Computes every student's average with one segmented reduction and splits
+    them at the 60 pass mark in bulk.
+
+    Args:
+        students: List of dicts with keys: name, grades (list)
+
+    Returns:
+        dict: Same as student_grade_processor
+
+    Raises:
+        KeyError: If required keys missing
+        ValueError: If grades list is empty
+    """
+    names = [student["name"] for student in students]
+    averages = segment_means([student["grades"] for student in students])
+    passing = (averages >= 60).tolist()
+    averages = averages.tolist()
+
+    classification = {'passing':[], 'failing':[]}
+    for name, average, passed in zip(names, averages, passing):
+        classification["passing" if passed else "failing"].append({"name":name, 'average':average})
+
+    return classification
+
+
+
+
+def transaction_batcher(transactions, batch_size):
+    """
+    Split transactions into batches of specified size.
+
+    Args:
+        transactions: List of transactions
+        batch_size: Number of transactions per batch
+
+    Returns:
+        list: List of batches (each batch is a list)
+
+    Raises:
+        ValueError: If batch_size < 1
+    """
+    
+    if not transactions:
+        return []
     
-    else:
-        belowers = len([temp for temp in temperatures if temp<threshold])
-        print(f"Warning: {belowers} readings below {threshold}")
-        average = statistics.mean(temperatures)
-        print(f"Average: {average:.2f}")
+    if batch_size<1:
+        raise ValueError
+    
+    larger = []
+    smaller = []
+    for item in transactions:
+        if len(smaller)==batch_size:
+            larger.append(smaller)
+            smaller=[]
+        smaller.append(item)
+    
+    if smaller:
+        larger.append(smaller)
+    
+    return larger
+
+
+def _batches_from_slices(data, batch_size):
+    for start in range(0, len(data), batch_size):
+        yield data[start:start + batch_size]
+
+
+def _batches_from_iterator(iterator, batch_size):
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_batches(iterable, batch_size):
+    """
+    Lazily split items into batches of specified size.
+
+    Batches are yielded as soon as they fill, so unbounded iterators work and
+    only one batch is held at a time. Buffer-backed inputs (memoryview, bytes,
+    bytearray, array.array, NumPy arrays) yield zero-copy views; lists and
+    tuples yield slices; any other iterable yields lists.
+
+    Args:
+        iterable: Items to batch
+        batch_size: Number of items per batch
+
+    Returns:
+        iterator: Batches in input order, the last one may be shorter
+
+    Raises:
+        ValueError: If batch_size < 1
+    """
+    if batch_size < 1:
+        raise ValueError
+
+    if np is not None and isinstance(iterable, np.ndarray):
+        return _batches_from_slices(iterable, batch_size)
+
+    if isinstance(iterable, (list, tuple, range)):
+        return _batches_from_slices(iterable, batch_size)
+
+    try:
+        view = memoryview(iterable)
+    except TypeError:
+        return _batches_from_iterator(iter(iterable), batch_size)
+
+    return _batches_from_slices(view, batch_size)
+
+
+def dispatch_batches(process, batches, workers=None, kind="thread", ordered=True,
+                     max_in_flight=None, retries=0):
+    """
+    Run a per-batch callable over batches on a thread or process pool.
+
+    Batches are pulled lazily (e.g. from transaction_batcher or iter_batches)
+    and at most max_in_flight of them are submitted or waiting to be yielded
+    at any time, which caps memory for long inputs.
+
+    Args:
+        process: Callable taking one batch (must be picklable for kind="process")
+        batches: Iterable of batches
+        workers: Pool size (defaults to the CPU count)
+        kind: "thread" or "process"
+        ordered: True yields results in batch order, False yields (index, result)
+                 pairs as batches complete
+        max_in_flight: Cap on batches held at once (defaults to 2 * workers)
+        retries: Times a failed batch is resubmitted before its error is raised
+
+    Returns:
+        iterator: Results as described for ordered
+
+    Raises:
+        ValueError: If kind is unknown, workers or max_in_flight < 1, or retries < 0
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = 2 * workers
+
+    if kind not in ("thread", "process") or workers < 1 or max_in_flight < 1 or retries < 0:
+        raise ValueError
+
+    pool_class = ThreadPoolExecutor if kind == "thread" else ProcessPoolExecutor
+    return _dispatch(pool_class, workers, process, enumerate(batches), ordered, max_in_flight, retries)
+
+
+def _dispatch(pool_class, workers, process, batches, ordered, max_in_flight, retries):
+    pending = {}
+    finished = {}
+    next_index = 0
+
+    def submit_more():
+        while len(pending) + len(finished) < max_in_flight:
+            try:
+                index, batch = next(batches)
+            except StopIteration:
+                return
+            pending[pool.submit(process, batch)] = (index, batch, 0)
+
+    with pool_class(workers) as pool:
+        try:
+            submit_more()
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    index, batch, attempts = pending.pop(future)
+                    error = future.exception()
+
+                    if error is not None:
+                        if attempts >= retries:
+                            raise error
+                        pending[pool.submit(process, batch)] = (index, batch, attempts + 1)
+                    elif ordered:
+                        finished[index] = future.result()
+                    else:
+                        yield index, future.result()
+
+                while next_index in finished:
+                    yield finished.pop(next_index)
+                    next_index += 1
+
+                submit_more()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def network_graph_analyzer(network: dict[str, list[str]]):
+    """
+    Analyze network connectivity statistics.
+
+    Args:
+        network: Dict where keys are nodes, values are lists of connected nodes
+
+    Returns:
+        dict: Keys are total_connections, most_connected, isolated_nodes
+    """
+
+    if not network:
+        return {"total_connections": 0, "most_connected": None, "isolated_nodes": []}
+    
+    total_cons = 0
+    isolated = []
+    node_to_con ={}
+
+    for node, connections in network.items():
+        total_cons+= len(connections)
+        if not connections:
+            isolated.append(node)
+        
+        node_to_con[node]=len(connections)
+    
+    most_connected = max(node_to_con, key=node_to_con.get)
+    return {"total_connections": total_cons, "most_connected": most_connected, "isolated_nodes":isolated}
+
+
+class CSRGraph:
+    """
+    Compact adjacency structure for dict-of-lists networks.
+
+    Node names are interned to integer IDs: the dict's keys come first, in
+    order, followed by nodes that only appear as targets. Node i's
+    connections are targets[offsets[i]:offsets[i + 1]].
+
+    Attributes:
+        nodes: List of node names, indexed by ID
+        index: Dict of node name -> ID
+        sources: Number of nodes that were keys of the original dict
+        offsets: int32 array of length len(nodes) + 1 (int64 for > 2**31 edges)
+        targets: int32 array of target IDs
+    """
+
+    def __init__(self, nodes, sources, offsets, targets):
+        self.nodes = nodes
+        self.index = {node: node_id for node_id, node in enumerate(nodes)}
+        self.sources = sources
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def from_dict(cls, network):
+        """
+        Build a CSRGraph from a dict where keys are nodes and values are lists of connected nodes.
+        """
+        _require_numpy()
+
+        index = {node: node_id for node_id, node in enumerate(network)}
+        sources = len(index)
+
+        degrees = np.fromiter((len(connections) for connections in network.values()),
+                              dtype=np.int64, count=sources)
+        edge_count = int(degrees.sum())
+        id_type = np.int32 if max(edge_count, sources) < 2**31 else np.int64
+
+        targets = np.fromiter((index.setdefault(target, len(index))
+                               for connections in network.values() for target in connections),
+                              dtype=id_type, count=edge_count)
+
+        # nodes that only appear as targets get empty rows after the sources
+        offsets = np.full(len(index) + 1, edge_count, dtype=id_type)
+        offsets[0] = 0
+        np.cumsum(degrees, out=offsets[1:sources + 1], dtype=id_type)
+
+        return cls(list(index), sources, offsets, targets)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @property
+    def edge_count(self):
+        return len(self.targets)
+
+    def out_degrees(self):
+        return np.diff(self.offsets)
+
+    def neighbors(self, node):
+        node_id = self.index[node]
+        return [self.nodes[target] for target in self.targets[self.offsets[node_id]:self.offsets[node_id + 1]].tolist()]
+
+
+def network_graph_analyzer_csr(network):
+    """
+    Array-backed version of network_graph_analyzer.
+
+    Computes everything from the CSR degree array in O(V + E).
+
+    Args:
+        network: CSRGraph, or a dict where keys are nodes and values are lists of connected nodes
+
+    Returns:
+        dict: Keys are total_connections, most_connected, isolated_nodes
+    """
+    graph = network if isinstance(network, CSRGraph) else CSRGraph.from_dict(network)
+
+    if not graph.sources:
+        return {"total_connections": 0, "most_connected": None, "isolated_nodes": []}
+
+    degrees = graph.out_degrees()[:graph.sources]
+
+    return {"total_connections": graph.edge_count,
+            "most_connected": graph.nodes[int(degrees.argmax())],
+            "isolated_nodes": [graph.nodes[node_id] for node_id in np.flatnonzero(degrees == 0).tolist()]}
+
+
+def _as_graph(network):
+    return network if isinstance(network, CSRGraph) else CSRGraph.from_dict(network)
+
+
+def _edge_sources(graph):
+    return np.repeat(np.arange(len(graph), dtype=graph.targets.dtype), graph.out_degrees())
+
+
+def _expand_frontier(graph, frontier):
+    # targets of every node in frontier, gathered without a Python loop
+    starts = graph.offsets[frontier].astype(np.int64)
+    counts = graph.offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if not total:
+        return graph.targets[:0]
+    first = np.cumsum(counts) - counts
+    return graph.targets[np.repeat(starts - first, counts) + np.arange(total)]
+
+
+def component_labels(network):
+    """
+    Weakly connected component label of every node.
+
+    Uses label hooking with pointer jumping over the edge arrays, so it is
+    iterative and vectorized (no recursion, no per-node Python loop).
+
+    Args:
+        network: CSRGraph, or a dict where keys are nodes and values are lists of connected nodes
+
+    Returns:
+        numpy.ndarray: labels[i] is the smallest node ID in node i's component
+    """
+    graph = _as_graph(network)
+    labels = np.arange(len(graph), dtype=np.int64)
+    sources, targets = _edge_sources(graph), graph.targets
+
+    while True:
+        source_labels, target_labels = labels[sources], labels[targets]
+        lowest = np.minimum(source_labels, target_labels)
+
+        hooked = labels.copy()
+        np.minimum.at(hooked, source_labels, lowest)
+        np.minimum.at(hooked, target_labels, lowest)
+
+        # pointer jumping until every node points straight at its root
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def connected_components(network):
+    """
+    Weakly connected components of a network.
+
+    Args:
+        network: CSRGraph, or a dict where keys are nodes and values are lists of connected nodes
+
+    Returns:
+        list: One list of node names per component, ordered by their first node
+    """
+    graph = _as_graph(network)
+    if not len(graph):
+        return []
+
+    labels = component_labels(graph)
+    order = np.argsort(labels, kind="stable")
+    boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+
+    return [[graph.nodes[node_id] for node_id in part.tolist()] for part in np.split(order, boundaries)]
+
+
+def reachable(network, source):
+    """
+    Nodes reachable from source by following connections, found by iterative BFS.
+
+    Each BFS level is expanded with array operations, so deep graphs never
+    touch the recursion limit.
+
+    Args:
+        network: CSRGraph, or a dict where keys are nodes and values are lists of connected nodes
+        source: Start node
+
+    Returns:
+        list: Reachable node names in BFS order (source first, each level by node ID)
+
+    Raises:
+        KeyError: If source is not in the network
+    """
+    graph = _as_graph(network)
+    start = graph.index[source]
+
+    visited = np.zeros(len(graph), dtype=bool)
+    visited[start] = True
+    frontier = np.array([start], dtype=np.int64)
+    levels = [frontier]
+
+    while len(frontier):
+        found = np.unique(_expand_frontier(graph, frontier))
+        frontier = found[~visited[found]].astype(np.int64)
+        visited[frontier] = True
+        levels.append(frontier)
+
+    return [graph.nodes[node_id] for node_id in np.concatenate(levels).tolist()]
+
+
+def pagerank(network, damping=0.85, tolerance=1e-10, max_iterations=100):
+    """
+    PageRank influence score of every node.
+
+    Power iteration where each sparse matrix-vector product is one
+    np.bincount over the edge arrays. Nodes without connections spread their
+    rank evenly over all nodes.
+
+    Args:
+        network: CSRGraph, or a dict where keys are nodes and values are lists of connected nodes
+        damping: Probability of following a connection instead of jumping anywhere
+        tolerance: Stop once the L1 change between iterations is below this
+        max_iterations: Upper bound on power iterations
+
+    Returns:
+        dict: Node name -> score (scores sum to 1)
+
+    Raises:
+        ValueError: If damping is outside [0, 1] or max_iterations < 1
+    """
+    if not 0 <= damping <= 1 or max_iterations < 1:
+        raise ValueError
 
-    
+    graph = _as_graph(network)
+    size = len(graph)
+    if not size:
+        return {}
 
+    degrees = graph.out_degrees()
+    sources = _edge_sources(graph)
+    dangling = degrees == 0
+    inverse_degree = np.divide(1.0, degrees, out=np.zeros(size), where=~dangling)
 
+    ranks = np.full(size, 1.0 / size)
+    for _ in range(max_iterations):
+        shares = (ranks * inverse_degree)[sources]
+        spread = (1 - damping) / size + damping * ranks[dangling].sum() / size
+        updated = damping * np.bincount(graph.targets, weights=shares, minlength=size) + spread
 
+        change = np.abs(updated - ranks).sum()
+        ranks = updated
+        if change < tolerance:
+            break
 
-def password_validator_with_retry(max_attempts):
-    """
-    Validate password with limited retry attempts.
+    return dict(zip(graph.nodes, ranks.tolist()))
 
-    Args:
-        max_attempts: Maximum number of attempts allowed
 
-    Behavior:
-        - Prompt "Enter password:" for each attempt
-        - Valid password requires: 8+ chars, upper, lower, digit, special (!@#$%^&*)
-        - Print "Invalid password. Try again." for invalid
-        - Print "Password accepted!" when valid
-        - Print "Maximum attempts reached. Account locked." if exhausted
+def top_connected(network, k):
     """
-    
-    for _ in range(max_attempts):
-        password = input("Enter password:")
+    The k most connected nodes, without sorting the whole network.
 
-        validity = True
+    Dicts go through heapq.nlargest in O(n log k). A CSRGraph goes through
+    np.argpartition on its degree array in O(n + k log k). Ties keep the
+    network's order either way.
 
-        if len(password)<8:
-            validity = False
-            print("Invalid password. Try again.")
-            continue
+    Args:
+        network: CSRGraph, or a dict where keys are nodes and values are lists of connected nodes
+        k: Number of nodes to return
 
-        if not any(char.isupper() for char in password):
-            validity = False
-            print("Invalid password. Try again.")
-            continue
+    Returns:
+        list: Up to k tuples (node, connections), connections descending
 
-        if not any(char.islower() for char in password):
-            validity = False
-            print("Invalid password. Try again.")
-            continue
+    Raises:
+        ValueError: If k < 0
+    """
+    if k < 0:
+        raise ValueError
 
-        if not any(char.isdigit() for char in password):
-            validity = False
-            print("Invalid password. Try again.")
-            continue
+    if not isinstance(network, CSRGraph):
+        top = heapq.nlargest(k, network.items(), key=lambda item: len(item[1]))
+        return [(node, len(connections)) for node, connections in top]
 
-        if not any(char in '!@#$%^&*' for char in password):
-            validity = False
-            print("Invalid password. Try again.")
-            continue
+    degrees = network.out_degrees()[:network.sources]
+    if k >= len(degrees):
+        chosen = np.arange(len(degrees))
+    elif k == 0:
+        return []
+    else:
+        # everything above the kth largest degree, then the earliest nodes tied with it
+        kth = np.partition(degrees, len(degrees) - k)[len(degrees) - k]
+        above = np.flatnonzero(degrees > kth)
+        tied = np.flatnonzero(degrees == kth)[:k - len(above)]
+        chosen = np.concatenate([above, tied])
 
-        print("Password accepted!")
-        break
+    chosen = chosen[np.lexsort((chosen, -degrees[chosen]))]
+    return [(network.nodes[node_id], degree)
+            for node_id, degree in zip(chosen.tolist(), degrees[chosen].tolist())]
 
-    if not validity:
-        print("Maximum attempts reached. Account locked.")
 
+def _shard_degrees(path, num_nodes, chunk_edges):
+    # out/in-degree counts for one memory-mapped (E, 2) integer edge array
+    edges = np.load(path, mmap_mode="r")
+    if edges.ndim != 2 or edges.shape[1] != 2:
+        raise ValueError(f"{path}: expected an (E, 2) edge array")
 
+    out_degrees = np.zeros(num_nodes, dtype=np.int64)
+    in_degrees = np.zeros(num_nodes, dtype=np.int64)
 
+    for start in range(0, len(edges), chunk_edges):
+        chunk = np.asarray(edges[start:start + chunk_edges])
+        if len(chunk) and (chunk.min() < 0 or chunk.max() >= num_nodes):
+            raise ValueError(f"{path}: node id out of range")
+        out_degrees += np.bincount(chunk[:, 0], minlength=num_nodes)
+        in_degrees += np.bincount(chunk[:, 1], minlength=num_nodes)
 
+    return out_degrees, in_degrees
 
-def student_grade_processor(students):
+
+def sharded_degrees(paths, num_nodes, workers=None, chunk_edges=1 << 20):
     """
-    Categorize students by passing/failing status with averages.
+    Out- and in-degree arrays for a graph stored as sharded edge-list files.
+
+    Each shard is a .npy file holding an (E, 2) integer array of
+    (source, target) node IDs in range(num_nodes). Shards are memory-mapped
+    and counted chunk by chunk in a process pool, and the partial degree
+    arrays are summed. The graph is never materialized as Python objects.
 
     Args:
-        students: List of dicts with keys: name, grades (list)
+        paths: Shard file paths
+        num_nodes: Number of nodes (IDs are 0 .. num_nodes - 1)
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_edges: Edges read from a shard at a time
 
     Returns:
-        dict: Keys "passing" and "failing", values are lists of dicts with name and average
+        tuple: (out_degrees, in_degrees) int64 arrays of length num_nodes
 
     Raises:
-        KeyError: If required keys missing
-        ValueError: If grades list is empty
+        ValueError: If a shard is malformed or holds an out of range node ID,
+                    or if num_nodes < 0, workers < 1 or chunk_edges < 1
     """
+    _require_numpy()
 
-    classification = {'passing':[], 'failing':[]}
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if num_nodes < 0 or workers < 1 or chunk_edges < 1:
+        raise ValueError
 
-    for student in students:
-        if not student["grades"]:
-            raise ValueError
-        student_average = statistics.mean(student["grades"])
-        if student_average>=60:
-            classification["passing"].append({"name":student["name"], 'average':student_average})
-        else:
-            classification["failing"].append({"name":student["name"], 'average':student_average})
-        
-    
-    return classification
+    paths = [os.fspath(path) for path in paths]
+    out_degrees = np.zeros(num_nodes, dtype=np.int64)
+    in_degrees = np.zeros(num_nodes, dtype=np.int64)
+    arguments = ([num_nodes] * len(paths), [chunk_edges] * len(paths))
 
+    if workers == 1 or len(paths) <= 1:
+        partials = map(_shard_degrees, paths, *arguments)
+        for shard_out, shard_in in partials:
+            out_degrees += shard_out
+            in_degrees += shard_in
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            for shard_out, shard_in in pool.map(_shard_degrees, paths, *arguments):
+                out_degrees += shard_out
+                in_degrees += shard_in
 
+    return out_degrees, in_degrees
 
 
-def transaction_batcher(transactions, batch_size):
+EdgeShards = namedtuple("EdgeShards", ["paths", "names", "sources"])
+
+
+def write_edge_shards(network, directory, shards=1):
     """
-    Split transactions into batches of specified size.
+    Write a dict-of-lists network as sharded .npy edge-list files.
+
+    The network's keys get IDs 0 .. sources - 1 in order, nodes that only
+    appear as targets come after them.
 
     Args:
-        transactions: List of transactions
-        batch_size: Number of transactions per batch
+        network: Dict where keys are nodes and values are lists of nodes they link to
+        directory: Folder to write shard_0.npy, shard_1.npy, ... into
+        shards: Number of shard files
 
     Returns:
-        list: List of batches (each batch is a list)
+        EdgeShards: paths, names (names[i] is the node with ID i) and sources
+                    (the number of nodes that were keys of network)
 
     Raises:
-        ValueError: If batch_size < 1
+        ValueError: If shards < 1
     """
-    
-    if not transactions:
-        return []
-    
-    if batch_size<1:
+    _require_numpy()
+
+    if shards < 1:
         raise ValueError
-    
-    larger = []
-    smaller = []
-    for item in transactions:
-        if len(smaller)==batch_size:
-            larger.append(smaller)
-            smaller=[]
-        smaller.append(item)
-    
-    if smaller:
-        larger.append(smaller)
-    
-    return larger
 
+    index = {node: node_id for node_id, node in enumerate(network)}
+    edges = np.array([(index[source], index.setdefault(target, len(index)))
+                      for source, targets in network.items() for target in targets],
+                     dtype=np.int64).reshape(-1, 2)
 
-def network_graph_analyzer(network: dict[str, list[str]]):
+    paths = []
+    for shard, part in enumerate(np.array_split(edges, shards)):
+        path = os.path.join(os.fspath(directory), f"shard_{shard}.npy")
+        np.save(path, part)
+        paths.append(path)
+
+    return EdgeShards(paths, list(index), len(network))
+
+
+def network_graph_analyzer_sharded(paths, num_nodes, sources, names=None, workers=None):
     """
-    Analyze network connectivity statistics.
+    network_graph_analyzer for a graph stored as sharded edge-list files.
+
+    Like network_graph_analyzer, only the source nodes (the network's keys,
+    IDs 0 .. sources - 1) can be most_connected or isolated; nodes that
+    only appear as targets are counted but not reported.
 
     Args:
-        network: Dict where keys are nodes, values are lists of connected nodes
+        paths: Shard file paths (see sharded_degrees)
+        num_nodes: Number of nodes (IDs are 0 .. num_nodes - 1)
+        sources: Number of source nodes, as recorded by write_edge_shards
+        names: Optional list mapping node IDs to names (IDs are reported otherwise)
+        workers: Number of worker processes (defaults to the CPU count)
 
     Returns:
         dict: Keys are total_connections, most_connected, isolated_nodes
+
+    Raises:
+        ValueError: If sources is not in 0 .. num_nodes
     """
+    if not 0 <= sources <= num_nodes:
+        raise ValueError
 
-    if not network:
+    out_degrees, _ = sharded_degrees(paths, num_nodes, workers)
+    name_of = names.__getitem__ if names is not None else int
+
+    if not sources:
         return {"total_connections": 0, "most_connected": None, "isolated_nodes": []}
-    
-    total_cons = 0
-    isolated = []
-    node_to_con ={}
 
-    for node, connections in network.items():
-        total_cons+= len(connections)
-        if not connections:
-            isolated.append(node)
-        
-        node_to_con[node]=len(connections)
-    
-    most_connected = list(dict(sorted(network.items(), reverse=True, key=lambda item:item[1])))[0]
-    return {"total_connections": total_cons, "most_connected": most_connected, "isolated_nodes":isolated}
+    source_degrees = out_degrees[:sources]
+    return {"total_connections": int(out_degrees.sum()),
+            "most_connected": name_of(int(source_degrees.argmax())),
+            "isolated_nodes": [name_of(node) for node in np.flatnonzero(source_degrees == 0).tolist()]}
 
         
 
@@ -248,11 +1519,91 @@ def sum_of_digits(n):
     
     if n ==0:
         return 0
+
+    if n >= _DIGIT_RECURSION_MAX:
+        return sum_of_digits_safe(n)
     
     else:
         return (n%10)+ sum_of_digits(n//10)
 
 
+# sum_of_digits recurses once per digit below this, larger n use sum_of_digits_safe
+_DIGIT_RECURSION_MAX = 10 ** 256
+# leaves stay under the smallest allowed sys.set_int_max_str_digits limit (640)
+_DIGIT_LEAF = 10 ** 512
+
+
+def run_recursive(step, *args):
+    """
+    Run a recursive function on an explicit stack instead of the call stack.
+
+    step is written as a generator: `value = yield args` stands for the
+    recursive call `value = step(*args)`, and its return value is the
+    result. Depth is then limited by memory, not sys.getrecursionlimit().
+
+    Args:
+        step: Generator function with the recursive formulation
+        *args: Arguments of the outermost call
+
+    Returns:
+        The outermost call's return value
+    """
+    stack = [step(*args)]
+    value = None
+
+    while stack:
+        try:
+            call = stack[-1].send(value)
+        except StopIteration as finished:
+            stack.pop()
+            value = finished.value
+        else:
+            stack.append(step(*call))
+            value = None
+
+    return value
+
+
+def _digit_sum_step(n, powers, level):
+    # split n at powers[level] = 10 ** (512 * 2 ** level): the low half's
+    # missing leading zeros add nothing, so the halves sum independently
+    if level < 0:
+        digits = str(n)
+        return sum(int(digit) * digits.count(digit) for digit in "123456789")
+
+    high, low = divmod(n, powers[level])
+    low_sum = yield (low, powers, level - 1)
+    high_sum = (yield (high, powers, level - 1)) if high else 0
+    return high_sum + low_sum
+
+
+def sum_of_digits_safe(n):
+    """
+    Calculate sum of digits for integers of any size without deep recursion.
+
+    The recursion halves the number of digits at each level (divide and
+    conquer on powers of ten) and runs on run_recursive's explicit stack,
+    so a million-digit n needs about a dozen levels instead of a million.
+
+    Args:
+        n: A non-negative integer
+
+    Returns:
+        int: Sum of all digits
+
+    Raises:
+        ValueError: If n is negative or not an integer
+    """
+    if not isinstance(n, int) or n < 0:
+        raise ValueError
+
+    powers = [_DIGIT_LEAF]
+    while powers[-1] <= n:
+        powers.append(powers[-1] ** 2)
+
+    return run_recursive(_digit_sum_step, n, powers, len(powers) - 2)
+
+
 
 def data_pipeline_processor(raw_data, transformations):
     """
@@ -267,6 +1618,7 @@ def data_pipeline_processor(raw_data, transformations):
         - "add_ten": add 10
         - "filter_even": keep only even numbers
         - "square": square each number
+        - anything added with register_transformation
 
     Returns:
         list: Transformed data
@@ -274,25 +1626,390 @@ def data_pipeline_processor(raw_data, transformations):
     Raises:
         ValueError: For unknown transformations
     """
-    
-    if any(transformation not in ["double","add_ten", "filter_even", "square"  ] for transformation in transformations):
+    return compile_pipeline(transformations)(raw_data)
+
+
+class Transformation(namedtuple("Transformation", ["name", "kind", "func", "array_func", "step"])):
+    """
+    A data_pipeline_processor transformation in PIPELINE_TRANSFORMATIONS.
+
+    Attributes:
+        name: Name used in transformation lists
+        kind: "map" (element-wise, func(x) -> value), "filter" (func(x) -> keep it?)
+            or "batch" (func(list) -> list, sees all the data at once)
+        func: The Python callable for that kind
+        array_func: Whole-array version used by apply_array (a boolean mask for filters), or None
+        step: Plan step for the compiler. The built-ins carry algebraic steps:
+            ("affine", a, b) is x -> a * x + b, ("filter", parity) keeps
+            value % 2 == parity. Registered ops are ("op", name).
+    """
+
+    __slots__ = ()
+
+    @property
+    def vectorizable(self):
+        return self.array_func is not None
+
+    @property
+    def fusable(self):
+        # map and filter ops share one comprehension, a batch op needs the whole list
+        return self.kind != "batch"
+
+
+PIPELINE_TRANSFORMATIONS = {
+    "double": Transformation("double", "map", lambda x: x * 2, lambda values: values * 2, ("affine", 2, 0)),
+    "add_ten": Transformation("add_ten", "map", lambda x: x + 10, lambda values: values + 10, ("affine", 1, 10)),
+    "square": Transformation("square", "map", lambda x: x ** 2, lambda values: values ** 2, ("square",)),
+    "filter_even": Transformation("filter_even", "filter", lambda x: x % 2 == 0, lambda values: values % 2 == 0, ("filter", 0)),
+}
+_BUILTIN_TRANSFORMATIONS = dict(PIPELINE_TRANSFORMATIONS)
+
+
+def _clear_pipeline_caches():
+    _compile_pipeline.cache_clear()
+    _plan_pipeline.cache_clear()
+
+
+def register_transformation(name, func, kind="map", array_func=None, replace=False):
+    """
+    Add a transformation that data_pipeline_processor and the compilers accept by name.
+
+    Map and filter ops are fused into the same single-pass comprehension as
+    the built-ins. A batch op splits the pipeline into fused stages around
+    it, and must return a new list instead of changing its input. A NumPy
+    ufunc is also used as its own array_func, so
+    register_transformation("sqrt", np.sqrt) is vectorized in apply_array.
+
+    Args:
+        name: Transformation name
+        func: map: value -> value, filter: value -> bool, batch: list -> list
+        kind: "map", "filter" or "batch"
+        array_func: Optional whole-array version for apply_array (array -> mask for filters)
+        replace: Allow replacing an existing transformation, built-ins included
+
+    Returns:
+        Transformation: The registered entry
+
+    Raises:
+        ValueError: For an unknown kind, a func that is not callable, or a taken name without replace
+    """
+    if kind not in ("map", "filter", "batch") or not callable(func):
         raise ValueError
-    
-    new_list = raw_data.copy()
-    for trans in transformations:
-        if trans =="double":
-            new_list = [i*2 for i in new_list]
-        
-        elif trans == "add_ten":
-            new_list = [i+10 for i in new_list]
-        
-        elif trans == "filter_even":
-            new_list = [i for i in new_list if i%2==0]
-        
+    if name in PIPELINE_TRANSFORMATIONS and not replace:
+        raise ValueError
+    if array_func is None and np is not None and isinstance(func, np.ufunc):
+        array_func = func
+
+    transformation = Transformation(name, kind, func, array_func, ("op", name))
+    PIPELINE_TRANSFORMATIONS[name] = transformation
+    _clear_pipeline_caches()
+    return transformation
+
+
+def unregister_transformation(name):
+    """
+    Remove a registered transformation, restoring the built-in of that name if any.
+
+    Args:
+        name: Transformation name
+
+    Raises:
+        KeyError: If no transformation has that name
+    """
+    del PIPELINE_TRANSFORMATIONS[name]
+    if name in _BUILTIN_TRANSFORMATIONS:
+        PIPELINE_TRANSFORMATIONS[name] = _BUILTIN_TRANSFORMATIONS[name]
+    _clear_pipeline_caches()
+
+
+def _step_expression(step, value):
+    if step[0] == "square":
+        return f"({value} ** 2)"
+
+    _, scale, shift = step
+    if scale == 1:
+        return f"({value} + {shift})"
+    if shift == 0:
+        return f"({value} * {scale})"
+    return f"({value} * {scale} + {shift})"
+
+
+def _describe_step(step, ops):
+    if step[0] == "op":
+        return f"{ops[step[1]].kind} {step[1]}"
+    if step[0] == "filter":
+        return f"keep {'even' if step[1] == 0 else 'odd'} values"
+    if step[0] == "empty":
+        return "drop every value"
+    return f"x -> {_step_expression(step, 'x')[1:-1]}"
+
+
+def _fuse_steps(steps, ops, functions):
+    # one comprehension for a run of map/filter steps; registered funcs are
+    # appended to functions and called by their local name _op<index>
+    expression, clauses = "x", []
+
+    for step in steps:
+        if step[0] == "empty":
+            return "[x for x in data for x in ()]"
+
+        if step[0] == "op":
+            function = f"_op{len(functions)}"
+            functions.append(ops[step[1]].func)
+            if ops[step[1]].kind == "map":
+                expression = f"{function}({expression})"
+                continue
+            test = f"{function}(x)"
+        elif step[0] == "filter":
+            test = f"x % 2 == {step[1]}"
         else:
-            new_list = [i**2 for i in new_list]
-    
-    return new_list
+            expression = _step_expression(step, expression)
+            continue
+
+        # bind the value computed so far (if any), then test it
+        if expression != "x":
+            clauses.append(f"for x in ({expression},)")
+        clauses.append(f"if {test}")
+        expression = "x"
+
+    return f"[{expression} {' '.join(['for x in data'] + clauses)}]"
+
+
+def _int_bound(values):
+    # largest magnitude in an integer array, None for dtypes that cannot overflow (floats, objects)
+    if values.dtype.kind not in "iu":
+        return None
+    return max(-int(values.min()), int(values.max())) if values.size else 0
+
+
+def _widen_ints(values, bound):
+    # the array in a dtype that holds every value up to +-bound
+    if values.dtype.kind not in "iu" or bound <= np.iinfo(values.dtype).max:
+        return values
+    return values.astype(np.int64 if bound <= np.iinfo(np.int64).max else object)
+
+
+def _apply_array_op(transformation, values):
+    if transformation.kind == "filter":
+        if transformation.vectorizable:
+            return values[np.asarray(transformation.array_func(values), dtype=bool)]
+        return values[np.fromiter((bool(transformation.func(value)) for value in values.tolist()), dtype=bool, count=len(values))]
+
+    if transformation.vectorizable:
+        return np.asarray(transformation.array_func(values))
+    if transformation.kind == "batch":
+        return np.asarray(transformation.func(values.tolist()))
+    return np.array([transformation.func(value) for value in values.tolist()])
+
+
+class CompiledPipeline:
+    """
+    A validated, fused transformation pipeline (see compile_pipeline and plan_pipeline).
+
+    Calling it on a list applies every step to each element in one
+    comprehension, so no intermediate lists are built. Registered batch ops
+    split it into stages, each fused the same way. apply_array runs the same
+    steps on a NumPy array as whole-array operations. Built-in filters only
+    AND a boolean mask, and the array is compacted once at the end (or
+    before a registered op, which only sees surviving values). Integer
+    arrays are widened (to int64, then to Python ints in an object array)
+    before a built-in step whose result could overflow their dtype, so they
+    match the list results; registered ops get the array as it is.
+
+    Attributes:
+        transformations: Tuple of transformation names
+        steps: Tuple of plan steps that actually run
+        stages: Tuple of callables run in order on the data (fused comprehensions and batch ops)
+        source: The generated comprehensions, for inspection
+    """
+
+    def __init__(self, transformations, steps=None):
+        if steps is None:
+            steps = tuple(PIPELINE_TRANSFORMATIONS[name].step for name in transformations)
+
+        # registered ops are resolved once here, later registry changes do not affect this pipeline
+        self._ops = {step[1]: PIPELINE_TRANSFORMATIONS[step[1]] for step in steps if step[0] == "op"}
+
+        parts, segment, functions = [], [], []
+        for step in steps:
+            if step[0] == "op" and not self._ops[step[1]].fusable:
+                if segment:
+                    parts.append(_fuse_steps(segment, self._ops, functions))
+                parts.append(self._ops[step[1]])
+                segment = []
+            else:
+                segment.append(step)
+        if segment or not parts:
+            parts.append(_fuse_steps(segment, self._ops, functions))
+
+        # the generated code comes from the fixed step templates and _op<index> names, never from the caller
+        namespace = {f"_op{index}": function for index, function in enumerate(functions)}
+
+        self.transformations = transformations
+        self.steps = steps
+        self.stages = tuple(eval(f"lambda data: {part}", namespace) if isinstance(part, str) else part.func
+                            for part in parts)
+        self.source = " -> ".join(part if isinstance(part, str) else f"{part.name}(data)" for part in parts)
+
+    def __call__(self, data):
+        for stage in self.stages:
+            data = stage(data)
+        return data
+
+    def apply_array(self, array):
+        _require_numpy()
+
+        values = np.asarray(array)
+        keep = None
+        # magnitude bound of the integer values, tracked to widen before any overflow
+        bound = _int_bound(values)
+
+        for step in self.steps:
+            if step[0] == "op":
+                if keep is not None:
+                    values, keep = values[keep], None
+                values = _apply_array_op(self._ops[step[1]], values)
+                bound = _int_bound(values)
+            elif step[0] == "empty":
+                values, keep = values[:0], None
+            elif step[0] == "filter":
+                matches = np.asarray(values % 2 == step[1], dtype=bool)
+                keep = matches if keep is None else keep & matches
+            elif step[0] == "square":
+                if bound is not None:
+                    bound = bound ** 2
+                    values = _widen_ints(values, bound)
+                values = values ** 2
+            else:
+                if bound is not None:
+                    bound = bound * abs(step[1]) + abs(step[2])
+                    values = _widen_ints(values, bound)
+                values = values * step[1] if step[1] != 1 else values
+                values = values + step[2] if step[2] else values
+
+        return values if keep is None else values[keep]
+
+    def explain(self):
+        """
+        Describe the original transformations and the steps that actually run.
+
+        Returns:
+            str: One line for the input, then one numbered line per executed step
+        """
+        lines = [f"transformations: {' -> '.join(self.transformations) or '(none)'}"]
+        lines += [f"{number}. {_describe_step(step, self._ops)}" for number, step in enumerate(self.steps, start=1)]
+        if not self.steps:
+            lines.append("(identity)")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        return f"CompiledPipeline({list(self.transformations)!r})"
+
+
+def _validate_pipeline(transformations):
+    if any(transformation not in PIPELINE_TRANSFORMATIONS for transformation in transformations):
+        raise ValueError
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pipeline(transformations):
+    _validate_pipeline(transformations)
+    return CompiledPipeline(transformations)
+
+
+def compile_pipeline(transformations):
+    """
+    Validate and fuse a data_pipeline_processor transformation list.
+
+    Compiled pipelines are cached by their transformation tuple, so repeated
+    calls with the same steps skip validation and code generation.
+
+    Args:
+        transformations: Sequence of transformation names
+
+    Returns:
+        CompiledPipeline: Callable on a list of numbers, with apply_array for NumPy arrays
+
+    Raises:
+        ValueError: For unknown transformations
+    """
+    return _compile_pipeline(tuple(transformations))
+
+
+def _plan_segment(allowed, maps):
+    if not allowed:
+        return [("empty",)]
+
+    steps = [("filter", allowed.pop())] if len(allowed) == 1 else []
+    return steps + [step for step in maps if step != ("affine", 1, 0)]
+
+
+def _plan_steps(transformations):
+    steps = []
+    allowed = {0, 1}    # input parities the filters seen so far let through
+    maps = []           # element-wise steps after the (single, leading) filter
+
+    for name in transformations:
+        step = PIPELINE_TRANSFORMATIONS[name].step
+
+        if step[0] == "op":
+            # registered ops are opaque to the parity algebra: plan the steps before them on their own
+            steps += _plan_segment(allowed, maps)
+            steps.append(step)
+            allowed, maps = {0, 1}, []
+
+        elif step[0] == "filter":
+            # push the filter to the front: which input parities end up even here?
+            for parity in (0, 1):
+                value = parity
+                for earlier in maps:
+                    value = value ** 2 if earlier[0] == "square" else earlier[1] * value + earlier[2]
+                if value % 2 != step[1]:
+                    allowed.discard(parity)
+
+        elif step[0] == "affine" and maps and maps[-1][0] == "affine":
+            # fold a -> b -> (a2 * (a1 * x + b1) + b2) into one affine map
+            _, scale, shift = maps.pop()
+            maps.append(("affine", step[1] * scale, step[1] * shift + step[2]))
+
+        else:
+            maps.append(step)
+
+    steps += _plan_segment(allowed, maps)
+    return tuple(steps)
+
+
+@functools.lru_cache(maxsize=256)
+def _plan_pipeline(transformations):
+    _validate_pipeline(transformations)
+    return CompiledPipeline(transformations, _plan_steps(transformations))
+
+
+def plan_pipeline(transformations):
+    """
+    Rewrite a transformation list into a cheaper equivalent plan, then compile it.
+
+    - Runs of "double"/"add_ten" are folded into one affine map a * x + b.
+    - Every "filter_even" is pushed to the front by tracking parity (a*x + b
+      and x ** 2 have a parity fixed by x's), which shrinks the data before
+      any arithmetic. Filters that always pass are dropped, and
+      contradictory filters become "drop every value".
+    - Registered ops are kept in place, and the steps between them are
+      planned separately.
+
+    The rewrites are exact for integer data, which is what filter_even is
+    defined on. Use compile_pipeline for float data.
+
+    Args:
+        transformations: Sequence of transformation names
+
+    Returns:
+        CompiledPipeline: Callable like compile_pipeline's, use explain() to see the plan
+
+    Raises:
+        ValueError: For unknown transformations
+    """
+    return _plan_pipeline(tuple(transformations))
 
 
 
@@ -341,6 +2058,36 @@ def leaderboard_ranker(scores):
     return with_ranking
 
 
+def top_ranked(scores, k):
+    """
+    Top k entries of leaderboard_ranker without sorting everything.
+
+    Uses heapq.nlargest, which is O(n log k) and keeps the same order as the
+    stable sort in leaderboard_ranker, so ranks match the full ranking.
+
+    Args:
+        scores: List of tuples (player_name, score)
+        k: Number of entries to return
+
+    Returns:
+        list: Up to k tuples (player_name, score, rank), score descending
+
+    Raises:
+        ValueError: If k < 0 or a tuple doesn't have exactly 2 elements
+    """
+    if k < 0:
+        raise ValueError
+
+    top = heapq.nlargest(k, dict(scores).items(), key=itemgetter(1))
+
+    ranked = []
+    for position, (name, score) in enumerate(top, start=1):
+        rank = ranked[-1][2] if ranked and ranked[-1][1] == score else position
+        ranked.append((name, score, rank))
+
+    return ranked
+
+
 
 print(leaderboard_ranker([("Alice", 100), ("Bob", 150), ("Charlie", 120)]))
 
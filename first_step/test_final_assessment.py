@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from final_assessment import *
 from unittest.mock import patch
@@ -55,6 +56,143 @@ def test_sales_report_generator_mixed_products():
     assert result["A"]["total_revenue"] == 300
     assert result["B"]["total_revenue"] == 400
 
+def test_sales_report_generator_negative_quantity():
+    with pytest.raises(ValueError):
+        sales_report_generator([{"product": "Test", "price": 10, "quantity": -5}])
+
+def test_sales_report_columnar_matches_row_based():
+    np = pytest.importorskip("numpy")
+    data = [{"product": f"Product_{i % 7}", "price": i % 13, "quantity": i % 5} for i in range(1000)]
+    result = sales_report_columnar(
+        np.array([d["product"] for d in data]),
+        np.array([d["price"] for d in data]),
+        np.array([d["quantity"] for d in data]),
+    )
+    expected = sales_report_generator(data)
+    assert result == expected
+    assert list(result) == list(expected)
+
+def test_sales_report_columnar_integer_dtypes_and_floats():
+    np = pytest.importorskip("numpy")
+    result = sales_report_columnar(["A", "A"], np.array([5, 6], dtype=np.uint64), np.array([1, 1], dtype=np.int64))
+    assert result == {"A": {"total_revenue": 11, "units_sold": 2}}
+    assert isinstance(result["A"]["total_revenue"], int)
+
+    # only integer columns are exact, float totals are summed in another order
+    data = [{"product": f"P{i % 3}", "price": i / 10, "quantity": 3} for i in range(300)]
+    result = sales_report_columnar([d["product"] for d in data], [d["price"] for d in data], [3] * 300)
+    expected = sales_report_generator(data)
+    for product, totals in expected.items():
+        assert result[product]["total_revenue"] == pytest.approx(totals["total_revenue"])
+        assert result[product]["units_sold"] == totals["units_sold"]
+
+def test_sales_report_columnar_lists_and_empty():
+    pytest.importorskip("numpy")
+    assert sales_report_columnar([], [], []) == {}
+    assert sales_report_columnar(["B", "A", "B"], [2, 1, 2], [1, 3, 4]) == {
+        "B": {"total_revenue": 10, "units_sold": 5},
+        "A": {"total_revenue": 3, "units_sold": 3},
+    }
+
+def test_sales_report_columnar_negative_values():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        sales_report_columnar(["A"], [-1], [1])
+    with pytest.raises(ValueError):
+        sales_report_columnar(["A"], [1], [-1])
+    with pytest.raises(ValueError):
+        sales_report_columnar(["A", "B"], [1], [1, 2])
+
+def test_sales_report_columnar_keys_and_overflow():
+    pytest.importorskip("numpy")
+    rows = [("1", 1, 1), (1, 2, 1), (("a", "b"), 3, 1), (("a", "b"), 4, 1), ("big", 2**40, 2**30), ("big", 2**40, 2**30)]
+    data = [{"product": product, "price": price, "quantity": quantity} for product, price, quantity in rows]
+    products, prices, quantities = (list(column) for column in zip(*rows))
+    result = sales_report_columnar(products, prices, quantities)
+    assert result == sales_report_generator(data)
+    assert list(result) == ["1", 1, ("a", "b"), "big"]
+    assert result["big"]["total_revenue"] == 2**71
+
+def test_sales_report_parallel_matches_serial():
+    data = [{"product": f"Product_{i % 37}", "price": i % 101, "quantity": i % 9} for i in range(5000)]
+    expected = sales_report_generator(data)
+    result = sales_report_parallel(data, workers=2, shard_size=700)
+    assert result == expected
+    assert list(result) == list(expected)
+    assert sales_report_parallel(data, workers=1) == expected
+    assert sales_report_parallel([], workers=2) == {}
+
+def test_sales_report_parallel_errors():
+    with pytest.raises(ValueError):
+        sales_report_parallel([{"product": "A", "price": -1, "quantity": 1}] * 10, workers=2, shard_size=3)
+    with pytest.raises(KeyError):
+        sales_report_parallel([{"product": "A", "price": 1}] * 10, workers=2, shard_size=3)
+    with pytest.raises(ValueError):
+        sales_report_parallel([], workers=0)
+
+def test_sales_report_parallel_does_not_pickle_records():
+    import multiprocessing
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("records are only shared with forked workers")
+    # the lambdas cannot be pickled, so this only works if the workers inherit the list
+    data = [{"product": f"P{i % 3}", "price": i, "quantity": 2, "note": lambda: None} for i in range(300)]
+    assert sales_report_parallel(data, workers=2, shard_size=50) == sales_report_generator(data)
+
+def test_merge_reports():
+    left = {"A": {"total_revenue": 10, "units_sold": 1}}
+    right = {"B": {"total_revenue": 5, "units_sold": 2}, "A": {"total_revenue": 1, "units_sold": 1}}
+    assert merge_reports([left, right]) == {
+        "A": {"total_revenue": 11, "units_sold": 2},
+        "B": {"total_revenue": 5, "units_sold": 2},
+    }
+    assert left == {"A": {"total_revenue": 10, "units_sold": 1}}
+
+def test_sales_report_incremental_matches_generator():
+    data = [{"product": f"Product_{i % 5}", "price": i % 7, "quantity": i % 4} for i in range(200)]
+    report = SalesReport()
+    for record in data:
+        report.add(record)
+    assert report.report() == sales_report_generator(data)
+    assert SalesReport(data).report() == sales_report_generator(data)
+
+def test_sales_report_merge():
+    first = [{"product": "A", "price": 10, "quantity": 1}, {"product": "B", "price": 5, "quantity": 2}]
+    second = [{"product": "B", "price": 5, "quantity": 1}, {"product": "C", "price": 1, "quantity": 1}]
+    merged = SalesReport(first).merge(SalesReport(second))
+    assert merged.report() == sales_report_generator(first + second)
+    assert len(merged) == 3
+    assert merged["B"] == {"total_revenue": 15, "units_sold": 3}
+
+def test_sales_report_retract():
+    sale = {"product": "Phone", "price": 500, "quantity": 2}
+    other = {"product": "Phone", "price": 500, "quantity": 3}
+    report = SalesReport().add_many([sale, other])
+    report.retract(other)
+    assert report.report() == {"Phone": {"total_revenue": 1000, "units_sold": 2}}
+    report.retract(sale)
+    assert report.report() == {}
+    assert "Phone" not in report
+    with pytest.raises(KeyError):
+        report.retract(sale)
+
+def test_sales_report_retract_checks_added_sales():
+    report = SalesReport([{"product": "a", "price": 2, "quantity": 3}])
+    with pytest.raises(ValueError):
+        report.retract({"product": "a", "price": 5, "quantity": 1})
+    assert report.report() == {"a": {"total_revenue": 6, "units_sold": 3}}
+    merged = SalesReport().merge(report)
+    merged.retract({"product": "a", "price": 2, "quantity": 3})
+    assert merged.report() == {}
+    assert report.report() == {"a": {"total_revenue": 6, "units_sold": 3}}
+
+def test_sales_report_validation():
+    report = SalesReport()
+    with pytest.raises(ValueError):
+        report.add({"product": "A", "price": -1, "quantity": 1})
+    with pytest.raises(KeyError):
+        report.add({"product": "A", "price": 1})
+    assert report.report() == {}
+
 # ------------------------------------------------------------------------------------------ #
 
 # Question 2 - Temperature Analyzer
@@ -114,6 +252,77 @@ def test_temperature_analyzer_negative_temps():
     output = captured.getvalue()
     assert "Warning: 1 readings below 0" in output
 
+def test_temperature_analyzer_accepts_generator():
+    captured = StringIO()
+    sys.stdout = captured
+    stats = temperature_analyzer((t for t in [15, 25, 18, 30]), 20)
+    sys.stdout = sys.__stdout__
+    output = captured.getvalue()
+    assert "Warning: 2 readings below 20" in output
+    assert "Average: 22.00" in output
+    assert (stats.count, stats.breaches, stats.minimum, stats.maximum) == (4, 2, 15, 30)
+
+def test_temperature_stats_single_pass():
+    stats = temperature_stats(iter([20.5, 21.25, 19.0]), 20)
+    assert stats.count == 3
+    assert stats.breaches == 1
+    assert not stats.all_within
+    assert stats.average == pytest.approx(20.25)
+    assert format_temperature_report(stats) == "Warning: 1 readings below 20\nAverage: 20.25"
+    assert format_temperature_report(temperature_stats([], 20)) == "No temperature data"
+
+def test_reading_stats_compensated_sum():
+    stats = ReadingStats(0).update([0.1] * 10 + [1e16, 1.0, -1e16])
+    assert stats.total == pytest.approx(2.0)
+    assert ReadingStats(0).update([1, 2, 3]).total == 6
+    with pytest.raises(ValueError):
+        ReadingStats(0, breach="sideways")
+
+def test_temperature_analyzer_decimal_readings():
+    from decimal import Decimal
+    from fractions import Fraction
+    captured = StringIO()
+    sys.stdout = captured
+    stats = temperature_analyzer([Decimal("20.5"), Decimal("19.5"), 1], 20)
+    sys.stdout = sys.__stdout__
+    assert stats.total == Decimal("41.0")
+    assert "Average: 13.67" in captured.getvalue()
+    assert ReadingStats(0).update([Fraction(1, 3)] * 3).average == Fraction(1, 3)
+
+def test_sliding_window_monitor():
+    windows = list(sliding_window_monitor([15, 25, 18, 30, 10], 3, 20))
+    assert [(w.start, w.end, w.breaches) for w in windows] == [(0, 3, 2), (1, 4, 1), (2, 5, 2)]
+    assert [w.average for w in windows] == pytest.approx([58 / 3, 73 / 3, 58 / 3])
+    assert list(sliding_window_monitor([15, 25], 3, 20)) == []
+
+def test_tumbling_window_monitor():
+    windows = list(tumbling_window_monitor(iter([15, 25, 18, 30, 10]), 2, 20))
+    assert [(w.start, w.end, w.count, w.breaches, w.average) for w in windows] == [
+        (0, 2, 2, 1, 20.0), (2, 4, 2, 1, 24.0), (4, 5, 1, 1, 10.0),
+    ]
+
+def test_window_monitor_matches_recomputation():
+    readings = [((i * 37) % 101) / 7 for i in range(500)]
+    for window in sliding_window_monitor(readings, 16, 7):
+        chunk = readings[window.start:window.end]
+        assert window.average == pytest.approx(sum(chunk) / len(chunk))
+        assert window.breaches == sum(1 for r in chunk if r < 7)
+
+def test_window_monitor_async():
+    async def feed():
+        for reading in [15, 25, 18, 30]:
+            yield reading
+
+    async def collect():
+        return [w async for w in WindowMonitor(2, 20, tumbling=True).amonitor(feed())]
+
+    windows = asyncio.run(collect())
+    assert [w.breaches for w in windows] == [1, 1]
+
+def test_window_monitor_invalid_size():
+    with pytest.raises(ValueError):
+        WindowMonitor(0, 20)
+
 # ------------------------------------------------------------------------------------------ #
 
 # Question 3 - Password Validator with Retry
@@ -156,6 +365,64 @@ def test_password_validator_various_weak_passwords(monkeypatch):
     output = captured.getvalue()
     assert "Password accepted!" in output
 
+def test_password_policy_bitmasks():
+    policy = PasswordPolicy()
+    assert policy.check("ValidP@ss123") == 0
+    assert policy.check("short") == (PasswordPolicy.TOO_SHORT | PasswordPolicy.NO_UPPER
+                                     | PasswordPolicy.NO_DIGIT | PasswordPolicy.NO_SPECIAL)
+    assert PasswordPolicy.describe(policy.check("NOUPPER123!")) == ["no_lower"]
+    assert PasswordPolicy.describe(policy.check("")) == ["too_short", "no_upper", "no_lower", "no_digit", "no_special"]
+
+def test_password_policy_matches_five_scans():
+    def five_scans(password):
+        return (len(password) >= 8 and any(c.isupper() for c in password)
+                and any(c.islower() for c in password) and any(c.isdigit() for c in password)
+                and any(c in "!@#$%^&*" for c in password))
+
+    candidates = ["ValidP@ss123", "weak", "nodigits!", "ÉCOLEécole1!", "ΣΙΓΜΑσιγμα٣!", "Tab\tTab9*", "12345678"]
+    assert [PASSWORD_POLICY.is_valid(p) for p in candidates] == [five_scans(p) for p in candidates]
+
+def test_password_policy_validate_many():
+    masks = PasswordPolicy(min_length=4, specials="-").validate_many(iter(["Ab1-", "Ab1!", "ab1-"]))
+    assert masks == [0, PasswordPolicy.NO_SPECIAL, PasswordPolicy.NO_UPPER]
+
+def _scripted_session(answers, delay=0):
+    answers = iter(answers)
+    messages = []
+
+    async def read_input(prompt):
+        messages.append(prompt)
+        await asyncio.sleep(delay)
+        return next(answers)
+
+    return read_input, messages.append, messages
+
+def test_password_validator_async_accepts():
+    read_input, write_output, messages = _scripted_session(["weak", "ValidP@ss1"])
+    assert asyncio.run(password_validator_async(3, read_input, write_output)) is True
+    assert messages == ["Enter password:", "Invalid password. Try again.", "Enter password:", "Password accepted!"]
+
+def test_password_validator_async_locks_out_and_times_out():
+    read_input, write_output, messages = _scripted_session(["ValidP@ss1"] * 2, delay=1)
+    assert asyncio.run(password_validator_async(2, read_input, write_output, timeout=0.01)) is False
+    assert messages.count("Attempt timed out. Try again.") == 2
+    assert messages[-1] == "Maximum attempts reached. Account locked."
+
+def test_password_validator_async_concurrent_sessions():
+    async def run_all():
+        sessions = []
+        for i in range(200):
+            read_input, _, _ = _scripted_session(["weak", "ValidP@ss1" if i % 2 else "weak"], delay=0.001)
+
+            async def write_output(message):
+                await asyncio.sleep(0)
+
+            sessions.append(password_validator_async(2, read_input, write_output))
+        return await asyncio.gather(*sessions)
+
+    results = asyncio.run(run_all())
+    assert results.count(True) == 100
+
 # ------------------------------------------------------------------------------------------ #
 
 # Question 4 - Student Grade Processor
@@ -209,6 +476,29 @@ def test_student_grade_processor_missing_keys():
     with pytest.raises(KeyError):
         student_grade_processor([{"name": "Test"}])
 
+def test_student_grade_processor_batched_matches():
+    pytest.importorskip("numpy")
+    students = [{"name": f"S{i}", "grades": [(i * 7 + j * 13) % 101 for j in range(1 + i % 12)]} for i in range(500)]
+    assert student_grade_processor_batched(students) == student_grade_processor(students)
+    assert student_grade_processor_batched([]) == {"passing": [], "failing": []}
+
+def test_student_grade_processor_batched_errors():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        student_grade_processor_batched([{"name": "A", "grades": [50]}, {"name": "Test", "grades": []}])
+    with pytest.raises(KeyError):
+        student_grade_processor_batched([{"name": "Test"}])
+
+def test_segment_means():
+    pytest.importorskip("numpy")
+    assert segment_means([[1, 2], [3], [4.5, 5.5, 6.5]]).tolist() == [1.5, 3.0, 5.5]
+
+def test_student_grade_processor_batched_exact_at_pass_mark():
+    pytest.importorskip("numpy")
+    students = [{"name": "Whole", "grades": [59, 61]}, {"name": "Edge", "grades": [52.1, 54.4, 56.3, 77.2]}]
+    assert student_grade_processor_batched(students) == student_grade_processor(students)
+    assert [s["name"] for s in student_grade_processor_batched(students)["passing"]] == ["Whole", "Edge"]
+
 # ------------------------------------------------------------------------------------------ #
 
 # Question 5 - Transaction Batcher
@@ -248,6 +538,76 @@ def test_transaction_batcher_preserve_order():
     assert result[0][0] == "First"
     assert result[-1][-1] == "Fifth"
 
+def test_iter_batches_matches_transaction_batcher():
+    transactions = [f"TXN{i}" for i in range(1003)]
+    assert [list(batch) for batch in iter_batches(transactions, 100)] == transaction_batcher(transactions, 100)
+    assert list(iter_batches(iter(transactions), 100)) == transaction_batcher(transactions, 100)
+    assert list(iter_batches([], 5)) == []
+
+def test_iter_batches_unbounded_iterator():
+    import itertools
+    batches = iter_batches(itertools.count(), 3)
+    assert next(batches) == [0, 1, 2]
+    assert next(batches) == [3, 4, 5]
+
+def test_iter_batches_zero_copy_views():
+    buffer = bytearray(b"abcdefg")
+    batches = list(iter_batches(buffer, 3))
+    assert all(isinstance(batch, memoryview) for batch in batches)
+    buffer[0] = ord("z")
+    assert [bytes(batch) for batch in batches] == [b"zbc", b"def", b"g"]
+
+    np = pytest.importorskip("numpy")
+    array = np.arange(10)
+    views = list(iter_batches(array, 4))
+    assert [len(view) for view in views] == [4, 4, 2]
+    assert all(np.shares_memory(view, array) for view in views)
+
+def test_iter_batches_invalid_batch_size():
+    with pytest.raises(ValueError):
+        iter_batches(["A"], 0)
+
+def test_dispatch_batches_ordered():
+    batches = transaction_batcher(list(range(100)), 7)
+    assert list(dispatch_batches(sum, batches, workers=4)) == [sum(batch) for batch in batches]
+    assert list(dispatch_batches(sum, iter_batches(range(100), 7), workers=2, kind="process")) == [sum(batch) for batch in batches]
+
+def test_dispatch_batches_as_completed():
+    batches = transaction_batcher(list(range(50)), 5)
+    results = dict(dispatch_batches(len, batches, workers=3, ordered=False, max_in_flight=2))
+    assert results == {index: 5 for index in range(10)}
+
+def test_dispatch_batches_bounded_in_flight():
+    import itertools
+    pulled = []
+
+    def batches():
+        for index in itertools.count():
+            pulled.append(index)
+            yield [index]
+
+    results = dispatch_batches(len, batches(), workers=2, max_in_flight=3)
+    assert [next(results) for _ in range(5)] == [1] * 5
+    assert len(pulled) <= 5 + 3
+    results.close()
+
+def test_dispatch_batches_retries():
+    failures = {"left": 2}
+
+    def flaky(batch):
+        if failures["left"]:
+            failures["left"] -= 1
+            raise RuntimeError("transient")
+        return len(batch)
+
+    assert list(dispatch_batches(flaky, [["A"], ["B", "C"]], workers=1, retries=2)) == [1, 2]
+
+    failures["left"] = 5
+    with pytest.raises(RuntimeError):
+        list(dispatch_batches(flaky, [["A"]], workers=1, retries=1))
+    with pytest.raises(ValueError):
+        dispatch_batches(len, [], kind="fiber")
+
 # ------------------------------------------------------------------------------------------ #
 
 # Question 6 - Network Graph Analyzer
@@ -290,6 +650,103 @@ def test_network_graph_analyzer_hub_network():
     assert result["most_connected"] == "Hub"
     assert len(result["isolated_nodes"]) == 4
 
+def test_network_graph_analyzer_picks_highest_degree():
+    network = {"A": ["Z"], "B": ["A", "C", "D"], "C": ["B", "A"]}
+    assert network_graph_analyzer(network)["most_connected"] == "B"
+
+def test_csr_graph_from_dict():
+    pytest.importorskip("numpy")
+    graph = CSRGraph.from_dict({"A": ["B", "C"], "B": ["D"], "C": []})
+    assert graph.nodes == ["A", "B", "C", "D"]
+    assert graph.sources == 3
+    assert graph.offsets.tolist() == [0, 2, 3, 3, 3]
+    assert graph.targets.tolist() == [1, 2, 3]
+    assert str(graph.targets.dtype) == "int32"
+    assert graph.neighbors("A") == ["B", "C"]
+    assert graph.neighbors("D") == []
+
+@pytest.mark.parametrize("network", [
+    {"A": ["B", "C"], "B": ["A", "C"], "C": ["A", "B"]},
+    {"X": ["Y"], "Y": [], "Z": []},
+    {"Hub": ["A", "B", "C", "D"], "A": [], "B": [], "C": [], "D": []},
+    {"A": ["Z"], "B": ["A", "C", "D"], "C": ["B", "A"]},
+    {"Node1": []},
+    {},
+])
+def test_network_graph_analyzer_csr_matches(network):
+    pytest.importorskip("numpy")
+    assert network_graph_analyzer_csr(network) == network_graph_analyzer(network)
+    if network:
+        assert network_graph_analyzer_csr(CSRGraph.from_dict(network)) == network_graph_analyzer(network)
+
+def test_top_connected():
+    network = {"A": ["B"], "B": ["A", "C", "D"], "C": ["A", "B"], "D": ["A", "B"], "E": []}
+    assert top_connected(network, 3) == [("B", 3), ("C", 2), ("D", 2)]
+    assert top_connected(network, 10) == [("B", 3), ("C", 2), ("D", 2), ("A", 1), ("E", 0)]
+    assert top_connected(network, 0) == []
+    with pytest.raises(ValueError):
+        top_connected(network, -1)
+
+def test_top_connected_csr_matches_dict():
+    pytest.importorskip("numpy")
+    network = {f"N{i}": [f"N{j}" for j in range((i * 7) % 5)] for i in range(200)}
+    graph = CSRGraph.from_dict(network)
+    for k in (0, 1, 3, 17, 199, 200, 500):
+        assert top_connected(graph, k) == top_connected(network, k)
+
+@pytest.mark.parametrize("network", [
+    {"A": ["B", "C"], "B": ["A", "C"], "C": ["A", "B"]},
+    {"X": ["Y"], "Y": [], "Z": []},
+    {"Hub": ["A", "B", "C", "D"], "A": [], "B": [], "C": [], "D": []},
+    {"A": ["B"], "C": []},
+    {"A": ["T"], "B": ["T", "U", "V"], "C": []},
+])
+def test_network_graph_analyzer_sharded_matches(network, tmp_path):
+    pytest.importorskip("numpy")
+    paths, names, sources = write_edge_shards(network, tmp_path, shards=2)
+    assert sources == len(network)
+    for workers in (1, 2):
+        result = network_graph_analyzer_sharded(paths, len(names), sources, names, workers=workers)
+        assert result == network_graph_analyzer(network)
+
+def test_network_graph_analyzer_sharded_empty(tmp_path):
+    pytest.importorskip("numpy")
+    shards = write_edge_shards({}, tmp_path)
+    assert network_graph_analyzer_sharded(shards.paths, 0, shards.sources) == network_graph_analyzer({})
+    with pytest.raises(ValueError):
+        network_graph_analyzer_sharded(shards.paths, 0, 1)
+
+def test_connected_components():
+    pytest.importorskip("numpy")
+    network = {"A": ["B"], "B": [], "C": ["D"], "D": ["E"], "E": [], "F": [], "G": ["C"]}
+    assert connected_components(network) == [["A", "B"], ["C", "D", "E", "G"], ["F"]]
+    assert connected_components({}) == []
+
+def test_reachable_iterative_on_deep_chain():
+    pytest.importorskip("numpy")
+    chain = {f"N{i}": [f"N{i + 1}"] for i in range(20_000)}
+    assert len(reachable(chain, "N0")) == 20_001
+    assert reachable({"A": ["C", "B"], "B": ["D"], "C": ["A"], "D": []}, "A") == ["A", "B", "C", "D"]
+    with pytest.raises(KeyError):
+        reachable(chain, "missing")
+
+def test_pagerank_matches_reference():
+    pytest.importorskip("numpy")
+    network = {"A": ["B", "C"], "B": ["C"], "C": ["A"], "D": ["C"], "E": []}
+    nodes = list(network)
+    ranks = {node: 1 / len(nodes) for node in nodes}
+    for _ in range(200):
+        dangling = sum(ranks[node] for node in nodes if not network[node])
+        ranks = {node: 0.15 / len(nodes) + 0.85 * dangling / len(nodes)
+                 + 0.85 * sum(ranks[src] / len(network[src]) for src in nodes if node in network[src])
+                 for node in nodes}
+    result = pagerank(network)
+    assert sum(result.values()) == pytest.approx(1.0)
+    assert result == pytest.approx(ranks)
+    assert max(result, key=result.get) == "C"
+    with pytest.raises(ValueError):
+        pagerank(network, damping=1.5)
+
 # ------------------------------------------------------------------------------------------ #
 
 # Question 7 - Sum of Digits (Recursive)
@@ -333,6 +790,23 @@ def test_recursion_parameters():
             assert len(args) == 1
             assert isinstance(args[0], int)
 
+def test_sum_of_digits_safe_huge_numbers():
+    n = 9876543210 * ((10 ** 50_000 - 1) // (10 ** 10 - 1))  # "9876543210" repeated 5000 times
+    assert sum_of_digits_safe(n) == 45 * 5000
+    assert sum_of_digits(n) == 45 * 5000
+    assert sum_of_digits(10 ** 100_000) == 1
+    assert sum_of_digits_safe(10 ** 511) == sum_of_digits_safe(10 ** 512) == 1
+    assert [sum_of_digits_safe(n) for n in (0, 9, 123456789)] == [0, 9, 45]
+    with pytest.raises(ValueError):
+        sum_of_digits_safe(-1)
+
+def test_run_recursive_deep_recursion():
+    def depth(n):
+        if n == 0:
+            return 0
+        return (yield (n - 1,)) + 1
+    assert run_recursive(depth, 100_000) == 100_000
+
 # ------------------------------------------------------------------------------------------ #
 
 # Question 8 - Data Pipeline Processor
@@ -376,6 +850,113 @@ def test_data_pipeline_processor_chained_filters():
     result = data_pipeline_processor([1, 2, 3, 4, 5, 6], ["filter_even", "double"])
     assert result == [4, 8, 12]
 
+def test_compile_pipeline_fuses_steps():
+    pipeline = compile_pipeline(["double", "filter_even", "add_ten", "square", "filter_even"])
+    assert pipeline.source == "[x for x in data for x in ((x * 2),) if x % 2 == 0 for x in (((x + 10) ** 2),) if x % 2 == 0]"
+    data = list(range(-20, 20)) + [1.5, 2.0]
+    steps = ["double", "add_ten", "filter_even", "square", "filter_even", "add_ten"]
+    assert compile_pipeline(steps)(data) == data_pipeline_processor(data, steps)
+    assert compile_pipeline([])(data) == data
+
+def test_compile_pipeline_is_cached():
+    assert compile_pipeline(["double", "square"]) is compile_pipeline(("double", "square"))
+    with pytest.raises(ValueError):
+        compile_pipeline(["double", "triple"])
+
+def test_compile_pipeline_apply_array():
+    np = pytest.importorskip("numpy")
+    data = list(range(-50, 50))
+    for steps in (["double"], ["filter_even", "square"], ["add_ten", "filter_even", "double", "filter_even"], []):
+        assert compile_pipeline(steps).apply_array(np.array(data)).tolist() == data_pipeline_processor(data, steps)
+
+def test_plan_pipeline_folds_and_drops():
+    plan = plan_pipeline(["double", "double", "add_ten", "add_ten"])
+    assert plan.steps == (("affine", 4, 20),)
+    assert plan.explain() == "transformations: double -> double -> add_ten -> add_ten\n1. x -> x * 4 + 20"
+    assert plan_pipeline(["double", "filter_even"]).steps == (("affine", 2, 0),)
+    assert plan_pipeline(["add_ten", "square", "filter_even"]).steps == (("filter", 0), ("affine", 1, 10), ("square",))
+    assert plan_pipeline(["filter_even", "add_ten", "square", "filter_even"]).steps == (("filter", 0), ("affine", 1, 10), ("square",))
+    assert plan_pipeline(["add_ten", "filter_even"]).source == "[(x + 10) for x in data if x % 2 == 0]"
+    assert plan_pipeline([]).explain() == "transformations: (none)\n(identity)"
+    with pytest.raises(ValueError):
+        plan_pipeline(["double", "halve"])
+
+def test_plan_pipeline_matches_processor():
+    import itertools
+    data = list(range(-25, 25))
+    names = ["double", "add_ten", "filter_even", "square"]
+    for length in range(5):
+        for steps in itertools.product(names, repeat=length):
+            assert plan_pipeline(steps)(data) == data_pipeline_processor(data, list(steps)), steps
+
+def test_plan_pipeline_apply_array():
+    np = pytest.importorskip("numpy")
+    data = list(range(-25, 25))
+    for steps in (["square", "add_ten", "filter_even"], ["filter_even", "add_ten", "filter_even"], ["add_ten", "double"]):
+        assert plan_pipeline(steps).apply_array(np.array(data)).tolist() == data_pipeline_processor(data, steps)
+
+def test_pipeline_apply_array_widens_before_overflow():
+    np = pytest.importorskip("numpy")
+    data = list(range(-20, 21))
+    for steps in (["square"] * 4, ["square", "square", "double", "square", "filter_even"], ["add_ten", "square", "square", "square"]):
+        expected = data_pipeline_processor(data, steps)
+        assert compile_pipeline(steps).apply_array(np.arange(-20, 21)).tolist() == expected
+        assert plan_pipeline(steps).apply_array(np.arange(-20, 21)).tolist() == expected
+    # small dtypes are widened too, without leaving NumPy integers when int64 is enough
+    widened = compile_pipeline(["square", "double"]).apply_array(np.arange(-300, 300, dtype=np.int16))
+    assert widened.dtype == np.int64
+    assert widened.tolist() == data_pipeline_processor(list(range(-300, 300)), ["square", "double"])
+
+def test_register_transformation_custom_ops():
+    register_transformation("negate", lambda x: -x)
+    register_transformation("positive", lambda x: x > 0, kind="filter")
+    register_transformation("dedupe", lambda values: list(dict.fromkeys(values)), kind="batch")
+    try:
+        steps = ["double", "negate", "add_ten", "positive", "dedupe", "square"]
+        assert data_pipeline_processor([1, 2, 2, 7], steps) == [64, 36]
+        pipeline = compile_pipeline(steps)
+        assert len(pipeline.stages) == 3
+        assert pipeline.source == "[x for x in data for x in ((_op0((x * 2)) + 10),) if _op1(x)] -> dedupe(data) -> [(x ** 2) for x in data]"
+        assert plan_pipeline(["add_ten", "negate", "filter_even"]).explain() == (
+            "transformations: add_ten -> negate -> filter_even\n1. x -> x + 10\n2. map negate\n3. keep even values")
+        assert not PIPELINE_TRANSFORMATIONS["dedupe"].fusable
+        assert not PIPELINE_TRANSFORMATIONS["negate"].vectorizable
+        with pytest.raises(ValueError):
+            register_transformation("negate", abs)
+        with pytest.raises(ValueError):
+            register_transformation("sort", sorted, kind="reduce")
+    finally:
+        for name in ("negate", "positive", "dedupe"):
+            unregister_transformation(name)
+    with pytest.raises(ValueError):
+        data_pipeline_processor([1], ["negate"])
+
+def test_register_transformation_replaces_and_restores_builtin():
+    before = compile_pipeline(["double"])
+    register_transformation("double", lambda x: x * 3, replace=True)
+    try:
+        assert data_pipeline_processor([1, 2], ["double"]) == [3, 6]
+        assert before([1, 2]) == [2, 4]
+    finally:
+        unregister_transformation("double")
+    assert data_pipeline_processor([1, 2], ["double"]) == [2, 4]
+    with pytest.raises(KeyError):
+        unregister_transformation("triple")
+
+def test_register_transformation_apply_array():
+    np = pytest.importorskip("numpy")
+    register_transformation("absolute", np.absolute)
+    register_transformation("small", lambda x: x < 20, kind="filter")
+    try:
+        assert PIPELINE_TRANSFORMATIONS["absolute"].vectorizable
+        data = list(range(-25, 25))
+        for steps in (["add_ten", "absolute", "filter_even"], ["filter_even", "absolute", "small", "double"]):
+            pipeline = plan_pipeline(steps)
+            assert pipeline.apply_array(np.array(data)).tolist() == pipeline(data) == data_pipeline_processor(data, steps)
+    finally:
+        unregister_transformation("absolute")
+        unregister_transformation("small")
+
 # ------------------------------------------------------------------------------------------ #
 
 # Question 9 - Leaderboard Ranker
@@ -417,6 +998,14 @@ def test_leaderboard_ranker_invalid_tuple():
     with pytest.raises(ValueError):
         leaderboard_ranker([("Player1", 100, "extra")])
 
+def test_top_ranked_matches_leaderboard():
+    scores = [(f"P{i}", (i * 37) % 50) for i in range(500)]
+    full = leaderboard_ranker(scores)
+    for k in (0, 1, 5, 30, 500, 1000):
+        assert top_ranked(scores, k) == full[:k]
+    with pytest.raises(ValueError):
+        top_ranked([("Alice", 100, 1)], 1)
+
 # ------------------------------------------------------------------------------------------ #
 
 # Question 10 - Smart Cache System
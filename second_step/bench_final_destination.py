@@ -0,0 +1,126 @@
+# bench_final_destination.py
+# Micro-benchmarks for the fast paths in final_destination.py
+#
+# Run from this folder:
+#     python3 bench_final_destination.py
+import random
+import timeit
+from collections import Counter
+
+from final_destination import *
+from final_destination import _fibonacci_pair
+
+
+def _best_of(func, repeat=3, number=1):
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def _report(name, baseline, candidate):
+    print(f"{name:<45} {baseline * 1000:>10.2f} ms {candidate * 1000:>10.2f} ms {baseline / candidate:>7.1f}x")
+
+
+def bench_top_k(n=1_000_000, k=10):
+    rng = random.Random(0)
+    users = [f"U{i}" for i in range(n)]
+    popular = users[:50_000]
+    network = {user: rng.sample(popular, rng.randint(0, 3)) for user in users}
+    scores = [(f"C{i}", rng.randint(0, 10**6)) for i in range(n)]
+
+    def sort_followed():
+        counts = Counter(follow for follows in network.values() for follow in follows)
+        return sorted(counts.items(), key=lambda item: item[1], reverse=True)[:k]
+
+    baseline = _best_of(sort_followed, repeat=1)
+    candidate = _best_of(lambda: top_followed(network, k), repeat=1)
+    _report(f"top_followed dict (n={n:,}, k={k})", baseline, candidate)
+
+    index = FollowerIndex(network)
+    candidate = _best_of(lambda: top_followed(index, k), repeat=1)
+    _report(f"top_followed FollowerIndex (n={n:,}, k={k})", baseline, candidate)
+
+    baseline = _best_of(lambda: sorted(dict(scores).items(), key=lambda item: item[1], reverse=True)[:k], repeat=1)
+    candidate = _best_of(lambda: top_ranked(scores, k), repeat=1)
+    _report(f"top_ranked (n={n:,}, k={k})", baseline, candidate)
+
+
+def _step_by_step_text_pipeline(raw_texts, transformations):
+    # the list-per-step implementation text_pipeline_processor used to have
+    edited = raw_texts.copy()
+    for trans in transformations:
+        if trans == "uppercase":
+            edited = [word.upper() for word in edited]
+        elif trans == "strip":
+            edited = [word.strip() for word in edited]
+        elif trans == "remove_empty":
+            edited = [word for word in edited if word]
+        else:
+            edited = [word[::-1] for word in edited]
+    return edited
+
+
+def bench_text_pipeline(n=1_000_000):
+    rng = random.Random(0)
+    texts = [" " * rng.randint(0, 2) + f"line {i} status=ok" * rng.randint(0, 1) + " " for i in range(n)]
+    steps = ["strip", "remove_empty", "uppercase", "reverse"]
+
+    baseline = _best_of(lambda: _step_by_step_text_pipeline(texts, steps))
+    candidate = _best_of(lambda: text_pipeline_processor(texts, steps))
+    _report(f"text pipeline fused list ({n:,} lines)", baseline, candidate)
+
+    if np is not None:
+        array = np.array(texts)
+        pipeline = compile_text_pipeline(steps)
+        candidate = _best_of(lambda: pipeline.apply_array(array))
+        _report(f"text pipeline NumPy array ({n:,} lines)", baseline, candidate)
+
+
+def _naive_fibonacci(n):
+    # the double recursion fibonacci used to have
+    return n if n < 2 else _naive_fibonacci(n - 1) + _naive_fibonacci(n - 2)
+
+
+def _iterative_fibonacci(n):
+    current, following = 0, 1
+    for _ in range(n):
+        current, following = following, current + following
+    return current
+
+
+def bench_fibonacci():
+    assert fibonacci_fast(10**4) == _iterative_fibonacci(10**4)
+
+    baseline = _best_of(lambda: _naive_fibonacci(25))
+    candidate = _best_of(lambda: fibonacci(25))
+    _report("fibonacci(25) vs double recursion", baseline, candidate)
+
+    def cold_fast(n):
+        # clear the shared pair cache so every run starts from scratch
+        _fibonacci_pair.cache_clear()
+        return fibonacci_fast(n)
+
+    for n in (10**3, 10**4, 10**5, 10**6):
+        baseline = _best_of(lambda: _iterative_fibonacci(n), repeat=1)
+        candidate = _best_of(lambda: cold_fast(n), repeat=1)
+        _report(f"fibonacci_fast({n:,}) vs loop", baseline, candidate)
+
+    ns = list(range(0, 10**4))
+    baseline = _best_of(lambda: [fibonacci_fast(n) for n in ns], repeat=1)
+    candidate = _best_of(lambda: fibonacci_many(ns), repeat=1)
+    _report(f"fibonacci_many(range({len(ns):,})) vs one by one", baseline, candidate)
+
+
+BENCHMARKS = [
+    bench_top_k,
+    bench_text_pipeline,
+    bench_fibonacci,
+]
+
+
+def main():
+    print(f"{'benchmark':<45} {'baseline':>13} {'fast path':>13} {'speedup':>8}")
+    for bench in BENCHMARKS:
+        bench()
+
+
+if __name__ == "__main__":
+    main()
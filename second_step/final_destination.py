@@ -1,9 +1,28 @@
 # final_assessment_v2.py
 # Complete the following functions according to their docstrings
 
-from collections import Counter
+import asyncio
+import contextlib
+import csv
+import functools
+import heapq
+import inspect
+import io
+import json
+import multiprocessing
+import os
+import re
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter
 from statistics import mean
 
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed by the array-backed paths
+    np = None
+
 def inventory_report_generator(inventory_data:list[dict]):
     """
     Generate inventory report aggregating stock and value by category.
@@ -40,13 +59,341 @@ def inventory_report_generator(inventory_data:list[dict]):
     return final_dict
 
 
+def _parse_number(text):
+    if not isinstance(text, str):
+        return text
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _iter_inventory_file(path):
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".csv":
+        with open(path, newline="") as file:
+            # numbers stay text here, the caller parses them where it knows the record offset
+            for row in csv.DictReader(file):
+                yield {key: row[key] for key in row if key is not None}
+
+    elif extension in (".jsonl", ".ndjson"):
+        with open(path) as file:
+            offset = 0
+            for line in file:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as error:
+                    raise ValueError(f"record {offset}: invalid JSON ({error.msg} at column {error.colno})") from None
+                yield record
+                offset += 1
+
+    else:
+        raise ValueError(f"unsupported inventory file type: {extension!r}")
+
+
+def inventory_report_streaming(source, chunk_size=10_000):
+    """
+    Streaming version of inventory_report_generator.
+
+    Reads the input in bounded chunks and keeps only the running per-category
+    accumulators, so memory stays constant however many records there are.
+
+    Args:
+        source: Any iterable of inventory dicts, or a path to a .csv or .jsonl file
+        chunk_size: Number of records pulled from the source at a time
+
+    Returns:
+        dict: Same shape as inventory_report_generator
+
+    Raises:
+        KeyError: If a record is missing a required key (message has the record offset)
+        ValueError: If unit_cost or stock_count is negative, a CSV cell is not a number or a
+                    JSONL line is not valid JSON (message has the record offset),
+                    if chunk_size < 1 or the file type is not supported
+        TypeError: If unit_cost or stock_count is not a number (message has the record offset)
+    """
+    if chunk_size < 1:
+        raise ValueError
+
+    parse_numbers = False
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        parse_numbers = os.path.splitext(path)[1].lower() == ".csv"
+        source = _iter_inventory_file(path)
+
+    records = iter(source)
+    final_dict = {}
+    offset = 0
+
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            break
+
+        for item in chunk:
+            try:
+                category, unit_cost, stock_count = item["category"], item["unit_cost"], item["stock_count"]
+                if parse_numbers:
+                    unit_cost, stock_count = _parse_number(unit_cost), _parse_number(stock_count)
+                negative = unit_cost < 0 or stock_count < 0
+            except KeyError as error:
+                raise KeyError(f"record {offset}: missing key {error.args[0]!r}") from None
+            except ValueError:
+                raise ValueError(f"record {offset}: unit_cost and stock_count must be numbers") from None
+            except TypeError:
+                raise TypeError(f"record {offset}: unit_cost and stock_count must be numbers") from None
+
+            if negative:
+                raise ValueError(f"record {offset}: unit_cost and stock_count must be non-negative")
+
+            if category not in final_dict:
+                final_dict[category] = {"total_value": 0, "total_stock": 0}
+
+            totals = final_dict[category]
+            totals["total_value"] += unit_cost * stock_count
+            totals["total_stock"] += stock_count
+            offset += 1
+
+    return final_dict
+
+
+def merge_reports(reports):
+    """
+    Merge partial group-by-sum reports into one.
+
+    Every report is a dict of key -> dict of numeric totals (the shape returned
+    by the report generators). Totals for the same key are added together, and
+    keys keep the order in which they first appear across the reports, so
+    merging the partials of consecutive shards gives the serial result.
+
+    Args:
+        reports: Iterable of partial reports, in shard order
+
+    Returns:
+        dict: The merged report
+    """
+    merged = {}
+
+    for report in reports:
+        for key, totals in report.items():
+            if key not in merged:
+                merged[key] = dict(totals)
+            else:
+                for field, amount in totals.items():
+                    merged[key][field] += amount
+
+    return merged
+
+
+# the records and partial_report of the running map_reduce_report, set in each forked worker
+_SHARED_SHARDS = None
+
+
+def _share_shards(data, partial_report):
+    global _SHARED_SHARDS
+    _SHARED_SHARDS = (data, partial_report)
+
+
+def _report_shard(bounds):
+    data, partial_report = _SHARED_SHARDS
+    start, stop = bounds
+    return partial_report(data[start:stop])
+
+
+def map_reduce_report(data, partial_report, workers=None, shard_size=None):
+    """
+    Run a group-by-sum report over shards of data in a process pool.
+
+    Where the platform can fork, the workers inherit data from the parent
+    and only receive (start, stop) bounds, so no record is pickled on the
+    way in and only the small partial reports come back. Elsewhere the
+    shards themselves are sent to the workers, which costs about as much as
+    the fold and gives little speedup.
+
+    Args:
+        data: List of records
+        partial_report: Picklable (module level) function that builds a report for one shard
+        workers: Number of worker processes (defaults to the CPU count)
+        shard_size: Records per shard (defaults to an even split, a few shards per worker)
+
+    Returns:
+        dict: Same result as partial_report(data)
+
+    Raises:
+        ValueError: If workers or shard_size < 1
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1 or (shard_size is not None and shard_size < 1):
+        raise ValueError
+
+    if shard_size is None:
+        # a few shards per worker keeps the pool busy if some shards are slower
+        shard_size = max(1, -(-len(data) // (workers * 4)))
+
+    bounds = [(start, min(start + shard_size, len(data))) for start in range(0, len(data), shard_size)]
+
+    if workers == 1 or len(bounds) <= 1:
+        return merge_reports(partial_report(data[start:stop]) for start, stop in bounds)
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds)), mp_context=multiprocessing.get_context("fork"),
+                                 initializer=_share_shards, initargs=(data, partial_report)) as pool:
+            return merge_reports(pool.map(_report_shard, bounds))
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as pool:
+        return merge_reports(pool.map(partial_report, (data[start:stop] for start, stop in bounds)))
+
+
+def inventory_report_parallel(inventory_data, workers=None, shard_size=None):
+    """
+    Parallel version of inventory_report_generator.
+
+    Shards inventory_data, builds partial reports in worker processes and
+    merges them. For integer costs and counts the result is identical to the
+    serial path.
+
+    Args:
+        inventory_data: List of dicts with keys: category, unit_cost, stock_count
+        workers: Number of worker processes (defaults to the CPU count)
+        shard_size: Records per shard
+
+    Returns:
+        dict: Same as inventory_report_generator
+
+    Raises:
+        KeyError: If required keys are missing
+        ValueError: If unit_cost or stock_count is negative
+    """
+    return map_reduce_report(inventory_data, inventory_report_generator, workers, shard_size)
+
+
+
+class ReadingStats:
+    """
+    One-pass accumulator for sensor readings checked against a threshold.
+
+    Tracks count, sum (exact for ints and other exact types such as Decimal,
+    compensated for floats), min, max and
+    the number of readings that breach the threshold, so any iterable (lists,
+    generators, sensor streams) is consumed exactly once.
+
+    Args:
+        threshold: Threshold the readings are checked against
+        breach: "below" if readings < threshold breach it, "above" if readings > threshold do
+
+    Raises:
+        ValueError: If breach is not "below" or "above"
+    """
+
+    def __init__(self, threshold, breach="below"):
+        if breach not in ("below", "above"):
+            raise ValueError
+
+        self.threshold = threshold
+        self.breach = breach
+        self.count = 0
+        self.breaches = 0
+        self.minimum = None
+        self.maximum = None
+        self._int_total = 0
+        self._float_total = 0.0
+        self._compensation = 0.0
+        self._other_total = None    # exact sum of Decimal, Fraction, ... readings
+
+    def add(self, reading):
+        self.count += 1
+
+        if self.minimum is None or reading < self.minimum:
+            self.minimum = reading
+        if self.maximum is None or reading > self.maximum:
+            self.maximum = reading
+
+        if reading < self.threshold if self.breach == "below" else reading > self.threshold:
+            self.breaches += 1
+
+        if isinstance(reading, int):
+            self._int_total += reading
+        elif not isinstance(reading, float):
+            self._other_total = reading if self._other_total is None else self._other_total + reading
+        else:
+            # Neumaier compensated summation
+            total = self._float_total + reading
+            if abs(self._float_total) >= abs(reading):
+                self._compensation += (self._float_total - total) + reading
+            else:
+                self._compensation += (reading - total) + self._float_total
+            self._float_total = total
+
+        return self
+
+    def update(self, readings):
+        for reading in readings:
+            self.add(reading)
+        return self
+
+    @property
+    def total(self):
+        total = self._int_total
+        if self._other_total is not None:
+            total = self._other_total + total
+        if self._float_total or self._compensation:
+            total = total + (self._float_total + self._compensation)
+        return total
+
+    @property
+    def average(self):
+        if not self.count:
+            return None
+        return self.total / self.count
+
+    @property
+    def all_within(self):
+        return self.breaches == 0
+
+
+def rainfall_stats(readings, threshold):
+    """
+    Summarize rainfall readings against a threshold in a single pass.
+
+    Args:
+        readings: Any iterable of rainfall readings in mm (list, generator, stream)
+        threshold: Maximum acceptable rainfall (mm)
+
+    Returns:
+        ReadingStats: Readings above threshold are counted as breaches
+    """
+    return ReadingStats(threshold, breach="above").update(readings)
+
+
+def format_rainfall_report(stats):
+    """
+    Format a rainfall ReadingStats the way rainfall_analyzer prints it.
+
+    Returns:
+        str: Report lines joined by newlines
+    """
+    if not stats.count:
+        return "No rainfall data"
+
+    if stats.all_within:
+        headline = "All readings within threshold"
+    else:
+        headline = f"Warning: {stats.breaches} readings above {stats.threshold}"
+
+    return f"{headline}\nAverage: {stats.average:.2f}"
+
 
 def rainfall_analyzer(readings, threshold):
     """
     Analyze rainfall readings against a threshold.
 
     Args:
-        readings: List of rainfall readings (mm)
+        readings: List (or any iterable) of rainfall readings (mm)
         threshold: Maximum acceptable rainfall (mm)
 
     Prints:
@@ -54,20 +401,139 @@ def rainfall_analyzer(readings, threshold):
         - "All readings within threshold" if all <= threshold
         - "Warning: X readings above Y" otherwise
         - "Average: X" (always when data exists, formatted to 2 decimals)
+
+    Returns:
+        ReadingStats: The single-pass summary behind the printed report
     """
+    stats = rainfall_stats(readings, threshold)
+    print(format_rainfall_report(stats))
+    return stats
 
-    if not readings:
-        print("No rainfall data")
-        
-    
-    elif all(items<=threshold for items in readings):
-        print("All readings within threshold")
-        print(f"Average: {mean(readings):.2f}")
-    
-    else:
-        oultliers = len([i for i in readings if i>threshold])
-        print(f"Warning: {oultliers} readings above {threshold}")
-        print(f"Average: {mean(readings):.2f}")
+
+WindowStats = namedtuple("WindowStats", ["start", "end", "count", "breaches", "average"])
+
+
+class WindowMonitor:
+    """
+    Real-time threshold monitor over sliding or tumbling windows of readings.
+
+    Uses the same breach semantics as ReadingStats. Each reading is stored in a
+    fixed-size ring buffer and the window's running sum and breach count are
+    updated in O(1) amortized time.
+
+    Args:
+        size: Number of readings per window
+        threshold: Threshold the readings are checked against
+        breach: "below" or "above" (see ReadingStats)
+        tumbling: False for a sliding window (one result per reading once the
+                  window is full), True for back-to-back non-overlapping windows
+
+    Raises:
+        ValueError: If size < 1 or breach is not "below" or "above"
+    """
+
+    def __init__(self, size, threshold, breach="above", tumbling=False):
+        if size < 1 or breach not in ("below", "above"):
+            raise ValueError
+
+        self.size = size
+        self.threshold = threshold
+        self.breach = breach
+        self.tumbling = tumbling
+        self._ring = [0] * size
+        self._head = 0
+        self._filled = 0
+        self._total = 0
+        self._breaches = 0
+        self._seen = 0
+
+    def _breached(self, reading):
+        return reading < self.threshold if self.breach == "below" else reading > self.threshold
+
+    def _emit(self):
+        return WindowStats(self._seen - self._filled, self._seen, self._filled,
+                           self._breaches, self._total / self._filled)
+
+    def _reset(self):
+        self._head = self._filled = self._total = self._breaches = 0
+
+    def push(self, reading):
+        """
+        Add one reading.
+
+        Returns:
+            WindowStats | None: The window that this reading completes, if any
+        """
+        if self._filled == self.size:
+            evicted = self._ring[self._head]
+            self._total -= evicted
+            self._breaches -= self._breached(evicted)
+        else:
+            self._filled += 1
+
+        self._ring[self._head] = reading
+        self._total += reading
+        self._breaches += self._breached(reading)
+        self._head = (self._head + 1) % self.size
+        self._seen += 1
+
+        if self._head == 0:
+            # once per lap, recompute the sum so float drift from the evictions can't build up
+            self._total = sum(self._ring)
+
+        if self._filled < self.size:
+            return None
+
+        window = self._emit()
+        if self.tumbling:
+            self._reset()
+        return window
+
+    def flush(self):
+        """
+        Close the stream.
+
+        Returns:
+            WindowStats | None: The trailing partial window for tumbling monitors
+        """
+        if not self.tumbling or not self._filled:
+            return None
+
+        window = self._emit()
+        self._reset()
+        return window
+
+    def monitor(self, readings):
+        """Yield WindowStats for every completed window of an iterable of readings."""
+        for reading in readings:
+            window = self.push(reading)
+            if window is not None:
+                yield window
+
+        window = self.flush()
+        if window is not None:
+            yield window
+
+    async def amonitor(self, readings):
+        """Async-iterator version of monitor for an async iterable of readings."""
+        async for reading in readings:
+            window = self.push(reading)
+            if window is not None:
+                yield window
+
+        window = self.flush()
+        if window is not None:
+            yield window
+
+
+def sliding_window_monitor(readings, size, threshold, breach="above"):
+    """Yield per-window breach counts and averages over a sliding window."""
+    return WindowMonitor(size, threshold, breach).monitor(readings)
+
+
+def tumbling_window_monitor(readings, size, threshold, breach="above"):
+    """Yield per-window breach counts and averages over non-overlapping windows."""
+    return WindowMonitor(size, threshold, breach, tumbling=True).monitor(readings)
 
 
 
@@ -79,6 +545,80 @@ def rainfall_analyzer(readings, threshold):
 
 
 
+USERNAME_OK = 0
+USERNAME_BAD_LENGTH = 1
+USERNAME_BAD_CHARACTERS = 2
+USERNAME_BAD_FIRST_CHARACTER = 3
+
+# \w is exactly str.isalnum() plus "_" for str patterns
+_USERNAME_CHARACTERS = re.compile(r"\w{5,15}")
+
+UsernameResults = namedtuple("UsernameResults", ["valid", "reasons"])
+
+
+def username_reason(username):
+    """
+    Reason code for a single username (USERNAME_OK if it is valid).
+
+    The rules are checked in the same order as username_validator_with_retry:
+    length, allowed characters, then the leading letter.
+    """
+    if _USERNAME_CHARACTERS.fullmatch(username):
+        return USERNAME_OK if username[0].isalpha() else USERNAME_BAD_FIRST_CHARACTER
+
+    if len(username) > 15 or len(username) < 5:
+        return USERNAME_BAD_LENGTH
+
+    return USERNAME_BAD_CHARACTERS
+
+
+def _username_reason_codes(usernames):
+    return bytes(username_reason(username) for username in usernames)
+
+
+def validate_usernames(usernames, workers=1, chunk_size=100_000):
+    """
+    Validate many usernames without prompting.
+
+    Args:
+        usernames: Iterable of usernames
+        workers: Number of processes; chunks are validated in a process pool when > 1
+        chunk_size: Usernames per chunk handed to a worker
+
+    Returns:
+        UsernameResults: valid (bool array) and reasons (uint8 array of USERNAME_* codes),
+                         NumPy arrays when numpy is installed, bytearrays otherwise
+
+    Raises:
+        ValueError: If workers or chunk_size < 1
+    """
+    if workers < 1 or chunk_size < 1:
+        raise ValueError
+
+    if workers == 1:
+        reasons = bytearray(_username_reason_codes(usernames))
+    else:
+        usernames = iter(usernames)
+        chunks = iter(lambda: list(islice(usernames, chunk_size)), [])
+        reasons = bytearray()
+        # a bounded window of chunks in flight, so the input is never read ahead in full
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_username_reason_codes, chunk))
+                if len(pending) >= 2 * workers:
+                    reasons += pending.popleft().result()
+
+            while pending:
+                reasons += pending.popleft().result()
+
+    if np is None:
+        return UsernameResults(bytearray(code == USERNAME_OK for code in reasons), reasons)
+
+    reasons = np.frombuffer(reasons, dtype=np.uint8)
+    return UsernameResults(reasons == USERNAME_OK, reasons)
+
+
 def username_validator_with_retry(max_attempts):
     """
     Validate a username with limited retry attempts.
@@ -98,29 +638,57 @@ def username_validator_with_retry(max_attempts):
     for _ in range(max_attempts):
         username = input("Enter username:")
 
-        validity = True
-
-        if len(username)>15 or len(username)<5:
-            validity = False
+        if username_reason(username) != USERNAME_OK:
             print("Invalid username. Try again.")
             continue
 
-        if not all(char.isalnum() or char== "_" for char in username):
-            validity = False
-            print("Invalid username. Try again.")
-            continue
+        print("Username accepted!")
+        break
 
-        if not username[0].isalpha():
-            validity = False
-            print("Invalid username. Try again.")
+    else:
+        print("Maximum attempts reached. Access denied.")
+
+
+async def _emit(write_output, message):
+    result = write_output(message)
+    if inspect.isawaitable(result):
+        await result
+
+
+async def username_validator_async(max_attempts, read_input, write_output, timeout=None):
+    """
+    Async version of username_validator_with_retry for event-loop hosted sessions.
+
+    Args:
+        max_attempts: Maximum number of attempts allowed
+        read_input: Async callable taking the prompt and returning the entered username
+        write_output: Callable (plain or async) taking each message to show
+        timeout: Seconds allowed per attempt, None to wait forever
+
+    Behavior:
+        - Same prompts and messages as username_validator_with_retry
+        - An attempt that times out prints "Attempt timed out. Try again." and
+          counts towards max_attempts
+
+    Returns:
+        bool: True if a valid username was entered
+    """
+    for _ in range(max_attempts):
+        try:
+            username = await asyncio.wait_for(read_input("Enter username:"), timeout)
+        except asyncio.TimeoutError:
+            await _emit(write_output, "Attempt timed out. Try again.")
             continue
 
+        if username_reason(username) != USERNAME_OK:
+            await _emit(write_output, "Invalid username. Try again.")
+            continue
 
-        print("Username accepted!")
-        break
+        await _emit(write_output, "Username accepted!")
+        return True
 
-    if not validity:
-        print("Maximum attempts reached. Access denied.")
+    await _emit(write_output, "Maximum attempts reached. Access denied.")
+    return False
 
 # username_validator_with_retry(3)``
 
@@ -155,6 +723,82 @@ def employee_performance_processor(employees: list[dict[str:list]]):
     return final
 
 
+def _require_numpy():
+    if np is None:
+        raise ImportError("numpy is required for the array-backed functions")
+
+
+def segment_means(groups):
+    """
+    Average every list of numbers in groups with one segmented reduction.
+
+    The lists are packed CSR-style into one flat float64 array plus offsets,
+    so the per-group sums come from a single np.add.reduceat call. That sum
+    is only exact for whole numbers below 2**53, so any other group is
+    averaged with statistics' mean and matches the row-by-row result exactly.
+
+    Args:
+        groups: List of non-empty lists of numbers
+
+    Returns:
+        numpy.ndarray: One average per group
+
+    Raises:
+        ValueError: If any group is empty
+    """
+    _require_numpy()
+
+    counts = np.fromiter((len(group) for group in groups), dtype=np.int64, count=len(groups))
+    if not len(counts):
+        return np.empty(0)
+    if not counts.all():
+        raise ValueError
+
+    offsets = np.zeros(len(counts), dtype=np.int64)
+    np.cumsum(counts[:-1], out=offsets[1:])
+
+    flat = np.fromiter(chain.from_iterable(groups), dtype=np.float64, count=int(counts.sum()))
+    means = np.add.reduceat(flat, offsets) / counts
+
+    # float64 rounds fractional sums (52.1 + 54.4 + ...) before dividing,
+    # which can move an average across a cut-off; redo those groups exactly
+    with np.errstate(invalid="ignore"):
+        inexact = np.add.reduceat(np.mod(flat, 1) != 0, offsets)
+        inexact |= ~(np.add.reduceat(np.abs(flat), offsets) <= 2**53)
+    for index in np.flatnonzero(inexact).tolist():
+        means[index] = mean(groups[index])
+    return means
+
+
+def employee_performance_processor_batched(employees):
+    """
+    Array-backed version of employee_performance_processor.
+
+    Computes every employee's average with one segmented reduction and splits
+    them at the 80 cutoff in bulk.
+
+    Args:
+        employees: List of dicts with keys: name, scores (list of ints 0-100)
+
+    Returns:
+        dict: Same as employee_performance_processor
+
+    Raises:
+        KeyError: If required keys are missing
+        ValueError: If scores list is empty
+    """
+    names = [employee["name"] for employee in employees]
+    averages = segment_means([employee["scores"] for employee in employees])
+    high = (averages >= 80).tolist()
+    averages = [round(average, 2) for average in averages.tolist()]
+
+    final = {"high_performers":[], "needs_improvement": []}
+    for name, average, is_high in zip(names, averages, high):
+        final["high_performers" if is_high else "needs_improvement"].append({"name":name, "average":average})
+
+    return final
+
+
 def order_batcher(orders, batch_size):
     """
     Split orders into batches of specified size.
@@ -194,46 +838,836 @@ def order_batcher(orders, batch_size):
     
     return wrapper
 
-print(order_batcher(["O1", "O2", "O3", "O4", "O5"],
-        2))
 
-def social_network_analyzer(network: dict[str, list[str]]):
+def _batches_from_slices(data, batch_size):
+    for start in range(0, len(data), batch_size):
+        yield data[start:start + batch_size]
+
+
+def _batches_from_iterator(iterator, batch_size):
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_batches(iterable, batch_size):
     """
-    Analyze a social network's follow relationships.
+    Lazily split items into batches of specified size.
+
+    Batches are yielded as soon as they fill, so unbounded iterators work and
+    only one batch is held at a time. Buffer-backed inputs (memoryview, bytes,
+    bytearray, array.array, NumPy arrays) yield zero-copy views; lists and
+    tuples yield slices; any other iterable yields lists.
 
     Args:
-        network: Dict where keys are users, values are lists of users they follow
+        iterable: Items to batch
+        batch_size: Number of items per batch
 
     Returns:
-        dict with keys:
-            - total_follows (int): sum of all follow relationships
-            - most_followed (str | None): user who appears most in others' follow lists
-            - no_followers (list[str]): users that nobody follows
+        iterator: Batches in input order, the last one may be shorter
+
+    Raises:
+        ValueError: If batch_size < 1
     """
+    if batch_size < 1:
+        raise ValueError
 
-    if all(lists ==[] for person, lists in network.items()):
-        return {"total_follows": 0, "most_followed": None, "no_followers": [person for person, lists in network.items()]}
-    
-    total_follows = 0
-    follows = []
-    no_follow = []
+    if np is not None and isinstance(iterable, np.ndarray):
+        return _batches_from_slices(iterable, batch_size)
 
+    if isinstance(iterable, (list, tuple, range)):
+        return _batches_from_slices(iterable, batch_size)
 
-    for person, following in network.items():
-        total_follows+=len(following)
-        follows.extend(following)
-    
-    follow_count = Counter(follows)
-    sorted_follow = sorted(follow_count.items(), key=lambda item:item[1], reverse=True)
-    most_followed = sorted_follow[0][0]
-    
-    for name in network.keys():
-        if name not in follow_count:
+    try:
+        view = memoryview(iterable)
+    except TypeError:
+        return _batches_from_iterator(iter(iterable), batch_size)
+
+    return _batches_from_slices(view, batch_size)
+
+
+class MicroBatchMetrics:
+    """
+    Running counters kept by OrderMicroBatcher.
+
+    Attributes:
+        batches, items: Totals flushed so far
+        failed_batches: Batches whose flush raised
+        reasons: Flush count per trigger ("items", "bytes", "time", "close")
+        fill_ratio: Average batch size as a fraction of max_items
+        mean_latency, max_latency: Seconds from a batch's first item to the end of its flush
+    """
+
+    def __init__(self, max_items):
+        self.max_items = max_items
+        self.batches = 0
+        self.items = 0
+        self.failed_batches = 0
+        self.reasons = {"items": 0, "bytes": 0, "time": 0, "close": 0}
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, size, reason, latency):
+        self.batches += 1
+        self.items += size
+        self.reasons[reason] += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    @property
+    def fill_ratio(self):
+        return self.items / (self.batches * self.max_items) if self.batches else 0.0
+
+    @property
+    def mean_latency(self):
+        return self.total_latency / self.batches if self.batches else 0.0
+
+
+_CLOSE = object()
+
+
+class OrderMicroBatcher:
+    """
+    Asyncio micro-batcher for order ingestion.
+
+    Orders are grouped like order_batcher groups them: arrival order is kept
+    inside and across batches. A batch is flushed on whichever comes first:
+    max_items orders, max_bytes bytes, or max_delay seconds since its first
+    order. put() waits while max_pending orders are queued (backpressure).
+
+    Args:
+        flush: Callable (plain or async) receiving each batch as a list
+        max_items: Orders per batch
+        max_bytes: Byte budget per batch, None for no byte limit
+        max_delay: Seconds a batch may wait after its first order
+        max_pending: Size of the bounded intake queue
+        workers: Number of concurrent flush workers (1 keeps flushes strictly in order)
+        size_of: Function giving an order's size in bytes
+
+    Raises:
+        ValueError: If max_items, max_pending or workers < 1, or max_bytes/max_delay is not positive
+    """
+
+    def __init__(self, flush, max_items, max_bytes=None, max_delay=0.05,
+                 max_pending=1000, workers=1, size_of=len):
+        if max_items < 1 or max_pending < 1 or workers < 1 or max_delay <= 0:
+            raise ValueError
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError
+
+        self.flush = flush
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.workers = workers
+        self.size_of = size_of
+        self.metrics = MicroBatchMetrics(max_items)
+        self._error = None
+        self._tasks = []
+
+    async def start(self):
+        self._intake = asyncio.Queue(self.max_pending)
+        self._ready = asyncio.Queue(self.workers)
+        self._tasks = [asyncio.create_task(self._collect())]
+        self._tasks += [asyncio.create_task(self._flush_worker()) for _ in range(self.workers)]
+        return self
+
+    async def put(self, order):
+        """
+        Queue one order, waiting while the intake queue is full.
+
+        Raises:
+            RuntimeError: If the batcher is not running (not started, closed, or its collector failed)
+        """
+        await self._offer(order)
+
+    async def close(self):
+        """Flush everything still queued, stop the workers and re-raise the first flush or collector error."""
+        if self._tasks and not self._tasks[0].done():
+            try:
+                await self._offer(_CLOSE)
+            except RuntimeError:
+                pass    # the collector failed, its error is raised below
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._error is not None:
+            raise self._error
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _offer(self, item):
+        collector = self._tasks[0] if self._tasks else None
+        if collector is None or collector.done():
+            raise RuntimeError("the micro-batcher is not running") from self._error
+
+        if not self._intake.full():
+            self._intake.put_nowait(item)
+            return
+
+        # wait for room, but give up if the collector stops meanwhile
+        waiter = asyncio.ensure_future(self._intake.put(item))
+        try:
+            await asyncio.wait((waiter, collector), return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            # put() was cancelled or timed out, so the order must not be queued later
+            waiter.cancel()
+            raise
+        if not waiter.done():
+            waiter.cancel()
+            raise RuntimeError("the micro-batcher is not running") from self._error
+
+    async def _collect(self):
+        try:
+            await self._collect_batches()
+        except Exception as error:
+            if self._error is None:
+                self._error = error
+        finally:
+            # the flush workers stop after the batches queued so far, even if collecting failed
+            for _ in range(self.workers):
+                await self._ready.put(None)
+
+    async def _collect_batches(self):
+        loop = asyncio.get_running_loop()
+        closed = False
+
+        while not closed:
+            order = await self._intake.get()
+            if order is _CLOSE:
+                break
+
+            started = loop.time()
+            batch, size, reason = [order], self.size_of(order), None
+
+            while reason is None:
+                if len(batch) >= self.max_items:
+                    reason = "items"
+                elif self.max_bytes is not None and size >= self.max_bytes:
+                    reason = "bytes"
+                else:
+                    remaining = started + self.max_delay - loop.time()
+                    try:
+                        order = await asyncio.wait_for(self._intake.get(), max(remaining, 0))
+                    except asyncio.TimeoutError:
+                        reason = "time"
+                        continue
+
+                    if order is _CLOSE:
+                        reason, closed = "close", True
+                    else:
+                        batch.append(order)
+                        size += self.size_of(order)
+
+            await self._ready.put((batch, reason, started))
+
+    async def _flush_worker(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            job = await self._ready.get()
+            if job is None:
+                return
+
+            batch, reason, started = job
+            try:
+                result = self.flush(batch)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as error:
+                self.metrics.failed_batches += 1
+                if self._error is None:
+                    self._error = error
+                continue
+
+            self.metrics.record(len(batch), reason, loop.time() - started)
+
+print(order_batcher(["O1", "O2", "O3", "O4", "O5"],
+        2))
+
+def social_network_analyzer(network: dict[str, list[str]]):
+    """
+    Analyze a social network's follow relationships.
+
+    Args:
+        network: Dict where keys are users, values are lists of users they follow
+
+    Returns:
+        dict with keys:
+            - total_follows (int): sum of all follow relationships
+            - most_followed (str | None): user who appears most in others' follow lists
+            - no_followers (list[str]): users that nobody follows
+    """
+
+    if all(lists ==[] for person, lists in network.items()):
+        return {"total_follows": 0, "most_followed": None, "no_followers": [person for person, lists in network.items()]}
+    
+    total_follows = 0
+    follows = []
+    no_follow = []
+
+
+    for person, following in network.items():
+        total_follows+=len(following)
+        follows.extend(following)
+    
+    follow_count = Counter(follows)
+    most_followed = follow_count.most_common(1)[0][0]
+    
+    for name in network.keys():
+        if name not in follow_count:
             no_follow.append(name)
     
     return {"total_follows": total_follows, "most_followed": most_followed, "no_followers":no_follow}
 
 
+class FollowerIndex:
+    """
+    Live follower index answering social_network_analyzer's questions in O(1).
+
+    Users are kept in buckets by follower count (a bucket queue), so
+    follow/unfollow move one user between adjacent buckets and the current
+    most-followed user is always at the top bucket. Ties are broken like
+    social_network_analyzer breaks them: the user that was followed first
+    wins, so an index built from a network reports the same dict. Each
+    bucket keeps a heap of (first-follow rank, user) next to it, so its
+    leader is found in O(1) amortized however many users are tied.
+
+    Args:
+        network: Optional dict where keys are users, values are lists of users they follow
+
+    Methods:
+        - add_user(user): Register a user with no follows
+        - follow(a, b): a follows b (both are registered if new)
+        - unfollow(a, b): Undo one follow of b by a
+        - report(): Same dict as social_network_analyzer
+    """
+
+    def __init__(self, network=None):
+        self._following = {}
+        self._followers = {}
+        self._buckets = {0: {}}
+        self._top = 0
+        # user -> order of its first follow, the tie-break between equal counts
+        self._rank = {}
+        # count -> heap of (rank, user); an entry is live only while it is the
+        # user's current one in _entries, the rest are dropped lazily
+        self._heaps = {}
+        self._entries = {}
+        self.total_follows = 0
+
+        for user, follows in (network or {}).items():
+            self.add_user(user)
+            for followed in follows:
+                self.follow(user, followed)
+
+    def add_user(self, user):
+        if user not in self._followers:
+            self._following[user] = {}
+            self._followers[user] = 0
+            self._buckets[0][user] = None
+
+    def _move(self, user, old, new):
+        bucket = self._buckets[old]
+        del bucket[user]
+        if not bucket and old:
+            del self._buckets[old]
+            del self._heaps[old]
+        elif old and len(self._heaps[old]) > 2 * len(bucket) + 8:
+            # mostly stale entries now, rebuild from the users still there
+            heap = [self._entries[member] for member in bucket]
+            heapq.heapify(heap)
+            self._heaps[old] = heap
+
+        self._buckets.setdefault(new, {})[user] = None
+        self._followers[user] = new
+        if new:
+            entry = self._entries[user] = (self._rank[user], user)
+            heapq.heappush(self._heaps.setdefault(new, []), entry)
+        else:
+            del self._entries[user]
+
+        if new > self._top:
+            self._top = new
+        elif old == self._top and old not in self._buckets:
+            # the top bucket emptied while moving down one, so new is the top now
+            self._top = new
+
+    def follow(self, follower, followed):
+        self.add_user(follower)
+        self.add_user(followed)
+
+        follows = self._following[follower]
+        follows[followed] = follows.get(followed, 0) + 1
+        self._rank.setdefault(followed, len(self._rank))
+        self.total_follows += 1
+        self._move(followed, self._followers[followed], self._followers[followed] + 1)
+
+    def unfollow(self, follower, followed):
+        """
+        Raises:
+            KeyError: If follower does not follow followed
+        """
+        follows = self._following[follower]
+        if follows[followed] == 1:
+            del follows[followed]
+        else:
+            follows[followed] -= 1
+
+        self.total_follows -= 1
+        self._move(followed, self._followers[followed], self._followers[followed] - 1)
+
+    def followers_of(self, user):
+        return self._followers[user]
+
+    @property
+    def most_followed(self):
+        if not self._top:
+            return None
+        heap = self._heaps[self._top]
+        while self._entries.get(heap[0][1]) is not heap[0]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+    @property
+    def no_followers(self):
+        return list(self._buckets[0])
+
+    def report(self):
+        return {"total_follows": self.total_follows, "most_followed": self.most_followed,
+                "no_followers": self.no_followers}
+
+    def top_followed(self, k):
+        """Up to k (user, followers) tuples, read from the buckets highest count first, ties in first-follow order."""
+        if k < 0:
+            raise ValueError
+
+        top = []
+        for count in sorted(self._buckets, reverse=True):
+            if not count or len(top) == k:
+                break
+            top.extend((user, count) for user in self._leaders(count, k - len(top)))
+
+        return top
+
+    def _leaders(self, count, k):
+        # walk the bucket's heap best-first without popping it: O(k log k)
+        # plus whatever stale entries sit above the live ones
+        heap = self._heaps[count]
+        leaders = []
+        frontier = [(heap[0], 0)]
+        while frontier and len(leaders) < k:
+            entry, index = heapq.heappop(frontier)
+            if self._entries.get(entry[1]) is entry:
+                leaders.append(entry[1])
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return leaders
+
+
+def top_followed(network, k):
+    """
+    The k most followed users, without sorting every follow count.
+
+    Args:
+        network: FollowerIndex, or a dict where keys are users and values are lists of users they follow
+        k: Number of users to return
+
+    Returns:
+        list: Up to k tuples (user, followers), followers descending, ties in the
+              order the users were first followed
+
+    Raises:
+        ValueError: If k < 0
+    """
+    if k < 0:
+        raise ValueError
+
+    if isinstance(network, FollowerIndex):
+        return network.top_followed(k)
+
+    # Counter.most_common(k) is a heapq.nlargest partial selection
+    return Counter(chain.from_iterable(network.values())).most_common(k)
+
+
+def _shard_degrees(path, num_nodes, chunk_edges):
+    # out/in-degree counts for one memory-mapped (E, 2) integer edge array
+    edges = np.load(path, mmap_mode="r")
+    if edges.ndim != 2 or edges.shape[1] != 2:
+        raise ValueError(f"{path}: expected an (E, 2) edge array")
+
+    out_degrees = np.zeros(num_nodes, dtype=np.int64)
+    in_degrees = np.zeros(num_nodes, dtype=np.int64)
+
+    for start in range(0, len(edges), chunk_edges):
+        chunk = np.asarray(edges[start:start + chunk_edges])
+        if len(chunk) and (chunk.min() < 0 or chunk.max() >= num_nodes):
+            raise ValueError(f"{path}: node id out of range")
+        out_degrees += np.bincount(chunk[:, 0], minlength=num_nodes)
+        in_degrees += np.bincount(chunk[:, 1], minlength=num_nodes)
+
+    return out_degrees, in_degrees
+
+
+def sharded_degrees(paths, num_nodes, workers=None, chunk_edges=1 << 20):
+    """
+    Out- and in-degree arrays for a graph stored as sharded edge-list files.
+
+    Each shard is a .npy file holding an (E, 2) integer array of
+    (source, target) node IDs in range(num_nodes). Shards are memory-mapped
+    and counted chunk by chunk in a process pool, and the partial degree
+    arrays are summed. The graph is never materialized as Python objects.
+
+    Args:
+        paths: Shard file paths
+        num_nodes: Number of nodes (IDs are 0 .. num_nodes - 1)
+        workers: Number of worker processes (defaults to the CPU count)
+        chunk_edges: Edges read from a shard at a time
+
+    Returns:
+        tuple: (out_degrees, in_degrees) int64 arrays of length num_nodes
+
+    Raises:
+        ValueError: If a shard is malformed or holds an out of range node ID,
+                    or if num_nodes < 0, workers < 1 or chunk_edges < 1
+    """
+    _require_numpy()
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if num_nodes < 0 or workers < 1 or chunk_edges < 1:
+        raise ValueError
+
+    paths = [os.fspath(path) for path in paths]
+    out_degrees = np.zeros(num_nodes, dtype=np.int64)
+    in_degrees = np.zeros(num_nodes, dtype=np.int64)
+    arguments = ([num_nodes] * len(paths), [chunk_edges] * len(paths))
+
+    if workers == 1 or len(paths) <= 1:
+        partials = map(_shard_degrees, paths, *arguments)
+        for shard_out, shard_in in partials:
+            out_degrees += shard_out
+            in_degrees += shard_in
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            for shard_out, shard_in in pool.map(_shard_degrees, paths, *arguments):
+                out_degrees += shard_out
+                in_degrees += shard_in
+
+    return out_degrees, in_degrees
+
+
+EdgeShards = namedtuple("EdgeShards", ["paths", "names", "sources"])
+
+
+def write_edge_shards(network, directory, shards=1):
+    """
+    Write a dict-of-lists network as sharded .npy edge-list files.
+
+    The network's keys get IDs 0 .. sources - 1 in order, nodes that only
+    appear as targets come after them.
+
+    Args:
+        network: Dict where keys are nodes and values are lists of nodes they link to
+        directory: Folder to write shard_0.npy, shard_1.npy, ... into
+        shards: Number of shard files
+
+    Returns:
+        EdgeShards: paths, names (names[i] is the node with ID i) and sources
+                    (the number of nodes that were keys of network)
+
+    Raises:
+        ValueError: If shards < 1
+    """
+    _require_numpy()
+
+    if shards < 1:
+        raise ValueError
+
+    index = {node: node_id for node_id, node in enumerate(network)}
+    edges = np.array([(index[source], index.setdefault(target, len(index)))
+                      for source, targets in network.items() for target in targets],
+                     dtype=np.int64).reshape(-1, 2)
+
+    paths = []
+    for shard, part in enumerate(np.array_split(edges, shards)):
+        path = os.path.join(os.fspath(directory), f"shard_{shard}.npy")
+        np.save(path, part)
+        paths.append(path)
+
+    return EdgeShards(paths, list(index), len(network))
+
+
+def social_network_analyzer_sharded(paths, num_nodes, names=None, workers=None):
+    """
+    social_network_analyzer for a follow graph stored as sharded edge-list files.
+
+    Ties for most_followed go to the user whose first follow comes earliest
+    in the edge order (shard by shard, as write_edge_shards lays them out),
+    the same rule social_network_analyzer and FollowerIndex use.
+
+    Args:
+        paths: Shard file paths in edge order (see sharded_degrees); an edge (a, b) means a follows b
+        num_nodes: Number of users (IDs are 0 .. num_nodes - 1)
+        names: Optional list mapping user IDs to names (IDs are reported otherwise)
+        workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        dict: Same keys as social_network_analyzer
+    """
+    _, in_degrees = sharded_degrees(paths, num_nodes, workers)
+    name_of = names.__getitem__ if names is not None else int
+
+    total_follows = int(in_degrees.sum())
+    most_followed = None
+    if total_follows:
+        leaders = np.flatnonzero(in_degrees == in_degrees.max())
+        most_followed = name_of(_first_followed(paths, leaders) if len(leaders) > 1 else int(leaders[0]))
+    no_followers = [name_of(user) for user in np.flatnonzero(in_degrees == 0).tolist()]
+
+    return {"total_follows": total_follows, "most_followed": most_followed, "no_followers": no_followers}
+
+
+def _first_followed(paths, users, chunk_edges=1 << 20):
+    # the user in users that is the target of the earliest edge; usually
+    # found in the first chunk, so this rarely reads the whole graph
+    for path in paths:
+        edges = np.load(os.fspath(path), mmap_mode="r")
+        for start in range(0, len(edges), chunk_edges):
+            hits = np.flatnonzero(np.isin(edges[start:start + chunk_edges, 1], users))
+            if len(hits):
+                return int(edges[start + hits[0], 1])
+
+
+class CSRGraph:
+    """
+    Compact adjacency structure for dict-of-lists networks.
+
+    Node names are interned to integer IDs: the dict's keys come first, in
+    order, followed by nodes that only appear as targets. Node i's
+    connections are targets[offsets[i]:offsets[i + 1]].
+
+    Attributes:
+        nodes: List of node names, indexed by ID
+        index: Dict of node name -> ID
+        sources: Number of nodes that were keys of the original dict
+        offsets: int32 array of length len(nodes) + 1 (int64 for > 2**31 edges)
+        targets: int32 array of target IDs
+    """
+
+    def __init__(self, nodes, sources, offsets, targets):
+        self.nodes = nodes
+        self.index = {node: node_id for node_id, node in enumerate(nodes)}
+        self.sources = sources
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def from_dict(cls, network):
+        """
+        Build a CSRGraph from a dict where keys are nodes and values are lists of connected nodes.
+        """
+        _require_numpy()
+
+        index = {node: node_id for node_id, node in enumerate(network)}
+        sources = len(index)
+
+        degrees = np.fromiter((len(connections) for connections in network.values()),
+                              dtype=np.int64, count=sources)
+        edge_count = int(degrees.sum())
+        id_type = np.int32 if max(edge_count, sources) < 2**31 else np.int64
+
+        targets = np.fromiter((index.setdefault(target, len(index))
+                               for connections in network.values() for target in connections),
+                              dtype=id_type, count=edge_count)
+
+        # nodes that only appear as targets get empty rows after the sources
+        offsets = np.full(len(index) + 1, edge_count, dtype=id_type)
+        offsets[0] = 0
+        np.cumsum(degrees, out=offsets[1:sources + 1], dtype=id_type)
+
+        return cls(list(index), sources, offsets, targets)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @property
+    def edge_count(self):
+        return len(self.targets)
+
+    def out_degrees(self):
+        return np.diff(self.offsets)
+
+    def neighbors(self, node):
+        node_id = self.index[node]
+        return [self.nodes[target] for target in self.targets[self.offsets[node_id]:self.offsets[node_id + 1]].tolist()]
+
+
+def _as_graph(network):
+    return network if isinstance(network, CSRGraph) else CSRGraph.from_dict(network)
+
+
+def _edge_sources(graph):
+    return np.repeat(np.arange(len(graph), dtype=graph.targets.dtype), graph.out_degrees())
+
+
+def _expand_frontier(graph, frontier):
+    # targets of every node in frontier, gathered without a Python loop
+    starts = graph.offsets[frontier].astype(np.int64)
+    counts = graph.offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if not total:
+        return graph.targets[:0]
+    first = np.cumsum(counts) - counts
+    return graph.targets[np.repeat(starts - first, counts) + np.arange(total)]
+
+
+def component_labels(network):
+    """
+    Weakly connected component label of every node.
+
+    Uses label hooking with pointer jumping over the edge arrays, so it is
+    iterative and vectorized (no recursion, no per-node Python loop).
+
+    Args:
+        network: CSRGraph, or a dict where keys are nodes and values are lists of connected nodes
+
+    Returns:
+        numpy.ndarray: labels[i] is the smallest node ID in node i's component
+    """
+    graph = _as_graph(network)
+    labels = np.arange(len(graph), dtype=np.int64)
+    sources, targets = _edge_sources(graph), graph.targets
+
+    while True:
+        source_labels, target_labels = labels[sources], labels[targets]
+        lowest = np.minimum(source_labels, target_labels)
+
+        hooked = labels.copy()
+        np.minimum.at(hooked, source_labels, lowest)
+        np.minimum.at(hooked, target_labels, lowest)
+
+        # pointer jumping until every node points straight at its root
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def connected_components(network):
+    """
+    Weakly connected components of a network.
+
+    Args:
+        network: CSRGraph, or a dict where keys are nodes and values are lists of connected nodes
+
+    Returns:
+        list: One list of node names per component, ordered by their first node
+    """
+    graph = _as_graph(network)
+    if not len(graph):
+        return []
+
+    labels = component_labels(graph)
+    order = np.argsort(labels, kind="stable")
+    boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+
+    return [[graph.nodes[node_id] for node_id in part.tolist()] for part in np.split(order, boundaries)]
+
+
+def reachable(network, source):
+    """
+    Nodes reachable from source by following connections, found by iterative BFS.
+
+    Each BFS level is expanded with array operations, so deep graphs never
+    touch the recursion limit.
+
+    Args:
+        network: CSRGraph, or a dict where keys are nodes and values are lists of connected nodes
+        source: Start node
+
+    Returns:
+        list: Reachable node names in BFS order (source first, each level by node ID)
+
+    Raises:
+        KeyError: If source is not in the network
+    """
+    graph = _as_graph(network)
+    start = graph.index[source]
+
+    visited = np.zeros(len(graph), dtype=bool)
+    visited[start] = True
+    frontier = np.array([start], dtype=np.int64)
+    levels = [frontier]
+
+    while len(frontier):
+        found = np.unique(_expand_frontier(graph, frontier))
+        frontier = found[~visited[found]].astype(np.int64)
+        visited[frontier] = True
+        levels.append(frontier)
+
+    return [graph.nodes[node_id] for node_id in np.concatenate(levels).tolist()]
+
+
+def pagerank(network, damping=0.85, tolerance=1e-10, max_iterations=100):
+    """
+    PageRank influence score of every node.
+
+    Power iteration where each sparse matrix-vector product is one
+    np.bincount over the edge arrays. Nodes without connections spread their
+    rank evenly over all nodes.
+
+    Args:
+        network: CSRGraph, or a dict where keys are nodes and values are lists of connected nodes
+        damping: Probability of following a connection instead of jumping anywhere
+        tolerance: Stop once the L1 change between iterations is below this
+        max_iterations: Upper bound on power iterations
+
+    Returns:
+        dict: Node name -> score (scores sum to 1)
+
+    Raises:
+        ValueError: If damping is outside [0, 1] or max_iterations < 1
+    """
+    if not 0 <= damping <= 1 or max_iterations < 1:
+        raise ValueError
+
+    graph = _as_graph(network)
+    size = len(graph)
+    if not size:
+        return {}
+
+    degrees = graph.out_degrees()
+    sources = _edge_sources(graph)
+    dangling = degrees == 0
+    inverse_degree = np.divide(1.0, degrees, out=np.zeros(size), where=~dangling)
+
+    ranks = np.full(size, 1.0 / size)
+    for _ in range(max_iterations):
+        shares = (ranks * inverse_degree)[sources]
+        spread = (1 - damping) / size + damping * ranks[dangling].sum() / size
+        updated = damping * np.bincount(graph.targets, weights=shares, minlength=size) + spread
+
+        change = np.abs(updated - ranks).sum()
+        ranks = updated
+        if change < tolerance:
+            break
+
+    return dict(zip(graph.nodes, ranks.tolist()))
+
+
 social_network_analyzer({
     "Alice": ["Bob", "Carol"],
     "Bob":   ["Carol"],
@@ -265,12 +1699,84 @@ def count_vowels(s, count=0):
     
     if not s:
         return 0
+
+    if len(s) > _TEXT_RECURSION_MAX:
+        return count_vowels_safe(s)
     
     if s[0] in vowels:
         return 1+ count_vowels(s[1:])
     else:
          return count_vowels(s[1:])
 
+
+# count_vowels and reverse_string recurse once per character up to this
+# length, longer strings use their _safe versions
+_TEXT_RECURSION_MAX = 256
+# characters per leaf of the divide-and-conquer _safe versions
+_TEXT_LEAF = 4096
+
+
+def run_recursive(step, *args):
+    """
+    Run a recursive function on an explicit stack instead of the call stack.
+
+    step is written as a generator: `value = yield args` stands for the
+    recursive call `value = step(*args)`, and its return value is the
+    result. Depth is then limited by memory, not sys.getrecursionlimit().
+
+    Args:
+        step: Generator function with the recursive formulation
+        *args: Arguments of the outermost call
+
+    Returns:
+        The outermost call's return value
+    """
+    stack = [step(*args)]
+    value = None
+
+    while stack:
+        try:
+            call = stack[-1].send(value)
+        except StopIteration as finished:
+            stack.pop()
+            value = finished.value
+        else:
+            stack.append(step(*call))
+            value = None
+
+    return value
+
+
+def _count_vowels_step(s, start, stop):
+    # s[start:stop] is only ever addressed by index, never sliced
+    if stop - start <= _TEXT_LEAF:
+        return sum(s.count(vowel, start, stop) for vowel in "AEIOUaeiou")
+
+    middle = (start + stop) // 2
+    return (yield (s, start, middle)) + (yield (s, middle, stop))
+
+
+def count_vowels_safe(s):
+    """
+    Count vowels in a string of any length without deep recursion.
+
+    The recursion splits the index range in half (so it is about
+    log2(len(s) / 4096) levels deep) and runs on run_recursive's explicit
+    stack, in O(n) time with no string slicing.
+
+    Args:
+        s: A string
+
+    Returns:
+        int: Number of vowels (a, e, i, o, u — case-insensitive)
+
+    Raises:
+        TypeError: If s is not a string
+    """
+    if not isinstance(s, str):
+        raise TypeError
+    return run_recursive(_count_vowels_step, s, 0, len(s))
+
     
 
 
@@ -287,6 +1793,7 @@ def text_pipeline_processor(raw_texts:list[str], transformations):
         - "strip": remove leading/trailing whitespace
         - "remove_empty": remove empty strings
         - "reverse": reverse each string
+        - anything added with register_text_transformation
 
     Returns:
         list: Transformed data
@@ -294,25 +1801,340 @@ def text_pipeline_processor(raw_texts:list[str], transformations):
     Raises:
         ValueError: For unknown transformations
     """
-    
-    if not all(word in ["uppercase", "strip", "remove_empty", "reverse"] for word in transformations ):
+    return compile_text_pipeline(transformations)(raw_texts)
+
+
+class TextTransformation(namedtuple("TextTransformation", ["name", "kind", "func", "array_func", "template"])):
+    """
+    A text_pipeline_processor transformation in TEXT_TRANSFORMATIONS.
+
+    Attributes:
+        name: Name used in transformation lists
+        kind: "map" (element-wise, func(text) -> text), "filter" (func(text) -> keep it?)
+            or "batch" (func(list) -> list, sees all the texts at once)
+        func: The Python callable for that kind
+        array_func: Whole-array version used by apply_array (a boolean mask for filters), or None
+        template: Inline expression over "{}" for the built-ins, None for registered ops
+    """
+
+    __slots__ = ()
+
+    @property
+    def vectorizable(self):
+        return self.array_func is not None
+
+    @property
+    def fusable(self):
+        # map and filter ops share one comprehension, a batch op needs the whole list
+        return self.kind != "batch"
+
+
+def _reverse_strings(values):
+    # reverse fixed-width unicode strings in place of a per-string loop:
+    # flip each row of code points, then shift the padding back to the end
+    width = values.dtype.itemsize // 4
+    if not width or not len(values):
+        return values
+
+    codes = np.ascontiguousarray(values).view(np.uint32).reshape(len(values), width)[:, ::-1]
+    lengths = np.char.str_len(values)
+    columns = np.arange(width) + (width - lengths)[:, None]
+    reversed_codes = np.where(columns < width, np.take_along_axis(codes, np.minimum(columns, width - 1), axis=1), 0)
+
+    return np.ascontiguousarray(reversed_codes, dtype=np.uint32).view(values.dtype).reshape(len(values))
+
+
+def _upper_strings(values):
+    # ASCII-only arrays are upper-cased with integer arithmetic on the code points
+    codes = np.ascontiguousarray(values).view(np.uint32)
+    if not codes.size:
+        return values
+    if codes.max() >= 128:
+        # case mapping can lengthen a string ("ß" -> "SS"), which np.char.upper would
+        # truncate to the old width; str.upper and a fresh array size it correctly
+        return np.array([text.upper() for text in values.ravel().tolist()], dtype=str).reshape(values.shape)
+
+    lower = (codes >= ord("a")) & (codes <= ord("z"))
+    return (codes - lower.astype(np.uint32) * 32).view(values.dtype).reshape(values.shape)
+
+
+TEXT_TRANSFORMATIONS = {
+    "uppercase": TextTransformation("uppercase", "map", str.upper, lambda values: _upper_strings(values), "{}.upper()"),
+    "strip": TextTransformation("strip", "map", str.strip, lambda values: np.char.strip(values), "{}.strip()"),
+    "reverse": TextTransformation("reverse", "map", lambda text: text[::-1], lambda values: _reverse_strings(values), "{}[::-1]"),
+    "remove_empty": TextTransformation("remove_empty", "filter", bool, lambda values: np.char.str_len(values) > 0, "{}"),
+}
+_BUILTIN_TEXT_TRANSFORMATIONS = dict(TEXT_TRANSFORMATIONS)
+
+
+def register_text_transformation(name, func, kind="map", array_func=None, replace=False):
+    """
+    Add a transformation that text_pipeline_processor and compile_text_pipeline accept by name.
+
+    Map and filter ops are fused into the same single-pass comprehension as
+    the built-ins. A batch op splits the pipeline into fused stages around
+    it, and must return a new list instead of changing its input.
+    text_pipeline_stream worker processes only see ops that are registered
+    at import time of a module they also import.
+
+    Args:
+        name: Transformation name
+        func: map: str -> str, filter: str -> bool, batch: list -> list
+        kind: "map", "filter" or "batch"
+        array_func: Optional whole-array version for apply_array (array -> mask for filters)
+        replace: Allow replacing an existing transformation, built-ins included
+
+    Returns:
+        TextTransformation: The registered entry
+
+    Raises:
+        ValueError: For an unknown kind, a func that is not callable, or a taken name without replace
+    """
+    if kind not in ("map", "filter", "batch") or not callable(func):
         raise ValueError
-    
-    edited = raw_texts.copy()
-    for trans in transformations:
-        if trans == "uppercase":
-            edited = [word.upper() for word in edited]
-        
-        elif trans =="strip":
-            edited = [word.strip() for word in edited]
-        
-        elif trans =="remove_empty":
-            edited = [word for word in edited if word]
-        
+    if name in TEXT_TRANSFORMATIONS and not replace:
+        raise ValueError
+
+    transformation = TextTransformation(name, kind, func, array_func, None)
+    TEXT_TRANSFORMATIONS[name] = transformation
+    _compile_text_pipeline.cache_clear()
+    return transformation
+
+
+def unregister_text_transformation(name):
+    """
+    Remove a registered text transformation, restoring the built-in of that name if any.
+
+    Args:
+        name: Transformation name
+
+    Raises:
+        KeyError: If no transformation has that name
+    """
+    del TEXT_TRANSFORMATIONS[name]
+    if name in _BUILTIN_TEXT_TRANSFORMATIONS:
+        TEXT_TRANSFORMATIONS[name] = _BUILTIN_TEXT_TRANSFORMATIONS[name]
+    _compile_text_pipeline.cache_clear()
+
+
+def _fuse_text_ops(ops, functions):
+    # one comprehension for a run of map/filter ops; registered funcs are
+    # appended to functions and called by their local name _op<index>
+    expression, clauses = "x", []
+
+    for op in ops:
+        if op.template is not None:
+            template = op.template
         else:
-            edited = [word[::-1] for word in edited]
-    
-    return edited
+            template = f"_op{len(functions)}({{}})"
+            functions.append(op.func)
+
+        if op.kind == "map":
+            expression = template.format(expression)
+        else:
+            # bind the string computed so far (if any), then test it
+            if expression != "x":
+                clauses.append(f"for x in ({expression},)")
+            clauses.append(f"if {template.format('x')}")
+            expression = "x"
+
+    return f"[{expression} {' '.join(['for x in texts'] + clauses)}]"
+
+
+def _apply_text_array_op(op, values):
+    if op.kind == "filter":
+        if op.vectorizable:
+            return values[np.asarray(op.array_func(values), dtype=bool)]
+        return values[np.fromiter((bool(op.func(value)) for value in values.tolist()), dtype=bool, count=len(values))]
+
+    if op.vectorizable:
+        result = op.array_func(values)
+    elif op.kind == "batch":
+        result = op.func(values.tolist())
+    else:
+        result = [op.func(value) for value in values.tolist()]
+    return np.asarray(result, dtype=str)
+
+
+class CompiledTextPipeline:
+    """
+    A validated, fused text_pipeline_processor pipeline (see compile_text_pipeline).
+
+    Calling it applies each string's whole op chain in one comprehension, so
+    the only list built is the output. Registered batch ops split it into
+    stages, each fused the same way. apply_array runs the same chain on a
+    NumPy unicode array with vectorized upper/strip/reverse. "remove_empty"
+    only ANDs a boolean mask, and the array is compacted once at the end (or
+    before a registered op, which only sees surviving strings).
+
+    Attributes:
+        transformations: Tuple of transformation names
+        stages: Tuple of callables run in order on the texts (fused comprehensions and batch ops)
+        source: The generated comprehensions, for inspection
+    """
+
+    def __init__(self, transformations):
+        # ops are resolved once here, later registry changes do not affect this pipeline
+        self._ops = tuple(TEXT_TRANSFORMATIONS[name] for name in transformations)
+
+        parts, segment, functions = [], [], []
+        for op in self._ops:
+            if op.fusable:
+                segment.append(op)
+                continue
+            if segment:
+                parts.append(_fuse_text_ops(segment, functions))
+            parts.append(op)
+            segment = []
+        if segment or not parts:
+            parts.append(_fuse_text_ops(segment, functions))
+
+        # the generated code comes from the built-in templates and _op<index> names, never from the caller
+        namespace = {f"_op{index}": function for index, function in enumerate(functions)}
+
+        self.transformations = transformations
+        self.stages = tuple(eval(f"lambda texts: {part}", namespace) if isinstance(part, str) else part.func
+                            for part in parts)
+        self.source = " -> ".join(part if isinstance(part, str) else f"{part.name}(texts)" for part in parts)
+
+    def __call__(self, texts):
+        for stage in self.stages:
+            texts = stage(texts)
+        return texts
+
+    def apply_array(self, array):
+        """
+        Run the pipeline on a NumPy unicode array (case mapping is per character).
+        """
+        _require_numpy()
+
+        values = np.asarray(array)
+        if values.dtype.kind != "U":
+            values = values.astype(str)
+        keep = None
+
+        for op in self._ops:
+            if op.template is None:
+                if keep is not None:
+                    values, keep = values[keep], None
+                values = _apply_text_array_op(op, values)
+            elif op.kind == "filter":
+                matches = op.array_func(values)
+                keep = matches if keep is None else keep & matches
+            else:
+                values = op.array_func(values)
+
+        return values if keep is None else values[keep]
+
+    def __repr__(self):
+        return f"CompiledTextPipeline({list(self.transformations)!r})"
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_text_pipeline(transformations):
+    if not all(word in TEXT_TRANSFORMATIONS for word in transformations):
+        raise ValueError
+    return CompiledTextPipeline(transformations)
+
+
+def compile_text_pipeline(transformations):
+    """
+    Validate and fuse a text_pipeline_processor transformation list.
+
+    Compiled pipelines are cached by their transformation tuple.
+
+    Args:
+        transformations: Sequence of transformation names
+
+    Returns:
+        CompiledTextPipeline: Callable on an iterable of strings, with apply_array for NumPy arrays
+
+    Raises:
+        ValueError: For unknown transformations
+    """
+    return _compile_text_pipeline(tuple(transformations))
+
+
+def _run_text_chunk(transformations, lines):
+    # worker side of text_pipeline_stream: one chunk in, one output string back
+    results = compile_text_pipeline(transformations)([line[:-1] if line.endswith("\n") else line for line in lines])
+    return "".join(f"{text}\n" for text in results), len(results)
+
+
+def _open_text(target, mode, encoding):
+    # (text stream, cleanup): cleanup closes what we opened and only flushes
+    # or detaches from streams that belong to the caller
+    if isinstance(target, (str, os.PathLike)):
+        stream = open(target, mode, encoding=encoding, newline=None if mode == "r" else "")
+        return stream, stream.close
+    if isinstance(target, io.TextIOBase):
+        return target, target.flush if mode == "w" else (lambda: None)
+    # binary stream: wrap it without taking ownership of the underlying stream
+    wrapper = io.TextIOWrapper(target, encoding=encoding, newline=None if mode == "r" else "")
+    return wrapper, wrapper.detach
+
+
+def text_pipeline_stream(source, transformations, output, workers=1, chunk_lines=10_000, encoding="utf-8"):
+    """
+    Run text_pipeline_processor over a file or stream with bounded memory.
+
+    Lines are read lazily in chunks (the trailing newline is not part of the
+    text), and each chunk's results are written to output with a single
+    write. With workers > 1 chunks are processed in a process pool, at most
+    2 * workers chunks in flight, and written back in input order.
+
+    Args:
+        source: Path, text stream or binary stream to read lines from
+        transformations: List of transformation names
+        output: Path, text stream or binary stream to write result lines to
+        workers: Number of processes
+        chunk_lines: Lines per chunk
+        encoding: Encoding for paths and binary streams
+
+    Returns:
+        int: Number of lines written
+
+    Raises:
+        ValueError: For unknown transformations, or if workers or chunk_lines < 1
+    """
+    transformations = tuple(transformations)
+    compile_text_pipeline(transformations)
+
+    if workers < 1 or chunk_lines < 1:
+        raise ValueError
+
+    written = 0
+
+    with contextlib.ExitStack() as cleanup:
+        # registered one by one, so a failure opening output still releases source
+        reader, release = _open_text(source, "r", encoding)
+        cleanup.callback(release)
+        writer, release = _open_text(output, "w", encoding)
+        cleanup.callback(release)
+
+        chunks = _batches_from_iterator(iter(reader), chunk_lines)
+
+        if workers == 1:
+            for chunk in chunks:
+                text, count = _run_text_chunk(transformations, chunk)
+                writer.write(text)
+                written += count
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending = deque()
+                for chunk in chunks:
+                    pending.append(pool.submit(_run_text_chunk, transformations, chunk))
+                    if len(pending) >= 2 * workers:
+                        text, count = pending.popleft().result()
+                        writer.write(text)
+                        written += count
+
+                while pending:
+                    text, count = pending.popleft().result()
+                    writer.write(text)
+                    written += count
+
+    return written
 
 
 def score_ranker(scores):
@@ -351,6 +2173,36 @@ def score_ranker(scores):
         count+=1
     
     return with_rank
+
+
+def top_ranked(scores, k):
+    """
+    Top k entries of score_ranker without sorting everything.
+
+    Uses heapq.nlargest, which is O(n log k) and keeps the same order as the
+    stable sort in score_ranker, so ranks match the full ranking.
+
+    Args:
+        scores: List of tuples (competitor_name, score)
+        k: Number of entries to return
+
+    Returns:
+        list: Up to k tuples (competitor_name, score, rank), score descending
+
+    Raises:
+        ValueError: If k < 0 or a tuple doesn't have exactly 2 elements
+    """
+    if k < 0:
+        raise ValueError
+
+    top = heapq.nlargest(k, dict(scores).items(), key=itemgetter(1))
+
+    ranked = []
+    for position, (name, score) in enumerate(top, start=1):
+        rank = ranked[-1][2] if ranked and ranked[-1][1] == score else position
+        ranked.append((name, score, rank))
+
+    return ranked
         
 
 
@@ -373,22 +2225,154 @@ def fibonacci(n):
         ValueError: If n is negative or not an integer
     """
     
+    if not isinstance(n, int) or n < 0:
+        raise ValueError
+
     if n in [0,1]:
         return n
-    
-    if n<0 or not isinstance(n, int):
+
+    if n > _FIBONACCI_RECURSION_MAX:
+        return fibonacci_fast(n)
+
+    # a call always takes at least one recursive step; inside the recursion
+    # values already in the memo are returned straight away
+    global _fibonacci_depth
+    if _fibonacci_depth and n < len(_FIBONACCI_MEMO):
+        return _FIBONACCI_MEMO[n]
+
+    # F(n - 2) is always in the memo once F(n - 1) has been computed,
+    # so each n costs one recursive call instead of two
+    _fibonacci_depth += 1
+    try:
+        value = fibonacci(n-1) + _FIBONACCI_MEMO[n-2]
+    finally:
+        _fibonacci_depth -= 1
+    if n == len(_FIBONACCI_MEMO):
+        _FIBONACCI_MEMO.append(value)
+    return value
+
+
+# fibonacci recurses once per n up to here, then switches to fast doubling;
+# the memo holds F(0)..F(_FIBONACCI_RECURSION_MAX) at most
+_FIBONACCI_RECURSION_MAX = 256
+_FIBONACCI_MEMO = [0, 1]
+# fibonacci calls currently recursing; any memo answer is exact, so another
+# thread seeing a non-zero depth just skips its own recursive step
+_fibonacci_depth = 0
+
+
+@functools.lru_cache(maxsize=512)
+def _fibonacci_pair(n):
+    # (F(n), F(n + 1)) by fast doubling:
+    # F(2k) = F(k) * (2 * F(k + 1) - F(k)) and F(2k + 1) = F(k) ** 2 + F(k + 1) ** 2
+    if n == 0:
+        return 0, 1
+
+    a, b = _fibonacci_pair(n >> 1)
+    even = a * (2 * b - a)
+    odd = a * a + b * b
+    return (odd, even + odd) if n & 1 else (even, odd)
+
+
+def fibonacci_fast(n):
+    """
+    Return the nth Fibonacci number in O(log n) arithmetic steps (fast doubling).
+
+    The recursion halves n, so it is about log2(n) calls deep. The pairs are
+    kept in a bounded cache, so nearby n share most of their work.
+
+    Args:
+        n: A non-negative integer
+
+    Returns:
+        int: The nth Fibonacci number
+
+    Raises:
+        ValueError: If n is negative or not an integer
+    """
+    if not isinstance(n, int) or n < 0:
         raise ValueError
-    
-    return fibonacci(n-1) + fibonacci(n-2)
+    return _fibonacci_pair(n)[0]
+
+
+def fibonacci_many(ns):
+    """
+    Return the Fibonacci number for every n in ns, sharing work between them.
+
+    Dense batches are answered from one walk F(0), F(1), ... up to the
+    largest n. Sparse ones use fast doubling, whose cached pairs are shared
+    by nearby n.
+
+    Args:
+        ns: Iterable of non-negative integers
+
+    Returns:
+        list: F(n) for each n, in input order
+
+    Raises:
+        ValueError: If any n is negative or not an integer
+    """
+    ns = list(ns)
+    if not all(isinstance(n, int) and n >= 0 for n in ns):
+        raise ValueError
+    if not ns:
+        return []
+
+    wanted = set(ns)
+    largest = max(wanted)
+    # the walk costs about largest steps, fast doubling about log2(n) steps per distinct n
+    if largest > len(wanted) * largest.bit_length():
+        return [fibonacci_fast(n) for n in ns]
+
+    values = {}
+    current, following = 0, 1
+    for n in range(largest + 1):
+        if n in wanted:
+            values[n] = current
+        current, following = following, current + following
+
+    return [values[n] for n in ns]
 
 def reverse_string(s):
 
     if not s:
         return []
+
+    if len(s) > _TEXT_RECURSION_MAX:
+        return reverse_string_safe(s)
     
     return [s[-1]] + reverse_string(s[:-1])
 
 
+def _reverse_step(s, start, stop, reversed_items):
+    # the right half goes out first, the leaves read s backwards by index
+    if stop - start <= _TEXT_LEAF:
+        reversed_items.extend(map(s.__getitem__, range(stop - 1, start - 1, -1)))
+        return reversed_items
+
+    middle = (start + stop) // 2
+    yield (s, middle, stop, reversed_items)
+    yield (s, start, middle, reversed_items)
+    return reversed_items
+
+
+def reverse_string_safe(s):
+    """
+    Reverse a string (or other sequence) of any length into a list, like reverse_string.
+
+    The recursion splits the index range in half and runs on
+    run_recursive's explicit stack. Every item is appended to one output
+    list, so it is O(n) with no slicing or list concatenation.
+
+    Args:
+        s: A string or other indexable sequence
+
+    Returns:
+        list: The items of s in reverse order
+    """
+    return run_recursive(_reverse_step, s, 0, len(s), [])
+
+
 import math
 
 n =5
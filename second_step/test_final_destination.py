@@ -63,6 +63,87 @@ def test_inventory_report_generator_duplicate_categories():
     }
 
 
+def test_inventory_report_streaming_matches_list_version():
+    data = [{"category": f"Cat_{i % 7}", "unit_cost": i % 11, "stock_count": i % 3} for i in range(1000)]
+    expected = inventory_report_generator(data)
+    assert inventory_report_streaming(data, chunk_size=64) == expected
+    assert inventory_report_streaming(iter(data)) == expected
+    assert inventory_report_streaming([]) == {}
+
+
+def test_inventory_report_streaming_reports_offset():
+    data = [{"category": "A", "unit_cost": 1, "stock_count": 1}] * 5
+    with pytest.raises(ValueError, match="record 5"):
+        inventory_report_streaming(data + [{"category": "A", "unit_cost": -1, "stock_count": 1}], chunk_size=2)
+    with pytest.raises(KeyError, match="record 3"):
+        inventory_report_streaming(data[:3] + [{"category": "A", "unit_cost": 1}])
+
+
+def test_inventory_report_streaming_from_files(tmp_path):
+    csv_path = tmp_path / "inventory.csv"
+    csv_path.write_text("category,unit_cost,stock_count\nBooks,15,10\nToys,2.5,4\nBooks,15,2\n")
+    assert inventory_report_streaming(csv_path) == {
+        "Books": {"total_value": 180, "total_stock": 12},
+        "Toys":  {"total_value": 10.0, "total_stock": 4},
+    }
+
+    jsonl_path = tmp_path / "inventory.jsonl"
+    jsonl_path.write_text(
+        '{"category": "Books", "unit_cost": 15, "stock_count": 10}\n\n'
+        '{"category": "Books", "unit_cost": 15, "stock_count": 2}\n'
+    )
+    assert inventory_report_streaming(str(jsonl_path), chunk_size=1) == {
+        "Books": {"total_value": 180, "total_stock": 12},
+    }
+
+    with pytest.raises(ValueError):
+        inventory_report_streaming(tmp_path / "inventory.xml")
+
+
+def test_inventory_report_streaming_malformed_numbers(tmp_path):
+    csv_path = tmp_path / "inventory.csv"
+    csv_path.write_text("category,unit_cost,stock_count\nBooks,15,10\nToys,,4\n")
+    with pytest.raises(ValueError, match="record 1"):
+        inventory_report_streaming(csv_path)
+
+    jsonl_path = tmp_path / "inventory.jsonl"
+    jsonl_path.write_text('{"category": "Books", "unit_cost": 15, "stock_count": 10}\n'
+                          '{"category": "Books", "unit_cost": "cheap", "stock_count": 2}\n')
+    with pytest.raises(TypeError, match="record 1"):
+        inventory_report_streaming(jsonl_path)
+
+    jsonl_path.write_text('{"category": "Books", "unit_cost": 15, "stock_count": 10}\n\n'
+                          '{"category": "Books", "unit_cost": 15, "stock_count": 2}\n'
+                          '{"category": "Books", "unit_cost": 1\n')
+    with pytest.raises(ValueError, match="record 2: invalid JSON"):
+        inventory_report_streaming(jsonl_path, chunk_size=1)
+
+
+def test_inventory_report_parallel_matches_serial():
+    data = [{"category": f"Cat_{i % 23}", "unit_cost": i % 97, "stock_count": i % 5} for i in range(5000)]
+    expected = inventory_report_generator(data)
+    result = inventory_report_parallel(data, workers=2, shard_size=600)
+    assert result == expected
+    assert list(result) == list(expected)
+    assert inventory_report_parallel([], workers=2) == {}
+
+
+def test_inventory_report_parallel_errors():
+    with pytest.raises(ValueError):
+        inventory_report_parallel([{"category": "A", "unit_cost": 1, "stock_count": -1}] * 10, workers=2, shard_size=3)
+    with pytest.raises(ValueError):
+        inventory_report_parallel([], shard_size=0)
+
+
+def test_inventory_report_parallel_does_not_pickle_records():
+    import multiprocessing
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("records are only shared with forked workers")
+    # the lambdas cannot be pickled, so this only works if the workers inherit the list
+    data = [{"category": f"C{i % 3}", "unit_cost": i, "stock_count": 2, "note": lambda: None} for i in range(300)]
+    assert inventory_report_parallel(data, workers=2, shard_size=50) == inventory_report_generator(data)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Question 2 – Rainfall Analyzer
 # ──────────────────────────────────────────────────────────────────────────────
@@ -108,6 +189,35 @@ def test_rainfall_analyzer_negative_readings():
     assert "All readings within threshold" in out
 
 
+def test_rainfall_analyzer_accepts_generator():
+    out = _capture(rainfall_analyzer, (r for r in [5, 25, 8, 30]), 20)
+    assert "Warning: 2 readings above 20" in out
+    assert "Average: 17.00" in out
+
+
+def test_rainfall_stats_single_pass():
+    stats = rainfall_stats(iter([10, 25.5, 8]), 20)
+    assert (stats.count, stats.breaches, stats.minimum, stats.maximum) == (3, 1, 8, 25.5)
+    assert stats.average == pytest.approx(14.5)
+    assert format_rainfall_report(stats) == "Warning: 1 readings above 20\nAverage: 14.50"
+    assert format_rainfall_report(rainfall_stats([], 20)) == "No rainfall data"
+
+
+def test_rainfall_analyzer_decimal_readings():
+    from decimal import Decimal
+    out = _capture(rainfall_analyzer, [Decimal("20.5"), Decimal("19.5")], 20)
+    assert "Warning: 1 readings above 20" in out
+    assert "Average: 20.00" in out
+    assert rainfall_stats([Decimal("0.1")] * 3, 1).total == Decimal("0.3")
+
+
+def test_rainfall_window_monitors():
+    sliding = list(sliding_window_monitor([5, 25, 8, 30], 2, 20))
+    assert [(w.start, w.breaches, w.average) for w in sliding] == [(0, 1, 15.0), (1, 1, 16.5), (2, 1, 19.0)]
+    tumbling = list(tumbling_window_monitor([5, 25, 8], 2, 20))
+    assert [(w.count, w.breaches) for w in tumbling] == [(2, 1), (1, 0)]
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Question 3 – Username Validator with Retry
 # ──────────────────────────────────────────────────────────────────────────────
@@ -144,6 +254,56 @@ def test_username_validator_must_start_with_letter(monkeypatch):
     assert "Username accepted!" in out
 
 
+def test_username_reason_codes():
+    assert username_reason("valid_user1") == USERNAME_OK
+    assert username_reason("abc") == USERNAME_BAD_LENGTH
+    assert username_reason("a" * 16) == USERNAME_BAD_LENGTH
+    assert username_reason("bad-name") == USERNAME_BAD_CHARACTERS
+    assert username_reason("1user") == USERNAME_BAD_FIRST_CHARACTER
+    assert username_reason("_user") == USERNAME_BAD_FIRST_CHARACTER
+    assert username_reason("²user") == USERNAME_BAD_FIRST_CHARACTER
+    assert username_reason("Ünïcode_ok") == USERNAME_OK
+
+
+def test_validate_usernames_bulk():
+    names = ["valid_user1", "abc", "bad-name", "1user", "Another_1"]
+    result = validate_usernames(iter(names))
+    assert list(result.valid) == [True, False, False, False, True]
+    assert list(result.reasons) == [0, 1, 2, 3, 0]
+
+
+def test_validate_usernames_parallel_matches_serial():
+    names = [f"user_{i}" if i % 3 else f"{i}user" for i in range(3000)]
+    serial = validate_usernames(names)
+    parallel = validate_usernames(names, workers=2, chunk_size=500)
+    assert list(parallel.reasons) == list(serial.reasons)
+    assert list(parallel.valid) == list(serial.valid)
+    assert len(validate_usernames([]).reasons) == 0
+    with pytest.raises(ValueError):
+        validate_usernames(names, chunk_size=0)
+
+
+def test_username_validator_async():
+    import asyncio
+
+    answers = iter(["1user", "valid_user1"])
+    messages = []
+
+    async def read_input(prompt):
+        messages.append(prompt)
+        return next(answers)
+
+    assert asyncio.run(username_validator_async(3, read_input, messages.append)) is True
+    assert messages == ["Enter username:", "Invalid username. Try again.", "Enter username:", "Username accepted!"]
+
+    async def never(prompt):
+        await asyncio.sleep(1)
+
+    messages.clear()
+    assert asyncio.run(username_validator_async(1, never, messages.append, timeout=0.01)) is False
+    assert messages == ["Attempt timed out. Try again.", "Maximum attempts reached. Access denied."]
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Question 4 – Employee Performance Processor
 # ──────────────────────────────────────────────────────────────────────────────
@@ -199,6 +359,21 @@ def test_employee_performance_processor_mixed():
     assert len(result["needs_improvement"]) == 1
 
 
+def test_employee_performance_processor_batched_matches():
+    pytest.importorskip("numpy")
+    employees = [{"name": f"E{i}", "scores": [(i * 11 + j * 17) % 101 for j in range(1 + i % 9)]} for i in range(500)]
+    assert employee_performance_processor_batched(employees) == employee_performance_processor(employees)
+    with pytest.raises(ValueError):
+        employee_performance_processor_batched([{"name": "Test", "scores": []}])
+
+
+def test_employee_performance_processor_batched_exact_at_cutoff():
+    pytest.importorskip("numpy")
+    employees = [{"name": "Whole", "scores": [79, 81]}, {"name": "Edge", "scores": [62.2, 75.7, 96.0, 86.1]}]
+    assert employee_performance_processor_batched(employees) == employee_performance_processor(employees)
+    assert [e["name"] for e in employee_performance_processor_batched(employees)["high_performers"]] == ["Whole", "Edge"]
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Question 5 – Order Batcher
 # ──────────────────────────────────────────────────────────────────────────────
@@ -239,6 +414,129 @@ def test_order_batcher_preserves_order():
     assert result[-1][-1] == "fourth"
 
 
+def test_order_batcher_iter_batches():
+    orders = [f"O{i}" for i in range(25)]
+    batches = iter_batches(iter(orders), 10)
+    assert next(batches) == orders[:10]
+    assert [list(batch) for batch in iter_batches(orders, 10)] == order_batcher(orders, 10)
+    with pytest.raises(ValueError):
+        iter_batches(orders, 0)
+
+
+def _run_micro_batcher(orders, **options):
+    import asyncio
+
+    flushed = []
+
+    async def flush(batch):
+        await asyncio.sleep(0)
+        flushed.append(batch)
+
+    async def main():
+        async with OrderMicroBatcher(flush, **options) as batcher:
+            for order in orders:
+                await batcher.put(order)
+        return batcher
+
+    return flushed, asyncio.run(main())
+
+
+def test_order_micro_batcher_flushes_by_count():
+    orders = [f"O{i}" for i in range(10)]
+    flushed, batcher = _run_micro_batcher(orders, max_items=4, max_delay=10)
+    assert flushed == order_batcher(orders, 4)
+    assert batcher.metrics.reasons == {"items": 2, "bytes": 0, "time": 0, "close": 1}
+    assert batcher.metrics.fill_ratio == pytest.approx(10 / 12)
+
+
+def test_order_micro_batcher_flushes_by_bytes():
+    flushed, batcher = _run_micro_batcher(["aaaa", "bb", "cccc", "d"], max_items=10, max_bytes=5, max_delay=10)
+    assert flushed == [["aaaa", "bb"], ["cccc", "d"]]
+    assert batcher.metrics.reasons["bytes"] == 2
+
+
+def test_order_micro_batcher_flushes_by_time():
+    import asyncio
+
+    flushed = []
+
+    async def main():
+        async with OrderMicroBatcher(flushed.append, max_items=100, max_delay=0.01, workers=2) as batcher:
+            await batcher.put("O1")
+            await asyncio.sleep(0.05)
+            await batcher.put("O2")
+        return batcher
+
+    batcher = asyncio.run(main())
+    assert flushed == [["O1"], ["O2"]]
+    assert batcher.metrics.reasons["time"] == 1
+    assert batcher.metrics.max_latency >= 0.01
+
+
+def test_order_micro_batcher_reports_flush_errors():
+    import asyncio
+
+    def flush(batch):
+        raise RuntimeError("bus down")
+
+    async def main():
+        async with OrderMicroBatcher(flush, max_items=1) as batcher:
+            await batcher.put("O1")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
+    with pytest.raises(ValueError):
+        OrderMicroBatcher(flush, max_items=0)
+
+
+def test_order_micro_batcher_collector_failure():
+    import asyncio
+
+    def size_of(order):
+        if order == "bad":
+            raise TypeError("unsized order")
+        return 1
+
+    async def main():
+        batcher = OrderMicroBatcher(lambda batch: None, max_items=2, max_bytes=10, max_pending=2, workers=2, size_of=size_of)
+        await batcher.start()
+        workers = batcher._tasks[1:]
+        await batcher.put("bad")
+        with pytest.raises(RuntimeError):
+            for _ in range(10):
+                await batcher.put("O")
+        with pytest.raises(TypeError):
+            await batcher.close()
+        assert all(task.done() for task in workers)
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+
+
+def test_order_micro_batcher_cancelled_put():
+    import asyncio
+
+    flushed = []
+
+    async def main():
+        release = asyncio.Event()
+
+        async def flush(batch):
+            await release.wait()
+            flushed.append(batch)
+
+        async with OrderMicroBatcher(flush, max_items=1, max_pending=1) as batcher:
+            for order in ("O1", "O2", "O3", "O4"):
+                await batcher.put(order)
+                await asyncio.sleep(0.01)
+            # the flush is stuck and the intake is full, so this put times out
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(batcher.put("CANCELLED"), 0.05)
+            release.set()
+
+    asyncio.run(asyncio.wait_for(main(), 5))
+    assert flushed == [["O1"], ["O2"], ["O3"], ["O4"]]
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Question 6 – Social Network Analyzer
 # ──────────────────────────────────────────────────────────────────────────────
@@ -281,6 +579,114 @@ def test_social_network_analyzer_no_isolates():
     assert result["total_follows"] == 2
 
 
+@pytest.mark.parametrize("network", [
+    {"Alice": ["Bob", "Carol"], "Bob": ["Carol"], "Carol": []},
+    {"X": [], "Y": [], "Z": []},
+    {"A": ["B"], "B": ["A"]},
+    {"A": ["B", "C", "C"], "B": ["C"], "D": ["B"]},
+    {"A": ["X", "Y"], "B": ["Y", "X"], "X": [], "Y": []},
+    {"A": ["B", "C"], "B": ["C"], "C": ["B"]},
+    {},
+])
+def test_follower_index_matches_analyzer(network):
+    assert FollowerIndex(network).report() == social_network_analyzer(network)
+
+
+def test_follower_index_updates():
+    index = FollowerIndex({"Alice": ["Bob"], "Bob": [], "Carol": []})
+    assert index.most_followed == "Bob"
+
+    index.follow("Alice", "Carol")
+    index.follow("Bob", "Carol")
+    assert index.most_followed == "Carol"
+    assert index.followers_of("Carol") == 2
+    assert sorted(index.no_followers) == ["Alice"]
+
+    index.unfollow("Bob", "Carol")
+    index.unfollow("Alice", "Carol")
+    index.unfollow("Alice", "Bob")
+    assert index.total_follows == 0
+    assert index.most_followed is None
+    assert sorted(index.no_followers) == ["Alice", "Bob", "Carol"]
+    with pytest.raises(KeyError):
+        index.unfollow("Alice", "Bob")
+
+
+def test_top_followed():
+    network = {"A": ["B", "C", "D"], "B": ["C", "D"], "C": ["D"], "D": []}
+    assert top_followed(network, 2) == [("D", 3), ("C", 2)]
+    assert top_followed(FollowerIndex(network), 2) == [("D", 3), ("C", 2)]
+    assert top_followed(FollowerIndex(network), 10) == [("D", 3), ("C", 2), ("B", 1)]
+    assert top_followed({"A": []}, 3) == []
+    with pytest.raises(ValueError):
+        top_followed(network, -1)
+
+
+def test_top_followed_ties_match():
+    for network in ({"A": ["X", "Y"], "B": ["Y", "X"], "X": [], "Y": []}, {"A": ["B", "C"], "B": ["C"], "C": ["B"]}):
+        for k in (1, 2, 3):
+            assert top_followed(FollowerIndex(network), k) == top_followed(network, k)
+    assert top_followed({"A": ["X", "Y"], "B": ["Y", "X"]}, 2) == [("X", 2), ("Y", 2)]
+
+
+def test_follower_index_large_tied_bucket():
+    users = [f"U{i}" for i in range(20_000)]
+    index = FollowerIndex({"Fan": users})
+    # every query after an unfollow has to find the next leader among ~20k tied users
+    for position, user in enumerate(users[:-3]):
+        assert index.most_followed == user
+        if position % 1000 == 0:
+            assert index.top_followed(3) == [(name, 1) for name in users[position:position + 3]]
+        index.unfollow("Fan", user)
+    index.follow("Fan", users[0])
+    # ranks survive unfollows, so the first user followed leads the tie again
+    assert index.top_followed(5) == [(name, 1) for name in users[:1] + users[-3:]]
+    assert index.report()["total_follows"] == 4
+
+
+@pytest.mark.parametrize("network", [
+    {"Alice": ["Bob", "Carol"], "Bob": ["Carol"], "Carol": []},
+    {"X": [], "Y": [], "Z": []},
+    {"A": ["B", "C", "C"], "B": ["C"], "C": ["B"], "D": ["B"]},
+    {"A": ["C"], "B": ["A"], "C": []},
+    {"A": ["X", "Y"], "B": ["Y", "X"], "X": [], "Y": []},
+    {"D": [], "A": [], "B": ["Z", "Y", "X"], "C": ["X", "Y", "Z"]},
+])
+def test_social_network_analyzer_sharded_matches(network, tmp_path):
+    pytest.importorskip("numpy")
+    paths, names, _ = write_edge_shards(network, tmp_path, shards=3)
+    expected = social_network_analyzer(network)
+    for workers in (1, 2):
+        result = social_network_analyzer_sharded(paths, len(names), names, workers=workers)
+        assert result["total_follows"] == expected["total_follows"]
+        assert result["most_followed"] == expected["most_followed"]
+        assert sorted(result["no_followers"]) == sorted(expected["no_followers"])
+
+
+def test_sharded_degrees(tmp_path):
+    np = pytest.importorskip("numpy")
+    np.save(tmp_path / "a.npy", np.array([[0, 1], [0, 2], [1, 2]], dtype=np.int32))
+    np.save(tmp_path / "b.npy", np.array([[2, 0]], dtype=np.int32))
+    out_degrees, in_degrees = sharded_degrees([tmp_path / "a.npy", tmp_path / "b.npy"], 4, workers=1, chunk_edges=2)
+    assert out_degrees.tolist() == [2, 1, 1, 0]
+    assert in_degrees.tolist() == [1, 1, 2, 0]
+    assert social_network_analyzer_sharded([tmp_path / "a.npy"], 4)["no_followers"] == [0, 3]
+
+    np.save(tmp_path / "bad.npy", np.array([[0, 9]], dtype=np.int32))
+    with pytest.raises(ValueError):
+        sharded_degrees([tmp_path / "bad.npy"], 4, workers=1)
+
+
+def test_social_network_components_and_influence():
+    pytest.importorskip("numpy")
+    network = {"Alice": ["Bob", "Carol"], "Bob": ["Carol"], "Carol": [], "Dave": ["Erin"], "Erin": []}
+    assert connected_components(network) == [["Alice", "Bob", "Carol"], ["Dave", "Erin"]]
+    assert reachable(network, "Bob") == ["Bob", "Carol"]
+    influence = pagerank(network)
+    assert sum(influence.values()) == pytest.approx(1.0)
+    assert max(influence, key=influence.get) == "Carol"
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Question 7 – Count Vowels (Recursive)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -321,6 +727,16 @@ def test_count_vowels_recursive_params():
             assert isinstance(args[0], str)
 
 
+def test_count_vowels_megabyte_string():
+    text = "Recursion without limits " * 50_000
+    expected = sum(char in "aeiouAEIOU" for char in text)
+    assert count_vowels(text) == expected
+    assert count_vowels_safe(text) == expected
+    assert [count_vowels_safe(s) for s in ("", "b", "a", "Python programming")] == [0, 0, 1, 4]
+    with pytest.raises(TypeError):
+        count_vowels_safe(["a"])
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Question 8 – Text Pipeline Processor
 # ──────────────────────────────────────────────────────────────────────────────
@@ -355,6 +771,118 @@ def test_text_pipeline_processor_reverse_then_uppercase():
     assert result == ["CBA"]
 
 
+def test_compile_text_pipeline_fuses_steps():
+    pipeline = compile_text_pipeline(["strip", "remove_empty", "uppercase", "reverse"])
+    assert pipeline.source == "[x.upper()[::-1] for x in texts for x in (x.strip(),) if x]"
+    assert pipeline is compile_text_pipeline(("strip", "remove_empty", "uppercase", "reverse"))
+    texts = ["  hello ", "", "   ", "World", " a b "]
+    assert pipeline(iter(texts)) == text_pipeline_processor(texts, ["strip", "remove_empty", "uppercase", "reverse"])
+    with pytest.raises(ValueError):
+        compile_text_pipeline(["lowercase"])
+
+
+def test_compile_text_pipeline_apply_array():
+    np = pytest.importorskip("numpy")
+    for texts in (["  hello ", "", "   ", "World", " a b ", "xyz", "résumé "], ["ascii only", "  Zz{}`@ "]):
+        for steps in (["reverse"], ["strip", "reverse", "remove_empty"], ["uppercase", "remove_empty", "strip"],
+                      ["remove_empty", "reverse", "strip", "reverse"], []):
+            assert compile_text_pipeline(steps).apply_array(np.array(texts)).tolist() == text_pipeline_processor(texts, steps)
+
+
+def test_compile_text_pipeline_apply_array_case_expansion():
+    np = pytest.importorskip("numpy")
+    import itertools
+    import random
+
+    rng = random.Random(0)
+    alphabet = "aß ﬁŉΐz"
+    texts = ["".join(rng.choices(alphabet, k=rng.randint(0, 6))) for _ in range(50)] + ["straße"]
+    for length in range(1, 4):
+        for steps in itertools.product(["uppercase", "strip", "reverse", "remove_empty"], repeat=length):
+            assert compile_text_pipeline(steps).apply_array(np.array(texts)).tolist() == text_pipeline_processor(texts, list(steps)), steps
+
+
+def test_register_text_transformation_custom_ops():
+    register_text_transformation("lowercase", str.lower)
+    register_text_transformation("no_digits", lambda text: not any(char.isdigit() for char in text), kind="filter")
+    register_text_transformation("sort", sorted, kind="batch")
+    try:
+        steps = ["strip", "lowercase", "remove_empty", "no_digits", "sort", "reverse"]
+        texts = [" Banana ", "", "Apple 2", "  cherry", "apple"]
+        assert text_pipeline_processor(texts, steps) == ["elppa", "ananab", "yrrehc"]
+        pipeline = compile_text_pipeline(steps)
+        assert len(pipeline.stages) == 3
+        assert pipeline.source == "[x for x in texts for x in (_op0(x.strip()),) if x if _op1(x)] -> sort(texts) -> [x[::-1] for x in texts]"
+        assert not TEXT_TRANSFORMATIONS["sort"].fusable
+        assert TEXT_TRANSFORMATIONS["reverse"].vectorizable
+        with pytest.raises(ValueError):
+            register_text_transformation("strip", str.lstrip)
+        with pytest.raises(ValueError):
+            register_text_transformation("title", "title")
+    finally:
+        for name in ("lowercase", "no_digits", "sort"):
+            unregister_text_transformation(name)
+    with pytest.raises(ValueError):
+        text_pipeline_processor(["a"], ["lowercase"])
+
+
+def test_register_text_transformation_replace_and_apply_array():
+    np = pytest.importorskip("numpy")
+    register_text_transformation("strip", lambda text: text.strip(" *"), array_func=lambda values: np.char.strip(values, " *"),
+                                 replace=True)
+    register_text_transformation("short", lambda text: len(text) < 5, kind="filter")
+    try:
+        texts = ["* ab *", "  ", "**abcdef", "x"]
+        for steps in (["strip", "remove_empty"], ["uppercase", "remove_empty", "short", "strip"]):
+            assert compile_text_pipeline(steps).apply_array(np.array(texts)).tolist() == text_pipeline_processor(texts, steps)
+        assert text_pipeline_processor(texts, ["strip", "remove_empty"]) == ["ab", "abcdef", "x"]
+    finally:
+        unregister_text_transformation("strip")
+        unregister_text_transformation("short")
+    assert text_pipeline_processor(["* a *"], ["strip"]) == ["* a *"]
+
+
+def test_text_pipeline_stream_files(tmp_path):
+    lines = [f"  line {i}  " if i % 3 else "   " for i in range(2500)]
+    source = tmp_path / "in.log"
+    source.write_text("\n".join(lines) + "\n")
+    steps = ["strip", "remove_empty", "uppercase"]
+    expected = text_pipeline_processor(lines, steps)
+
+    for workers in (1, 2):
+        target = tmp_path / f"out_{workers}.log"
+        assert text_pipeline_stream(source, steps, target, workers=workers, chunk_lines=100) == len(expected)
+        assert target.read_text().splitlines() == expected
+
+
+def test_text_pipeline_stream_binary_streams():
+    from io import BytesIO
+
+    source = BytesIO("  héllo \r\n\nworld".encode("utf-8"))
+    output = BytesIO()
+    assert text_pipeline_stream(source, ["strip", "reverse"], output) == 3
+    assert output.getvalue().decode("utf-8") == "olléh\n\ndlrow\n"
+    assert not output.closed
+
+    text_output = StringIO()
+    text_pipeline_stream(StringIO("a\nb\n"), ["uppercase"], text_output)
+    assert text_output.getvalue() == "A\nB\n"
+
+    with pytest.raises(ValueError):
+        text_pipeline_stream(StringIO("a"), ["shout"], StringIO())
+
+
+def test_text_pipeline_stream_releases_source_on_output_error(tmp_path):
+    from io import BytesIO
+
+    # a leaked wrapper would close the caller's binary stream when collected
+    source = BytesIO(b"a\nb\n")
+    with pytest.raises(FileNotFoundError):
+        text_pipeline_stream(source, ["uppercase"], tmp_path / "missing" / "out.log")
+    assert not source.closed
+    assert source.read() == b"a\nb\n"
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Question 9 – Score Ranker
 # ──────────────────────────────────────────────────────────────────────────────
@@ -397,6 +925,13 @@ def test_score_ranker_large_dataset():
     assert result[-1][2] == 500
 
 
+def test_top_ranked_matches_score_ranker():
+    scores = [(f"C{i}", (i * 13) % 40) for i in range(400)]
+    full = score_ranker(scores)
+    for k in (0, 1, 7, 400, 401):
+        assert top_ranked(scores, k) == full[:k]
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Question 10 – Fibonacci (Recursive)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -438,4 +973,60 @@ def test_fibonacci_recursive_params():
         mocked(5)
         for call in mocked.call_args_list:
             args, _ = call
-            assert isinstance(args[0], int)
\ No newline at end of file
+            assert isinstance(args[0], int)
+
+def test_fibonacci_float_base_case():
+    for n in (1.0, 0.0, "1"):
+        with pytest.raises(ValueError):
+            fibonacci(n)
+
+
+def test_fibonacci_fast_matches_recursive():
+    expected = [0, 1]
+    while len(expected) < 600:
+        expected.append(expected[-1] + expected[-2])
+    assert [fibonacci(n) for n in range(600)] == expected
+    assert [fibonacci_fast(n) for n in range(600)] == expected
+    assert fibonacci_fast(10**5) == fibonacci_fast(10**5 - 1) + fibonacci_fast(10**5 - 2)
+    with pytest.raises(ValueError):
+        fibonacci_fast(-3)
+
+
+def test_fibonacci_reuses_memo():
+    import inspect
+
+    fibonacci(200)
+    with patch("final_destination.fibonacci", wraps=fibonacci) as mocked:
+        assert mocked(200) == fibonacci_fast(200)
+        assert mocked(150) == fibonacci_fast(150)
+        # a warm memo answers the recursion instead of walking down to F(1) again
+        assert mocked.call_count < 10
+    assert list(inspect.signature(fibonacci).parameters) == ["n"]
+
+
+def test_fibonacci_many():
+    dense = list(range(50)) + [10, 3]
+    sparse = [10**4, 7, 10**4 + 1, 0]
+    assert fibonacci_many(dense) == [fibonacci_fast(n) for n in dense]
+    assert fibonacci_many(iter(sparse)) == [fibonacci_fast(n) for n in sparse]
+    assert fibonacci_many([]) == []
+    with pytest.raises(ValueError):
+        fibonacci_many([3, 2.0])
+
+
+
+def test_reverse_string_safe():
+    text = "abcdé" * 250_000
+    assert reverse_string(text) == list(reversed(text))
+    assert reverse_string_safe(text) == list(reversed(text))
+    assert reverse_string("abc") == ["c", "b", "a"]
+    assert reverse_string_safe("") == []
+    assert reverse_string_safe(list(range(10_000))) == list(range(9_999, -1, -1))
+
+
+def test_run_recursive_deep_recursion():
+    def depth(n):
+        if n == 0:
+            return 0
+        return (yield (n - 1,)) + 1
+    assert run_recursive(depth, 100_000) == 100_000